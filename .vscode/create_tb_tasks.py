@@ -1,69 +1,107 @@
 import os
 import json
 
-def createTasks():
-    testbench_root = "rtl_designs/old_testbench"
-    tasks = []
-
-    # Traverse subdirectories of testbench/
-    for subdir in os.listdir(testbench_root):
-        subdir_path = os.path.join(testbench_root, subdir)
-        if os.path.isdir(subdir_path):
-            for file in os.listdir(subdir_path):
-                if file.endswith("_tb.vhdl"):
-                    tb_name = file.replace("_tb.vhdl", "")
-                    tb_dir = subdir
-                    print(file)
-
-                    # analyze & elaborate testbench
-
-                    analyze_task = {
-                        "label": f"ANA {tb_dir}_{tb_name}",
-                        "type": "shell",
-                        "command": f"ghdl -a --std=08 --work=work --workdir={testbench_root}/{tb_dir}/workdir -Ptvl_lib/workdir {testbench_root}/{tb_dir}/{tb_name}_tb.vhdl",
-                        "problemMatcher": [],
-                        "hide": True
-                    }
-                    elaborate_task = {
-                        "label": f"ELA {tb_dir}_{tb_name}",
-                        "type": "shell",
-                        "command": f"ghdl -e --std=08 --work=work --workdir={testbench_root}/{tb_dir}/workdir -Ptvl_lib/workdir {tb_name}_tb",
-                        "problemMatcher": [],
-                        "hide": True
-                    }
-                    sequence_task1 = {
-                        "label": f"Compile {tb_dir}_{tb_name}",
-                        "dependsOn": [f"ANA {tb_dir}_{tb_name}", f"ELA {tb_dir}_{tb_name}"],
-                        "dependsOrder": "sequence",
-                        "problemMatcher": []
-                    }
-
-                    # run & simulate testbench
-
-                    run_task = {
-                        "label": f"run {tb_dir}_{tb_name}",
-                        "type": "shell",
-                        "command": f"ghdl -r {tb_name}_tb --wave={testbench_root}/{tb_dir}/workdir/{tb_name}_wave.ghw",
-                        "problemMatcher": [],
-                        "hide": True
-                    }
-                    gtk_task = {
-                        "label": f"gtk {tb_dir}_{tb_name}",
-                        "type": "shell",
-                        "command": f"gtkwave {testbench_root}/{tb_dir}/workdir/{tb_name}_wave.ghw",
-                        "problemMatcher": [],
-                        "hide": True
-                    }
-                    sequence_task2 = {
-                        "label": f"Sim {tb_dir}_{tb_name}",
-                        "dependsOn": [f"run {tb_dir}_{tb_name}", f"gtk {tb_dir}_{tb_name}"],
-                        "dependsOrder": "sequence",
-                        "problemMatcher": []
-                    }
-
-                    tasks.extend([analyze_task, elaborate_task, sequence_task1, run_task, gtk_task, sequence_task2])
-
-    return tasks
+# Directories searched (recursively) for *_tb.vhdl files
+TESTBENCH_ROOTS = ["old_testbench"]
+
+# Serialized task blocks of every testbench, keyed on its path and
+# reused for as long as the file's mtime is unchanged.
+CACHE_PATH = ".vscode/.tb_tasks_cache.json"
+
+def findTestbenches(roots: list) -> dict:
+    """
+    One scan of all roots, returning {path: mtime} of every testbench.
+    """
+    found = {}
+    stack = list(roots)
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    stack.append(entry.path)
+                elif entry.name.endswith("_tb.vhdl"):
+                    found[entry.path.replace(os.sep, "/")] = entry.stat().st_mtime_ns
+    return found
+
+def testbenchTasks(path: str) -> list:
+    testbench_dir, file = path.rsplit("/", 1)
+    tb_name = file.replace("_tb.vhdl", "")
+    tb_dir = os.path.basename(testbench_dir)
+    print(file)
+
+    # analyze & elaborate testbench
+
+    analyze_task = {
+        "label": f"ANA {tb_dir}_{tb_name}",
+        "type": "shell",
+        "command": f"ghdl -a --std=08 --work=work --workdir={testbench_dir}/workdir -Ptvl_lib/workdir {path}",
+        "problemMatcher": [],
+        "hide": True
+    }
+    elaborate_task = {
+        "label": f"ELA {tb_dir}_{tb_name}",
+        "type": "shell",
+        "command": f"ghdl -e --std=08 --work=work --workdir={testbench_dir}/workdir -Ptvl_lib/workdir {tb_name}_tb",
+        "problemMatcher": [],
+        "hide": True
+    }
+    sequence_task1 = {
+        "label": f"Compile {tb_dir}_{tb_name}",
+        "dependsOn": [f"ANA {tb_dir}_{tb_name}", f"ELA {tb_dir}_{tb_name}"],
+        "dependsOrder": "sequence",
+        "problemMatcher": []
+    }
+
+    # run & simulate testbench
+
+    run_task = {
+        "label": f"run {tb_dir}_{tb_name}",
+        "type": "shell",
+        "command": f"ghdl -r {tb_name}_tb --wave={testbench_dir}/workdir/{tb_name}_wave.ghw",
+        "problemMatcher": [],
+        "hide": True
+    }
+    gtk_task = {
+        "label": f"gtk {tb_dir}_{tb_name}",
+        "type": "shell",
+        "command": f"gtkwave {testbench_dir}/workdir/{tb_name}_wave.ghw",
+        "problemMatcher": [],
+        "hide": True
+    }
+    sequence_task2 = {
+        "label": f"Sim {tb_dir}_{tb_name}",
+        "dependsOn": [f"run {tb_dir}_{tb_name}", f"gtk {tb_dir}_{tb_name}"],
+        "dependsOrder": "sequence",
+        "problemMatcher": []
+    }
+
+    return [analyze_task, elaborate_task, sequence_task1, run_task, gtk_task, sequence_task2]
+
+def createTasks() -> list:
+    """
+    Returns the serialized task blocks of all testbenches, in path
+    order. Only testbenches that are new or modified since the last
+    run are generated again.
+    """
+    try:
+        with open(CACHE_PATH, "r") as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        cache = {}
+
+    blocks = {}
+    for path, mtime in sorted(findTestbenches(TESTBENCH_ROOTS).items()):
+        entry = cache.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            entry = {"mtime": mtime,
+                     "tasks": [json.dumps(task, indent=4) for task in testbenchTasks(path)]}
+        blocks[path] = entry
+
+    # Deleted testbenches drop out of the cache here
+    with open(CACHE_PATH, "w") as file:
+        json.dump(blocks, file)
+
+    return [task for entry in blocks.values() for task in entry["tasks"]]
 
 def truncSave(tasks: list):
     file_path = ".vscode/tasks.json"
@@ -71,34 +109,22 @@ def truncSave(tasks: list):
 
     # Read the original file
     with open(file_path, "r") as file:
-        lines = file.readlines()
-
-    # Find the marker block
-    marker_index = None
-    for i in range(0, len(lines)):
-        if trunc_string in lines[i]:
-            marker_index = i
-            break
-
-    # Truncate everything after the marker block
-    if marker_index is not None:
-        truncated_lines = lines[:marker_index + 1]
-    else:
-        raise ValueError("Marker block not found in tasks.json")
+        content = file.read()
 
+    # Find the marker block and keep everything up to it
+    marker_index = content.find(trunc_string)
+    if marker_index == -1:
+        raise ValueError("Marker block not found in tasks.json")
+    line_end = content.find("\n", marker_index)
+    head = content if line_end == -1 else content[:line_end + 1]
 
-    # Serialize each task individually and append without trailing comma
-    for i, task in enumerate(tasks):
-        serialized = json.dumps(task, indent=4)
-        if i < len(tasks) - 1:
-            truncated_lines.append(serialized + ",\n")
-        else:
-            truncated_lines.append(serialized + "\n]\n}")
+    # Tasks are already serialized, join them without a trailing comma
+    new_content = head + ",\n".join(tasks) + "\n]\n}"
 
-    # Write back to the file
-    with open(file_path, "w") as file:
-        file.writelines(truncated_lines)
+    # Write back to the file only when something changed
+    if new_content != content:
+        with open(file_path, "w") as file:
+            file.write(new_content)
 
 truncSave(createTasks())
 print("----DONE----")
-
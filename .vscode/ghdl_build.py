@@ -0,0 +1,352 @@
+"""
+Parallel, incremental build for the raw GHDL flow (without VUnit).
+
+Scans the TVL library, the RTL designs and the old testbenches for the
+design units every file defines and uses (library/use clauses, entity
+and component instantiations, architectures and package bodies) and
+builds a dependency graph of the files. `ghdl -a` then runs on every
+file whose dependencies are analyzed, on as many cores as given, and
+`ghdl -e` only on top-level entities whose files or dependencies
+changed since the last build.
+
+GHDL keeps one index file (.cf) per library and work directory, which
+parallel analyses into the same library would corrupt. Every analysis
+therefore runs in a scratch work directory holding a copy of its
+library's index, and only the entry of the analyzed file is merged
+back into the library afterwards, so files of one library analyze in
+parallel as well. Elaborations run in parallel too, except for top
+levels of the same name, whose executables would collide in the
+repository root.
+
+Run from the repository root:
+    python .vscode/ghdl_build.py [-j JOBS] [--dry-run]
+"""
+
+from pathlib import Path
+import argparse
+import concurrent.futures
+import hashlib
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import threading
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Libraries that the raw flow does not provide; files using them are
+# skipped (they are run through VUnit instead).
+EXTERNAL = {'ieee', 'std'}
+UNAVAILABLE = {'vunit_lib', 'osvvm'}
+
+STATE_FILE = "ghdl_build_state.json"
+
+
+class Project:
+    """
+    One GHDL library: its name, work directory and source files.
+    """
+
+    def __init__(self, library, workdir, patterns):
+        self.library = library
+        self.workdir = ROOT / workdir
+        self.files = sorted({f for p in patterns for f in ROOT.glob(p)})
+        self.lock = threading.Lock()
+
+    def flags(self, sources, workdir=None):
+        # only the libraries this project uses
+        paths = {d.project.workdir for s in sources if s.project is self
+                 for d in s.deps if d.project is not self}
+        workdir = (workdir or self.workdir).relative_to(ROOT)
+        return (["--std=08", f"--work={self.library}", f"--workdir={workdir}"]
+                + [f"-P{p.relative_to(ROOT)}" for p in sorted(paths)])
+
+
+def default_projects():
+    projects = [
+        Project("TVL", "tvl_lib/workdir", ["tvl_lib/lib/*.vhdl"]),
+        Project("work", "rtl_designs/workdir", ["rtl_designs/rtl/**/*.vhdl", "rtl_designs/testbench/*.vhdl"]),
+    ]
+    for subdir in sorted(p for p in (ROOT / "old_testbench").iterdir() if p.is_dir()):
+        projects.append(Project("work", subdir / "workdir", [f"old_testbench/{subdir.name}/*.vhdl"]))
+    return projects
+
+
+#=====================================================================
+# Scanning
+#=====================================================================
+
+_DEFINES = re.compile(r"\b(entity|package|context|configuration)\s+(?!body\b)(\w+)\s+is\b", re.I)
+_SECONDARY = re.compile(r"\b(?:architecture\s+\w+\s+of|package\s+body)\s+(\w+)\s+is\b", re.I)
+_BODY = re.compile(r"\bpackage\s+body\s+(\w+)\s+is\b", re.I)
+_USES = re.compile(r"\b(?:use|context)\s+(\w+)\s*\.\s*(\w+)", re.I)
+_INSTANCE = re.compile(r"\bentity\s+(\w+)\s*\.\s*(\w+)", re.I)
+_COMPONENT = re.compile(r"\bcomponent\s+(\w+)", re.I)
+_LIBRARY = re.compile(r"\blibrary\s+([\w\s,]+);", re.I)
+
+
+class Source:
+    """
+    A scanned VHDL file: the units it defines, the units it needs
+    before analysis, and the entities it instantiates.
+    """
+
+    def __init__(self, path, project):
+        self.path = path
+        self.project = project
+        text = path.read_text(errors="replace")
+        self.digest = hashlib.sha256(text.encode()).hexdigest()
+        text = re.sub(r"--.*", "", text)
+        text = re.sub(r"\bend\s+component\b", "", text, flags=re.I)
+        self.defines = {m.group(2).lower(): m.group(1).lower() for m in _DEFINES.finditer(text)}
+        self.entities = {n for n, kind in self.defines.items() if kind == "entity"}
+        libraries = {l.strip().lower() for m in _LIBRARY.finditer(text) for l in m.group(1).split(",")}
+        self.unavailable = sorted(libraries & UNAVAILABLE)
+        self.bodies = {n.lower() for n in _BODY.findall(text)}
+        self.needs = {("work", n.lower()) for n in _SECONDARY.findall(text)}
+        self.needs |= {(l.lower(), u.lower()) for l, u in _USES.findall(text) + _INSTANCE.findall(text)
+                       if l.lower() not in EXTERNAL | UNAVAILABLE}
+        self.instantiates = {n.lower() for n in _COMPONENT.findall(text)}
+        self.instantiates |= {u.lower() for _, u in _INSTANCE.findall(text)}
+        self.deps = set()        # files to analyze first
+        self.elab_deps = set()   # files needed before elaborating
+
+
+def scan(projects):
+    """
+    Scans every project and links each file to the files defining the
+    units it needs. Returns the usable files in analysis order.
+    """
+    sources = [Source(f, p) for p in projects for f in p.files]
+    skipped = [s for s in sources if s.unavailable]
+    for s in skipped:
+        print(f"skip {s.path.relative_to(ROOT)} (needs {', '.join(s.unavailable)})")
+    sources = [s for s in sources if not s.unavailable]
+
+    units = {}
+    for s in sources:
+        for name in s.defines:
+            units[(s.project.library.lower(), id(s.project), name)] = s
+            units.setdefault((s.project.library.lower(), None, name), s)
+
+    def lookup(library, name, project):
+        if library == "work":
+            return units.get((project.library.lower(), id(project), name))
+        return units.get((library, None, name))
+
+    for s in sources:
+        for library, name in s.needs:
+            dep = lookup(library, name, s.project)
+            if dep is not None and dep is not s:
+                s.deps.add(dep)
+        for name in s.instantiates:
+            dep = lookup("work", name, s.project)
+            if dep is not None and dep is not s:
+                s.elab_deps.add(dep)
+        # whatever uses a package needs its body when elaborated
+        for name in s.bodies:
+            package = lookup("work", name, s.project)
+            if package is not None and package is not s:
+                package.elab_deps.add(s)
+
+    ordered, state = [], {}
+
+    def visit(s):
+        if state.get(s) == "done":
+            return
+        if state.get(s) == "active":
+            raise ValueError(f"circular dependency through {s.path.relative_to(ROOT)}")
+        state[s] = "active"
+        for dep in sorted(s.deps, key=lambda d: str(d.path)):
+            visit(dep)
+        state[s] = "done"
+        ordered.append(s)
+
+    for s in sources:
+        visit(s)
+    return ordered
+
+
+def closure(source):
+    """
+    Every file the source needs to be elaborated, itself included.
+    """
+    seen, stack = set(), [source]
+    while stack:
+        s = stack.pop()
+        if s not in seen:
+            seen.add(s)
+            stack.extend(s.deps | s.elab_deps)
+    return seen
+
+
+#=====================================================================
+# Library index files
+#=====================================================================
+# A .cf file is a header line followed by one block per analyzed file:
+# a `file <directory> "<name>" ...:` line and the indented lines of the
+# units it defines.
+
+_CF_FILE = re.compile(r'file\s+(?:"([^"]*)"|(\S+))\s+"([^"]*)"')
+
+
+def _cf_blocks(text):
+    """
+    Splits the text of a .cf file into its header and a dict of
+    {source path: block}, in file order.
+    """
+    header, blocks, current = "", {}, None
+    for line in text.splitlines(keepends=True):
+        match = _CF_FILE.match(line)
+        if match:
+            current = os.path.normpath(os.path.join(match.group(1) or match.group(2), match.group(3)))
+            blocks[current] = line
+        elif current is None:
+            header += line
+        else:
+            blocks[current] += line
+    return header, blocks
+
+
+def merge_library(scratch, workdir, source):
+    """
+    Takes the entry of source from the .cf files in scratch into those
+    in workdir, replacing its previous entry, and moves the other files
+    the analysis wrote (object files) along.
+    """
+    source = os.path.normpath(source)
+    for path in scratch.iterdir():
+        target = workdir / path.name
+        if path.suffix != ".cf":
+            shutil.move(str(path), str(target))
+            continue
+        header, blocks = _cf_blocks(path.read_text())
+        if source not in blocks:
+            continue
+        if target.exists():
+            header, merged = _cf_blocks(target.read_text())
+        else:
+            merged = {}
+        merged[source] = blocks[source]
+        target.write_text(header + "".join(merged.values()))
+
+
+#=====================================================================
+# Building
+#=====================================================================
+
+def load_state(project):
+    path = project.workdir / STATE_FILE
+    if path.exists():
+        return json.loads(path.read_text())
+    return {"analyzed": {}, "elaborated": {}}
+
+
+def save_state(project, state):
+    project.workdir.mkdir(parents=True, exist_ok=True)
+    (project.workdir / STATE_FILE).write_text(json.dumps(state, indent=2, sort_keys=True))
+
+
+def build(projects, ghdl="ghdl", jobs=None, dry_run=False):
+    """
+    Analyzes changed files and elaborates changed top levels. Returns
+    False when a GHDL command failed.
+    """
+    sources = scan(projects)
+    states = {id(p): load_state(p) for p in projects}
+
+    def key(s):
+        return str(s.path.relative_to(ROOT))
+
+    # A file is reanalyzed when it changed or anything it uses was
+    # reanalyzed, since GHDL marks the dependents obsolete.
+    dirty = set()
+    for s in sources:
+        if states[id(s.project)]["analyzed"].get(key(s)) != s.digest or s.deps & dirty:
+            dirty.add(s)
+
+    referenced = {d for s in sources for d in s.elab_deps}
+    tops = [(s, e) for s in sources if s not in referenced for e in sorted(s.entities)]
+    elaborate = [(s, e) for s, e in tops
+                 if closure(s) & dirty or states[id(s.project)]["elaborated"].get(e) != s.digest]
+
+    failed = threading.Event()
+    flags = {id(p): p.flags(sources) for p in projects}
+
+    def run(command):
+        if failed.is_set():
+            return False
+        print(" ".join(command))
+        if dry_run:
+            return True
+        result = subprocess.run(command, cwd=ROOT)
+        if result.returncode != 0:
+            failed.set()
+        return result.returncode == 0
+
+    def analyze(s):
+        if dry_run:
+            return run([ghdl, "-a"] + flags[id(s.project)] + [key(s)])
+        project = s.project
+        project.workdir.mkdir(parents=True, exist_ok=True)
+        scratch = Path(tempfile.mkdtemp(prefix="analyze-", dir=project.workdir))
+        try:
+            with project.lock:
+                for cf in project.workdir.glob("*.cf"):
+                    shutil.copy2(cf, scratch)
+            ok = run([ghdl, "-a"] + project.flags(sources, scratch) + [key(s)])
+            if ok:
+                with project.lock:
+                    merge_library(scratch, project.workdir, key(s))
+                    states[id(project)]["analyzed"][key(s)] = s.digest
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+        return ok
+
+    def elaborate_top(s, entity):
+        if run([ghdl, "-e"] + flags[id(s.project)] + [entity]):
+            states[id(s.project)]["elaborated"][entity] = s.digest
+
+    with concurrent.futures.ThreadPoolExecutor(jobs or os.cpu_count()) as pool:
+        pending = {s: set(s.deps & dirty) for s in sources if s in dirty}
+        running = {}
+
+        def submit_ready():
+            for s in [s for s, deps in pending.items() if not deps]:
+                del pending[s]
+                running[pool.submit(analyze, s)] = s
+
+        submit_ready()
+        while running:
+            done, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                finished = running.pop(future)
+                if future.result():
+                    for deps in pending.values():
+                        deps.discard(finished)
+            if not failed.is_set():
+                submit_ready()
+
+        if not failed.is_set():
+            # executables are named after the entity, in ROOT
+            by_name = {}
+            for top in elaborate:
+                by_name.setdefault(top[1], []).append(top)
+            list(pool.map(lambda tops: [elaborate_top(*top) for top in tops], by_name.values()))
+
+    if not dry_run:
+        for p in projects:
+            save_state(p, states[id(p)])
+    print(f"analyzed {len(dirty)} of {len(sources)} files, elaborated {len(elaborate)} of {len(tops)} top levels")
+    return not failed.is_set()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze and elaborate the raw GHDL flow in parallel.")
+    parser.add_argument("-j", "--jobs", type=int, help="parallel GHDL processes, all cores by default")
+    parser.add_argument("--ghdl", default="ghdl", help="GHDL executable")
+    parser.add_argument("-n", "--dry-run", action="store_true", help="print the commands only")
+    args = parser.parse_args()
+    raise SystemExit(0 if build(default_projects(), args.ghdl, args.jobs, args.dry_run) else 1)
@@ -0,0 +1,305 @@
+"""
+Batch model of the arithmetic in TVL.bal_numeric. Operands are (N, width)
+int8 matrices of trits (-1, 0, +1), most significant trit first, as made
+by radix_convert.toBalternArray. Result widths, truncation and division
+by zero follow the VHDL operators, so the functions can serve as an oracle
+for the testbenches. Metavalues are not modelled.
+"""
+
+import numpy as np
+
+from radix_convert import MAX_ARRAY_TRITS
+
+#=====================================================================
+# Local helpers
+#=====================================================================
+
+def _matrix(trits) -> np.ndarray:
+    trits = np.asarray(trits, dtype=np.int8)
+    return trits.reshape(1, -1) if trits.ndim == 1 else trits
+
+def _dtype(width: int):
+    # Python ints in an object array once int64 could overflow
+    return np.int64 if width <= MAX_ARRAY_TRITS else object
+
+def _wrap(values: np.ndarray, width: int) -> np.ndarray:
+    """
+    Truncates integers to their least significant width trits.
+    """
+    base = 3**width
+    return (values + base // 2) % base - base // 2
+
+def _toInts(trits: np.ndarray) -> np.ndarray:
+    decNums = np.zeros(trits.shape[0], dtype=_dtype(trits.shape[1]))
+    for i in range(trits.shape[1]):
+        decNums = decNums * 3 + trits[:, i]
+    return decNums
+
+def _toTrits(values: np.ndarray, width: int) -> np.ndarray:
+    dividend = values.copy()
+    trits = np.empty((values.shape[0], width), dtype=np.int8)
+    for i in range(width - 1, -1, -1):
+        remainder = (dividend + 1) % 3 - 1
+        trits[:, i] = remainder
+        dividend = (dividend - remainder) // 3
+    return trits
+
+def resize(trits, width: int) -> np.ndarray:
+    """
+    Mirrors RESIZE in bal_logic: pads with leading zeros,
+    or drops the most significant trits.
+    """
+    trits = _matrix(trits)
+    if width <= trits.shape[1]:
+        return trits[:, trits.shape[1] - width:]
+    result = np.zeros((trits.shape[0], width), dtype=np.int8)
+    result[:, width - trits.shape[1]:] = trits
+    return result
+
+def _sameWidth(L, R) -> tuple[np.ndarray, np.ndarray]:
+    L, R = _matrix(L), _matrix(R)
+    size = max(L.shape[1], R.shape[1])
+    return resize(L, size), resize(R, size)
+
+#=====================================================================
+# Addition, subtraction and multiplication
+#=====================================================================
+
+def add(L, R, carry=0) -> np.ndarray:
+    """
+    Mirrors ADD_BTERN_VEC and "+": a ripple-carry addition with carry-in,
+    returning as many trits as the wider operand. The carry-out is
+    dropped, as in the VHDL.
+    """
+    L, R = _sameWidth(L, R)
+    result = np.empty_like(L)
+    ctrit = np.broadcast_to(np.asarray(carry, dtype=np.int8), L.shape[:1])
+    for i in range(L.shape[1] - 1, -1, -1):
+        total = L[:, i] + R[:, i] + ctrit
+        result[:, i] = (total + 1) % 3 - 1
+        ctrit = (total - result[:, i]) // 3
+    return result
+
+def neg(L) -> np.ndarray:
+    """
+    Mirrors the unary "-", i.e. STI of every trit.
+    """
+    return -_matrix(L)
+
+def sub(L, R) -> np.ndarray:
+    """
+    Mirrors "-": L + STI(R) with the width of the wider operand.
+    """
+    return add(L, neg(R))
+
+def mul(L, R) -> np.ndarray:
+    """
+    Mirrors "*": the exact product, L'length + R'length trits wide.
+    Partial products are summed per trit column and the carries
+    resolved once at the end.
+    """
+    L, R = _matrix(L), _matrix(R)
+    width = L.shape[1] + R.shape[1]
+    columns = np.zeros((L.shape[0], width), dtype=np.int32)
+    for i in range(L.shape[1]):
+        columns[:, i + 1:i + 1 + R.shape[1]] += L[:, i:i + 1] * R
+    result = np.empty((L.shape[0], width), dtype=np.int8)
+    ctrit = np.zeros(L.shape[0], dtype=np.int32)
+    for i in range(width - 1, -1, -1):
+        total = columns[:, i] + ctrit
+        result[:, i] = (total + 1) % 3 - 1
+        ctrit = (total - result[:, i]) // 3
+    return result
+
+#=====================================================================
+# Truncating, flooring and Euclidean division
+#=====================================================================
+# Division by zero returns what the VHDL returns after its assertion
+# of severity error: the quotient 0 and the dividend as remainder,
+# except that BTEDIV returns -1 for a negative dividend.
+
+def _divOperands(L, R) -> tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    XL, XR = _sameWidth(L, R)
+    dividend, divisor = _toInts(XL), _toInts(XR)
+    zero = divisor == 0
+    return dividend, np.where(zero, 1, divisor), zero, XL.shape[1]
+
+def div(L, R) -> np.ndarray:
+    """
+    Mirrors "/": truncating division, L'length trits wide.
+    """
+    dividend, divisor, zero, size = _divOperands(L, R)
+    quotient = abs(dividend) // abs(divisor) * np.where((dividend < 0) != (divisor < 0), -1, 1)
+    quotient = np.where(zero, 0, quotient)
+    return resize(_toTrits(quotient, size), _matrix(L).shape[1])
+
+def rem(L, R) -> np.ndarray:
+    """
+    Mirrors "rem": remainder with the sign of L, R'length trits wide.
+    """
+    dividend, divisor, zero, size = _divOperands(L, R)
+    remainder = abs(dividend) % abs(divisor) * np.where(dividend < 0, -1, 1)
+    remainder = np.where(zero, dividend, remainder)
+    return resize(_toTrits(remainder, size), _matrix(R).shape[1])
+
+def mod(L, R) -> np.ndarray:
+    """
+    Mirrors "mod": remainder with the sign of R, R'length trits wide.
+    """
+    dividend, divisor, zero, size = _divOperands(L, R)
+    modulus = np.where(zero, dividend, dividend % divisor)
+    return resize(_toTrits(modulus, size), _matrix(R).shape[1])
+
+def btediv(L, R) -> np.ndarray:
+    """
+    Mirrors BTEDIV: Euclidean quotient, L'length trits wide.
+    """
+    dividend, divisor, zero, size = _divOperands(L, R)
+    quotient = (dividend - dividend % abs(divisor)) // divisor
+    quotient = np.where(zero, np.where(dividend < 0, -1, 0), quotient)
+    return resize(_toTrits(quotient, size), _matrix(L).shape[1])
+
+def btemod(L, R) -> np.ndarray:
+    """
+    Mirrors BTEMOD: non-negative Euclidean remainder, R'length trits wide.
+    """
+    dividend, divisor, zero, size = _divOperands(L, R)
+    modulus = np.where(zero, dividend, dividend % abs(divisor))
+    return resize(_toTrits(modulus, size), _matrix(R).shape[1])
+
+#=====================================================================
+# Division procedures
+#=====================================================================
+# Step-by-step models of the procedures in bal_numeric-body.vhdl,
+# running the same double-register loop on every operand pair at once.
+# All take operands of equal width and return (quotient, remainder).
+
+def _closestToZeroLoop(dividend, divisor, single: int, keepOnTie: bool):
+    # Loop shared by DIVMOD, JONES1 and BTE_DIVMOD. HIGH and LOW are
+    # one trit wider than the partial remainder, and the candidate that
+    # is closest to zero together with the quotient part is kept.
+    # DIVMOD and BTE_DIVMOD keep the current remainder on a tie.
+    base = 3**single
+    rem, quo = np.zeros_like(dividend), dividend
+    for _ in range(single):
+        remquo = _wrap((rem * base + quo) * 3, 2 * single)
+        quo = _wrap(remquo, single)
+        rem = (remquo - quo) // base
+        high, low = rem + divisor, rem - divisor
+        absMid, absHigh, absLow = abs(remquo), abs(high * base + quo), abs(low * base + quo)
+        closest = np.minimum(absLow, np.minimum(absMid, absHigh))
+        kept = (closest == absMid) if keepOnTie else np.zeros(rem.shape, dtype=bool)
+        takeHigh = ~kept & (closest == absHigh)
+        takeLow = ~kept & ~takeHigh & (closest == absLow)
+        rem = np.where(takeHigh, _wrap(high, single), np.where(takeLow, _wrap(low, single), rem))
+        quo = np.where(takeHigh, _wrap(quo - 1, single), np.where(takeLow, _wrap(quo + 1, single), quo))
+    return rem, quo
+
+def _procedureOperands(DIVIDEND, DIVISOR):
+    DIVIDEND, DIVISOR = _matrix(DIVIDEND), _matrix(DIVISOR)
+    if DIVIDEND.shape[1] != DIVISOR.shape[1]:
+        raise ValueError("all arguments must be of the same length")
+    single = DIVIDEND.shape[1]
+    dtype = _dtype(2 * single + 1)
+    return _toInts(DIVIDEND).astype(dtype), _toInts(DIVISOR).astype(dtype), single
+
+def divmodProcedure(DIVIDEND, DIVISOR) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mirrors the DIVMOD procedure used by "/", "rem" and "mod".
+    """
+    dividend, divisor, single = _procedureOperands(DIVIDEND, DIVISOR)
+    rem, quo = _closestToZeroLoop(dividend, divisor, single, keepOnTie=True)
+    negative = rem < 0
+    rem = np.where(negative, _wrap(rem + divisor, single), rem)
+    quo = np.where(negative, _wrap(quo - 1, single), quo)
+    return _toTrits(quo, single), _toTrits(rem, single)
+
+def jones1(DIVIDEND, DIVISOR) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mirrors the JONES1 procedure.
+    """
+    dividend, divisor, single = _procedureOperands(DIVIDEND, DIVISOR)
+    rem, quo = _closestToZeroLoop(dividend, divisor, single, keepOnTie=False)
+    return _toTrits(quo, single), _toTrits(rem, single)
+
+def jones2(DIVIDEND, DIVISOR) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mirrors the JONES2 procedure.
+    """
+    dividend, divisor, single = _procedureOperands(DIVIDEND, DIVISOR)
+    one = np.where(divisor < 0, -1, 1)
+    divisor = abs(divisor)
+    base = 3**single
+    rem, quo = np.zeros_like(dividend), dividend
+    for _ in range(single):
+        remquo = _wrap((rem * base + quo) * 3, 2 * single)
+        quo = _wrap(remquo, single)
+        rem = (remquo - quo) // base
+        low = _wrap(rem - divisor, single)
+        high = _wrap(rem + divisor, single)
+        takeLow = (rem > 0) & ((-low < rem) | ((-low == rem) & (quo > 0)))
+        takeHigh = (rem < 0) & ((-high > rem) | ((-high == rem) & (quo < 0)))
+        quo = np.where(takeLow, _wrap(quo + one, single), np.where(takeHigh, _wrap(quo - one, single), quo))
+        rem = np.where(takeLow, low, np.where(takeHigh, high, rem))
+    return _toTrits(quo, single), _toTrits(rem, single)
+
+def bteDivmodProcedure(DIVIDEND, DIVISOR) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Mirrors the BTE_DIVMOD procedure used by BTEDIV and BTEMOD.
+    """
+    dividend, divisor, single = _procedureOperands(DIVIDEND, DIVISOR)
+    rem, quo = _closestToZeroLoop(dividend, divisor, single, keepOnTie=True)
+    # the leftmost non-zero trit of a negative remainder is '-'
+    up = (rem < 0) & (divisor >= 0)
+    down = (rem < 0) & (divisor < 0)
+    rem = np.where(up, _wrap(rem + divisor, single), np.where(down, _wrap(rem - divisor, single), rem))
+    quo = np.where(up, _wrap(quo - 1, single), np.where(down, _wrap(quo + 1, single), quo))
+    return _toTrits(quo, single), _toTrits(rem, single)
+
+#=====================================================================
+# Self-check
+#=====================================================================
+
+def verifyBalNumeric(width: int = 4):
+    """
+    Checks every operator against Python integers, the division
+    operators against the procedures they call, and the quotient and
+    remainder of JONES1 and JONES2, for all pairs of width-trit
+    operands.
+    """
+    from radix_convert import toBalternArray, toDecArray
+    values = np.arange(-(3**width // 2), 3**width // 2 + 1)
+    lv, rv = (v.ravel() for v in np.meshgrid(values, values))
+    L, R = toBalternArray(lv, width), toBalternArray(rv, width)
+    nonzero = rv != 0
+    checks = {
+        "add": (toDecArray(add(L, R)), _wrap(lv + rv, width)),
+        "add carry": (toDecArray(add(L, R, 1)), _wrap(lv + rv + 1, width)),
+        "sub": (toDecArray(sub(L, R)), _wrap(lv - rv, width)),
+        "mul": (toDecArray(mul(L, R)), lv * rv),
+        "div": (toDecArray(div(L, R))[nonzero], np.trunc(lv[nonzero] / rv[nonzero])),
+        "rem": (toDecArray(rem(L, R))[nonzero], np.fmod(lv[nonzero], rv[nonzero])),
+        "mod": (toDecArray(mod(L, R))[nonzero], np.mod(lv[nonzero], rv[nonzero])),
+        "btemod": (toDecArray(btemod(L, R))[nonzero], np.mod(lv[nonzero], abs(rv[nonzero]))),
+        "btediv": (toDecArray(btediv(L, R)) * rv + toDecArray(btemod(L, R)), lv),
+    }
+    positive = (lv >= 0) & (rv > 0)
+    quo, remainder = divmodProcedure(L[positive], R[positive])
+    checks["DIVMOD"] = (np.concatenate([toDecArray(quo), toDecArray(remainder)]),
+                        np.concatenate([lv[positive] // rv[positive], lv[positive] % rv[positive]]))
+    quo, remainder = bteDivmodProcedure(L, R)
+    checks["BTE_DIVMOD"] = (np.concatenate([toDecArray(quo), toDecArray(remainder)]),
+                            np.concatenate([toDecArray(btediv(L, R)), toDecArray(btemod(L, R))]))
+    # JONES1 and JONES2 leave the remainder closest to zero,
+    # at most half the divisor
+    for name, procedure in (("JONES1", jones1), ("JONES2", jones2)):
+        quo, remainder = (toDecArray(t)[nonzero] for t in procedure(L, R))
+        checks[name] = (np.concatenate([quo * rv[nonzero] + remainder, 2 * abs(remainder) <= abs(rv[nonzero])]),
+                        np.concatenate([lv[nonzero], np.ones(nonzero.sum(), dtype=bool)]))
+    for name, (result, expected) in checks.items():
+        if not np.array_equal(result, expected):
+            raise ValueError(f"{name} did not match the integer result for {width}-trit operands")
+
+
+if __name__ == "__main__":
+    verifyBalNumeric()
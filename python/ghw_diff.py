@@ -0,0 +1,165 @@
+"""
+Compares the waveforms of two runs of the same testbench, for example
+before and after changing an operator of TVL, without a viewer.
+
+Both .ghw files are streamed side by side through ghw_reader, one
+simulation time at a time, so only the current value of every signal
+is held and memory does not grow with the length of the dumps. Values
+are compared at the end of each time step, after its delta cycles,
+since a different implementation may settle in a different number of
+deltas. For every signal the first time its values differ is reported,
+along with the number of value changes (delta cycles included) in each
+file.
+
+    python python/ghw_diff.py before.ghw after.ghw [-s '/tb/dut/*'] [--json]
+
+Exits with status 1 if any signal differs, so it can gate CI jobs.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from ghw_reader import FIXTURE, GhwReader
+
+# The fixture of ghw_reader, run again with clk settling in two delta
+# cycles at 10 ns and sum(0) ending as '0' instead of '-'
+CHANGED_FIXTURE = os.path.join(os.path.dirname(FIXTURE), 'adder_tb_changed.ghw')
+
+def _steps(cycles, counts: dict):
+    """
+    Groups the cycles of a reader by time, yielding (time, {path:
+    value}) with the last value of every signal changed at that time,
+    and counts the changes per signal.
+    """
+    time, values = None, {}
+    for t, changed in cycles:
+        if t != time and values:
+            yield time, values
+            values = {}
+        time = t
+        for path in changed:
+            counts[path] += 1
+        values.update(changed)
+    if values:
+        yield time, values
+
+def _paths(reader: GhwReader, names) -> list[str]:
+    if names is None:
+        return list(reader.signals)
+    paths = {}
+    for name in [names] if isinstance(names, str) else names:
+        try:
+            paths.update(dict.fromkeys(s.path for s in reader.select(name)))
+        except KeyError:
+            pass    # matching nothing in this file, it is reported as missing
+    return list(paths)
+
+def diffWaveforms(pathA, pathB, names=None) -> dict:
+    """
+    Compares the signals the two files have in common, all or those
+    matching names. Returns a dict with, per signal, the counts of
+    value changes and the first divergence as (time, value A, value
+    B) or None, and the paths found in one file only.
+    """
+    a, b = GhwReader(pathA), GhwReader(pathB)
+    pathsA, pathsB = _paths(a, names), _paths(b, names)
+    common = [p for p in pathsA if p in set(pathsB)]
+    if not common:
+        raise ValueError("the files have no selected signal in common")
+    countsA, countsB = dict.fromkeys(common, 0), dict.fromkeys(common, 0)
+    stepsA, stepsB = _steps(a.cycles(common), countsA), _steps(b.cycles(common), countsB)
+    currentA, currentB = {}, {}
+    first = {}
+
+    stepA, stepB = next(stepsA, None), next(stepsB, None)
+    while stepA is not None or stepB is not None:
+        time = min(step[0] for step in (stepA, stepB) if step is not None)
+        touched = set()
+        if stepA is not None and stepA[0] == time:
+            currentA.update(stepA[1])
+            touched.update(stepA[1])
+            stepA = next(stepsA, None)
+        if stepB is not None and stepB[0] == time:
+            currentB.update(stepB[1])
+            touched.update(stepB[1])
+            stepB = next(stepsB, None)
+        for path in touched:
+            if path not in first and currentA.get(path) != currentB.get(path):
+                first[path] = (time, currentA.get(path), currentB.get(path))
+
+    return {
+        'signals': {p: {'first_divergence': first.get(p), 'changes': (countsA[p], countsB[p])}
+                    for p in common},
+        'only_a': [p for p in pathsA if p not in set(common)],
+        'only_b': [p for p in pathsB if p not in set(common)],
+    }
+
+def printReport(result: dict, output=sys.stdout):
+    signals = result['signals']
+    diverged = {p: s for p, s in signals.items() if s['first_divergence'] is not None}
+    counts = {p: s for p, s in signals.items() if s['changes'][0] != s['changes'][1]}
+    for path, s in sorted(diverged.items(), key=lambda item: item[1]['first_divergence'][0]):
+        time, valueA, valueB = s['first_divergence']
+        print(f"{path}: first differs at {time} fs, {valueA} /= {valueB}", file=output)
+    for path, s in counts.items():
+        print(f"{path}: {s['changes'][0]} changes /= {s['changes'][1]} changes", file=output)
+    for key, label in (('only_a', "only in the first file"), ('only_b', "only in the second file")):
+        for path in result[key]:
+            print(f"{path}: {label}", file=output)
+    print(f"{len(signals)} signals compared, {len(diverged)} differ, "
+          f"{len(counts)} with different numbers of changes", file=output)
+
+def verifyGhwDiff(pathA: str = FIXTURE, pathB: str = CHANGED_FIXTURE):
+    """
+    Checks that the fixture compares equal to itself, and against its
+    changed run differs in sum and dut/x only, with the extra delta
+    cycle of clk counted but not reported as a divergence.
+    """
+    result = diffWaveforms(pathA, pathA)
+    if any(s['first_divergence'] is not None or s['changes'][0] != s['changes'][1]
+           for s in result['signals'].values()):
+        raise ValueError(f"{pathA} differs from itself")
+    result = diffWaveforms(pathA, pathB)
+    diverged = {p: s['first_divergence'] for p, s in result['signals'].items() if s['first_divergence']}
+    counts = {p: s['changes'] for p, s in result['signals'].items() if s['changes'][0] != s['changes'][1]}
+    expected = (30 * 10**6, '-0--', '-0-0')
+    if diverged != {'/adder_tb/sum': expected, '/adder_tb/dut/x': expected}:
+        raise ValueError(f"found the divergences {diverged}")
+    if counts != {'/adder_tb/clk': (5, 6)}:
+        raise ValueError(f"found the change counts {counts}")
+    if result['only_a'] or result['only_b'] or len(result['signals']) != 9:
+        raise ValueError("compared other signals than the 9 of the fixtures")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the signals of two GHW waveform files.")
+    parser.add_argument("a", nargs="?", help="first .ghw file")
+    parser.add_argument("b", nargs="?", help="second .ghw file")
+    parser.add_argument("-s", "--signals", nargs="+", metavar="PATH",
+                        help="signal paths or patterns such as '/tb/dut/*', all signals by default")
+    parser.add_argument("--json", action="store_true", help="print the full result as JSON")
+    parser.add_argument("--verify", action="store_true", help="run the self-check against the fixtures instead")
+    args = parser.parse_args(argv)
+    if args.verify:
+        verifyGhwDiff()
+        return
+    if args.b is None:
+        parser.error("two files are required")
+    try:
+        result = diffWaveforms(args.a, args.b, args.signals)
+    except (ValueError, OSError) as e:
+        parser.error(str(e))
+    if args.json:
+        json.dump(result, sys.stdout, indent=2)
+        print()
+    else:
+        printReport(result)
+    same = (not result['only_a'] and not result['only_b']
+            and all(s['first_divergence'] is None and s['changes'][0] == s['changes'][1]
+                    for s in result['signals'].values()))
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
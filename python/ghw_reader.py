@@ -0,0 +1,715 @@
+"""
+Streaming reader of the .ghw waveform files written by GHDL (--wave),
+for checking simulation output without GTKWave or Surfer.
+
+Only the header of the file is held in memory: its string table, its
+types and the design hierarchy. The value changes that follow are
+decoded as they are read, the current value of every scalar signal
+being the only state, so dumps of any length are read in constant
+memory. Enumeration values are decoded to their literals: a
+BTERN_ULOGIC or BTERN_LOGIC signal reads as '+', '0', '-', 'U', ...,
+an array of character literals such as a BTERN_LOGIC_VECTOR as one
+string, MSB first for downto ranges ("+0-+"), and a KLEENE signal as
+'FALSE', 'UNK' or 'TRUE'. Other arrays read as lists, records as dicts.
+
+    reader = GhwReader("workdir/adder_tb_wave.ghw")
+    for time, path, value in reader.changes(["/adder_tb/sum", "/adder_tb/dut/*"]):
+        ...
+    for time, values in reader.sample(["/adder_tb/sum"], [parseTime("10ns"), parseTime("20ns")]):
+        ...
+
+Times are integers in femtoseconds, GHDL's time resolution. Signals
+are named by their path in the hierarchy, '/top/instance/signal'.
+The layout follows ghwlib.c of GHDL, file versions 0 and 1:
+
+    header    'GHDLwave\\n', 16, 0, version, endianness, word and
+              offset sizes, 0
+    sections  a 4-byte tag each:
+              STR  string table, each string sharing a prefix with
+                   the one before it
+              TYP  types;  WKT  well-known types;  HIE  hierarchy,
+                   every signal listing the ids of its scalars, every
+                   scope closed by 15 and the hierarchy by 0
+              EOH  end of the header
+              SNP  a snapshot: a time and the value of every scalar
+              CYC  a start time, then per cycle the changed scalars
+                   (LEB128 distance to the previous one, then value)
+                   and the LEB128 time to the next cycle, -1 at the end
+              DIR, TAI  directory and tail
+"""
+
+import argparse
+import fnmatch
+import os
+import re
+import struct
+import sys
+
+from radix_convert import toDec
+from truth_tables import PACKAGES
+
+MAGIC = b'GHDLwave\n'
+
+BTERN_LITERALS = PACKAGES['bal_logic'][0]
+
+# Type kinds, as numbered by GHDL's run-time information (ghdl_rtik)
+_B2, _E8, _E32, _I32, _I64, _F64, _P32, _P64 = 22, 23, 24, 25, 26, 28, 29, 30
+_ARRAY, _RECORD = 32, 33
+_SUBTYPE_SCALAR, _SUBTYPE_ARRAY, _SUBTYPE_RECORD = 35, 36, 39
+_SCALARS = {_B2, _E8, _E32, _I32, _I64, _F64, _P32, _P64, _SUBTYPE_SCALAR}
+
+# Hierarchy kinds
+_HIE_EOH, _HIE_GENERATE_FOR, _HIE_PROCESS, _HIE_EOS = 0, 5, 13, 15
+_HIE_SCOPES = {3, 4, 5, 6, 7, 14}   # block, if/for generate, instance, package, generic
+_HIE_SIGNALS = set(range(16, 22))   # signal and ports of every mode
+
+# How a scalar value is stored: an enumeration position byte, a
+# signed LEB128 integer or an 8-byte float
+_SLEB, _FLOAT = 1, 2
+
+# Upper bound of the bytes of one value change
+_MAX_CHANGE_BYTES = 32
+
+# Dump of a small adder testbench, for verifyGhwReader
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'adder_tb.ghw')
+
+_TIME_UNITS = {'fs': 1, 'ps': 10**3, 'ns': 10**6, 'us': 10**9, 'ms': 10**12, 'sec': 10**15, 's': 10**15}
+
+def _uleb(buf, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7f) << shift
+        if b < 0x80:
+            return result, pos
+        shift += 7
+
+def _sleb(buf, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        b = buf[pos]
+        pos += 1
+        result |= (b & 0x7f) << shift
+        shift += 7
+        if b < 0x80:
+            if b & 0x40:
+                result -= 1 << shift
+            return result, pos
+
+def parseTime(text: str) -> int:
+    """
+    Converts a time such as '10 ns', '2.5us' or '300' (femtoseconds)
+    into femtoseconds.
+    """
+    match = re.fullmatch(r"\s*([0-9.]+)\s*([a-z]*)\s*", text.lower())
+    if not match or match.group(2) not in _TIME_UNITS and match.group(2):
+        raise ValueError(f"invalid time {text!r}")
+    return round(float(match.group(1)) * _TIME_UNITS[match.group(2) or 'fs'])
+
+def ternaryInteger(value) -> int:
+    """
+    The integer value of a balanced ternary string, MSB first, or None
+    when it is not a string of '-', '0' and '+' only.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return toDec(value)
+    except ValueError:
+        return None
+
+class _Input:
+    """
+    Buffered reader over a binary file. The decoders index its buffer
+    directly; fill() makes sure enough bytes are ahead of the position.
+    """
+
+    def __init__(self, file, chunkBytes: int):
+        self.file = file
+        self.chunkBytes = chunkBytes
+        self.buf = b''
+        self.pos = 0
+        self.offset = file.tell()   # file offset of buf[0]
+
+    def fill(self, n: int) -> bool:
+        """
+        Reads ahead until n bytes follow the position, and returns
+        False if the file ends before.
+        """
+        if len(self.buf) - self.pos < n:
+            self.offset += self.pos
+            self.buf = self.buf[self.pos:] + self.file.read(max(n, self.chunkBytes))
+            self.pos = 0
+        return len(self.buf) - self.pos >= n
+
+    def read(self, n: int) -> bytes:
+        if not self.fill(n):
+            raise EOFError
+        self.pos += n
+        return self.buf[self.pos - n:self.pos]
+
+    def byte(self) -> int:
+        return self.read(1)[0]
+
+    def uleb(self) -> int:
+        self.fill(_MAX_CHANGE_BYTES)
+        value, self.pos = _uleb(self.buf, self.pos)
+        return value
+
+    def sleb(self) -> int:
+        self.fill(_MAX_CHANGE_BYTES)
+        value, self.pos = _sleb(self.buf, self.pos)
+        return value
+
+    def tell(self) -> int:
+        return self.offset + self.pos
+
+class _Type:
+    """
+    An entry of the type table. Scalar subtypes and array subtypes
+    refer to their base type; array subtypes and records know how many
+    scalars they hold (-1 when unbounded).
+    """
+
+    def __init__(self, kind: int, name: str):
+        self.kind = kind
+        self.name = name
+        self.base = self
+        self.literals = None    # enumerations
+        self.characters = False # enumerations of character literals only
+        self.element = None     # arrays
+        self.dims = 1
+        self.length = 0         # array subtypes: elements
+        self.fields = None      # records: [(name, type)]
+        self.scalars = 1
+
+class Signal:
+    """
+    A signal or port of the design: its path, its type, and the ids of
+    its scalar signals in element order. Ports connected to a signal
+    share its scalars.
+    """
+
+    def __init__(self, path: str, type: _Type, ids: list[int]):
+        self.path = path
+        self.type = type
+        self.ids = ids
+
+    @property
+    def typeName(self) -> str:
+        return self.type.name or self.type.base.name
+
+    @property
+    def ternary(self) -> bool:
+        """
+        True for BTERN_ULOGIC and arrays of it, such as the vectors.
+        """
+        t = self.type
+        while t.kind == _SUBTYPE_ARRAY:
+            t = t.element
+        return t.base.literals is not None and tuple(t.base.literals) == BTERN_LITERALS
+
+    def __repr__(self):
+        return f"Signal({self.path!r}, {self.typeName}, {len(self.ids)} scalars)"
+
+def _decoder(t: _Type, positions: list[int], start: int = 0):
+    """
+    Returns a function building the value of type t from the state of
+    the scalars at positions[start:], and the position after them.
+    """
+    if t.kind in _SCALARS:
+        k = positions[start]
+        return (lambda state: state[k]), start + 1
+    if t.kind == _SUBTYPE_ARRAY and t.element.kind in _SCALARS and t.element.base.characters:
+        ks = positions[start:start + t.length]
+        return (lambda state: ''.join([state[k] for k in ks])), start + t.length
+    if t.kind == _SUBTYPE_ARRAY:
+        elements = []
+        for _ in range(t.length):
+            element, start = _decoder(t.element, positions, start)
+            elements.append(element)
+        return (lambda state: [element(state) for element in elements]), start
+    fields = []
+    for name, ftype in t.fields:
+        field, start = _decoder(ftype, positions, start)
+        fields.append((name, field))
+    return (lambda state: {name: field(state) for name, field in fields}), start
+
+class GhwReader:
+    """
+    A .ghw file whose header has been read. Every call of cycles(),
+    changes() or sample() streams the value changes from the file
+    again, from the end of the header.
+    """
+
+    def __init__(self, path, chunkBytes: int = 1 << 20):
+        self.path = path
+        self.chunkBytes = chunkBytes
+        self.signals = {}   # path: Signal, in hierarchy order
+        self._strings = []
+        self._types = []
+        self._scalarTypes = {}
+        with open(path, 'rb') as file:
+            inp = _Input(file, chunkBytes)
+            try:
+                self._readHeader(inp)
+            except (EOFError, IndexError):
+                raise ValueError(f"{path}: truncated header") from None
+            self._dataOffset = inp.tell()
+        # Snapshots and cycles count the scalars in the order of their ids
+        self._order = sorted(self._scalarTypes)
+
+    #=================================================================
+    # Header
+    #=================================================================
+
+    def _readHeader(self, inp: _Input):
+        head = inp.read(16)
+        if head[:9] != MAGIC or head[9] != 16 or head[10] != 0:
+            raise ValueError(f"{self.path}: not a GHW file")
+        self.version = head[11]
+        if self.version > 1 or head[12] not in (1, 2) or head[15] != 0:
+            raise ValueError(f"{self.path}: unsupported GHW version {self.version}")
+        self._endian = '<' if head[12] == 1 else '>'
+        sections = {b'STR\0': self._readStrings, b'TYP\0': self._readTypes,
+                    b'WKT\0': self._readKnownTypes, b'HIE\0': self._readHierarchy}
+        while (tag := inp.read(4)) != b'EOH\0':
+            if tag not in sections:
+                raise ValueError(f"{self.path}: unexpected section {tag!r} in the header")
+            sections[tag](inp)
+
+    def _int(self, data: bytes, offset: int, size: int = 4) -> int:
+        return int.from_bytes(data[offset:offset + size], 'little' if self._endian == '<' else 'big', signed=True)
+
+    def _expect(self, inp: _Input, tag: bytes):
+        if inp.read(4) != tag:
+            raise ValueError(f"{self.path}: missing {tag[:3].decode()} at byte {inp.tell() - 4}")
+
+    def _str(self, inp: _Input) -> str:
+        return self._strings[inp.uleb()]
+
+    def _type(self, inp: _Input) -> _Type:
+        return self._types[inp.uleb() - 1]
+
+    def _readStrings(self, inp: _Input):
+        head = inp.read(12)
+        table = [b'<anon>']
+        prefix = 0
+        for _ in range(self._int(head, 4)):
+            # each string ends with a byte in 0-31 or 128-159, which
+            # starts the length of the prefix shared with the next one
+            text = bytearray(table[-1][:prefix])
+            c = inp.byte()
+            while 32 <= c < 128 or c >= 160:
+                text.append(c)
+                c = inp.byte()
+            prefix, shift = c & 0x1f, 5
+            while c >= 128:
+                c = inp.byte()
+                prefix |= (c & 0x1f) << shift
+                shift += 5
+            table.append(bytes(text))
+        self._expect(inp, b'EOS\0')
+        self._strings = [None] + [s.decode('latin-1') for s in table[1:]]
+
+    def _readRange(self, inp: _Input) -> int:
+        """
+        Reads a range and returns its length.
+        """
+        code = inp.byte()
+        kind = code & 0x7f
+        if kind in (_B2, _E8):
+            left, right = inp.byte(), inp.byte()
+        elif kind in (_I32, _P32, _I64, _P64):
+            left, right = inp.sleb(), inp.sleb()
+        elif kind == _F64:
+            inp.read(16)
+            return 0
+        else:
+            raise ValueError(f"{self.path}: unsupported range kind {kind}")
+        return max(0, (left - right if code & 0x80 else right - left) + 1)
+
+    def _arraySubtype(self, inp: _Input, base: _Type) -> _Type:
+        array = base.base
+        t = _Type(_SUBTYPE_ARRAY, None)
+        t.base = array
+        t.dims = array.dims
+        t.length = 1
+        for _ in range(array.dims):
+            t.length *= self._readRange(inp)
+        t.element = array.element if array.element.scalars >= 0 else self._bounds(inp, array.element)
+        t.scalars = t.length * t.element.scalars
+        return t
+
+    def _recordSubtype(self, inp: _Input, base: _Type) -> _Type:
+        record = base.base
+        t = _Type(_SUBTYPE_RECORD, None)
+        t.base = record
+        if record.scalars >= 0:
+            t.fields = record.fields
+        else:
+            t.fields = [(name, ftype if ftype.scalars >= 0 else self._bounds(inp, ftype))
+                        for name, ftype in record.fields]
+        t.scalars = sum(ftype.scalars for _, ftype in t.fields)
+        return t
+
+    def _bounds(self, inp: _Input, t: _Type) -> _Type:
+        if t.kind in (_ARRAY, _SUBTYPE_ARRAY):
+            return self._arraySubtype(inp, t)
+        return self._recordSubtype(inp, t)
+
+    def _readTypes(self, inp: _Input):
+        head = inp.read(8)
+        for _ in range(self._int(head, 4)):
+            kind = inp.byte()
+            if kind in (_B2, _E8):
+                t = _Type(kind, self._str(inp))
+                literals = [self._str(inp) for _ in range(inp.uleb())]
+                t.characters = all(len(l) == 3 and l[0] == l[2] == "'" for l in literals)
+                # identifiers are stored in lower case
+                t.literals = [l[1] if t.characters else l.upper() for l in literals]
+            elif kind in (_I32, _I64, _F64):
+                t = _Type(kind, self._str(inp))
+            elif kind in (_P32, _P64):
+                t = _Type(kind, self._str(inp))
+                if self.version > 0:
+                    for _ in range(inp.uleb()):
+                        self._str(inp)
+                        inp.sleb()
+            elif kind == _SUBTYPE_SCALAR:
+                t = _Type(kind, self._str(inp))
+                t.base = self._type(inp).base
+                self._readRange(inp)
+            elif kind == _ARRAY:
+                t = _Type(kind, self._str(inp))
+                t.element = self._type(inp)
+                t.dims = inp.uleb()
+                for _ in range(t.dims):
+                    self._type(inp)
+                t.scalars = -1
+            elif kind == _SUBTYPE_ARRAY:
+                name = self._str(inp)
+                t = self._arraySubtype(inp, self._type(inp))
+                t.name = name
+            elif kind == _RECORD:
+                t = _Type(kind, self._str(inp))
+                t.fields = [(self._str(inp), self._type(inp)) for _ in range(inp.uleb())]
+                scalars = [ftype.scalars for _, ftype in t.fields]
+                t.scalars = -1 if min(scalars, default=0) < 0 else sum(scalars)
+            elif kind == _SUBTYPE_RECORD:
+                name = self._str(inp)
+                t = self._recordSubtype(inp, self._type(inp))
+                t.name = name
+            else:
+                raise ValueError(f"{self.path}: unsupported type kind {kind}")
+            self._types.append(t)
+        self._expect(inp, b'EOT\0')
+
+    def _readKnownTypes(self, inp: _Input):
+        # boolean, bit and std_ulogic are marked; their literals are
+        # decoded like any other enumeration
+        inp.read(4)
+        while inp.byte() != 0:
+            self._type(inp)
+
+    def _readValue(self, inp: _Input, t: _Type):
+        base = t.base
+        if base.literals is not None:
+            return base.literals[inp.byte()]
+        if base.kind == _F64:
+            return struct.unpack(self._endian + 'd', inp.read(8))[0]
+        return inp.sleb()
+
+    def _readSignal(self, inp: _Input, t: _Type, ids: list[int]):
+        if t.kind in _SCALARS:
+            sid = inp.uleb()
+            self._scalarTypes.setdefault(sid, t.base)
+            ids.append(sid)
+        elif t.kind == _SUBTYPE_ARRAY:
+            for _ in range(t.length):
+                self._readSignal(inp, t.element, ids)
+        elif t.kind in (_RECORD, _SUBTYPE_RECORD):
+            for _, ftype in t.fields:
+                self._readSignal(inp, ftype, ids)
+        else:
+            raise ValueError(f"{self.path}: signal of unbounded type {t.name}")
+
+    def _readHierarchy(self, inp: _Input):
+        inp.read(16)   # numbers of scopes, signals and scalar signals
+        scope = []
+        while (kind := inp.byte()) != _HIE_EOH:
+            if kind == _HIE_EOS:
+                scope.pop()
+                continue
+            name = self._str(inp)
+            if kind in _HIE_SIGNALS:
+                t = self._type(inp)
+                ids = []
+                self._readSignal(inp, t, ids)
+                path = '/' + '/'.join(scope + [name])
+                self.signals[path] = Signal(path, t, ids)
+            elif kind in _HIE_SCOPES:
+                if kind == _HIE_GENERATE_FOR:
+                    name = f"{name}({self._readValue(inp, self._type(inp))})"
+                scope.append(name)
+            elif kind != _HIE_PROCESS:
+                raise ValueError(f"{self.path}: unsupported hierarchy kind {kind}")
+
+    #=================================================================
+    # Value changes
+    #=================================================================
+
+    def select(self, names=None) -> list[Signal]:
+        """
+        The signals whose paths match any of names, exactly or as
+        fnmatch patterns, ignoring case; all signals for None.
+        """
+        if names is None:
+            return list(self.signals.values())
+        if isinstance(names, str):
+            names = [names]
+        chosen = {}
+        for name in names:
+            matches = [p for p in self.signals if fnmatch.fnmatchcase(p.lower(), name.lower())]
+            if not matches:
+                raise KeyError(f"no signal matches {name!r}")
+            chosen.update((p, self.signals[p]) for p in matches)
+        return list(chosen.values())
+
+    def cycles(self, names=None):
+        """
+        Yields (time, {path: value}) for every snapshot and simulation
+        cycle in which any of the selected signals changed, with the
+        new values of those that did. The first snapshot holds the
+        initial values of all of them.
+        """
+        selected = self.select(names)
+        position = {sid: k for k, sid in enumerate(self._order, 1)}
+        count = len(self._order)
+
+        # per scalar: how its value is read, and the selected signals
+        # made up of it
+        literals = [None] * (count + 1)
+        kinds = [None] * (count + 1)
+        for sid, k in position.items():
+            base = self._scalarTypes[sid]
+            literals[k] = base.literals
+            kinds[k] = _FLOAT if base.kind == _F64 else _SLEB
+        owners = [None] * (count + 1)
+        paths, decoders = [], []
+        for i, signal in enumerate(selected):
+            positions = [position[sid] for sid in signal.ids]
+            paths.append(signal.path)
+            decoders.append(_decoder(signal.type, positions)[0])
+            for k in set(positions):
+                owners[k] = (owners[k] or ()) + (i,)
+
+        state = [None] * (count + 1)
+        float64 = struct.Struct(self._endian + 'd')
+
+        with open(self.path, 'rb') as file:
+            file.seek(self._dataOffset)
+            inp = _Input(file, self.chunkBytes)
+            try:
+                while inp.fill(4):
+                    tag = inp.read(4)
+                    if tag == b'SNP\0':
+                        time = self._int(inp.read(12), 4, 8)
+                        touched = set()
+                        for k in range(1, count + 1):
+                            inp.fill(_MAX_CHANGE_BYTES)
+                            buf, pos = inp.buf, inp.pos
+                            if literals[k] is not None:
+                                value = literals[k][buf[pos]]
+                                pos += 1
+                            elif kinds[k] == _SLEB:
+                                value, pos = _sleb(buf, pos)
+                            else:
+                                value = float64.unpack_from(buf, pos)[0]
+                                pos += 8
+                            inp.pos = pos
+                            if value != state[k]:
+                                state[k] = value
+                                if owners[k]:
+                                    touched.update(owners[k])
+                        if touched:
+                            yield time, {paths[i]: decoders[i](state) for i in sorted(touched)}
+                        self._expect(inp, b'ESN\0')
+                    elif tag == b'CYC\0':
+                        time = self._int(inp.read(8), 0, 8)
+                        buf, pos = inp.buf, inp.pos
+                        while True:
+                            k = 0
+                            touched = set()
+                            while True:
+                                if len(buf) - pos < _MAX_CHANGE_BYTES:
+                                    inp.pos = pos
+                                    inp.fill(inp.chunkBytes)
+                                    buf, pos = inp.buf, inp.pos
+                                d = buf[pos]
+                                if d < 0x80:
+                                    pos += 1
+                                else:
+                                    d, pos = _uleb(buf, pos)
+                                if d == 0:
+                                    break
+                                # d counts scalars forward from the last one
+                                k += d
+                                lits = literals[k]
+                                if lits is not None:
+                                    state[k] = lits[buf[pos]]
+                                    pos += 1
+                                elif kinds[k] == _SLEB:
+                                    state[k], pos = _sleb(buf, pos)
+                                else:
+                                    state[k] = float64.unpack_from(buf, pos)[0]
+                                    pos += 8
+                                if owners[k]:
+                                    touched.update(owners[k])
+                            if touched:
+                                yield time, {paths[i]: decoders[i](state) for i in sorted(touched)}
+                            if len(buf) - pos < _MAX_CHANGE_BYTES:
+                                inp.pos = pos
+                                inp.fill(inp.chunkBytes)
+                                buf, pos = inp.buf, inp.pos
+                            delta, pos = _sleb(buf, pos)
+                            if delta == -1:
+                                break
+                            time += delta
+                        inp.pos = pos
+                        self._expect(inp, b'ECY\0')
+                    elif tag == b'DIR\0':
+                        entries = self._int(inp.read(8), 4)
+                        inp.read(8 * entries)
+                        self._expect(inp, b'EOD\0')
+                    elif tag == b'TAI\0':
+                        inp.read(8)
+                    else:
+                        raise ValueError(f"{self.path}: unexpected section {tag!r} at byte {inp.tell() - 4}")
+            except (EOFError, IndexError):
+                raise ValueError(f"{self.path}: truncated or corrupt at byte {inp.tell()}") from None
+
+    def changes(self, names=None):
+        """
+        Yields (time, path, value) for every change of the selected
+        signals, starting with their initial values.
+        """
+        for time, values in self.cycles(names):
+            for path, value in values.items():
+                yield time, path, value
+
+    def sample(self, names, times):
+        """
+        Yields (time, {path: value}) with the values of the selected
+        signals at each of times, given in increasing order: the last
+        values set at or before that time, None before the first.
+        """
+        current = {signal.path: None for signal in self.select(names)}
+        times = iter(times)
+        next_time = next(times, None)
+        for time, values in self.cycles(names):
+            while next_time is not None and next_time < time:
+                yield next_time, dict(current)
+                next_time = next(times, None)
+            if next_time is None:
+                return
+            current.update(values)
+        while next_time is not None:
+            yield next_time, dict(current)
+            next_time = next(times, None)
+
+def verifyGhwReader(path: str = FIXTURE):
+    """
+    Checks the hierarchy and the value changes read from the fixture,
+    whose package, instances and for-generate scopes are each closed
+    by an end-of-scope and whose hierarchy ends with an end-of-hierarchy,
+    as GHDL writes them.
+    """
+    reader = GhwReader(path)
+    types = {s.path: s.typeName for s in reader.signals.values()}
+    expected = {
+        '/tb_pkg/pkg_flag': 'kleene', '/adder_tb/clk': 'btern_ulogic',
+        '/adder_tb/sum': 'btern_ulogic_vector', '/adder_tb/count': 'natural',
+        '/adder_tb/dut/x': 'btern_ulogic_vector', '/adder_tb/dut/carry': 'btern_ulogic',
+        '/adder_tb/g(0)/s': 'btern_ulogic', '/adder_tb/g(1)/s': 'btern_ulogic',
+        '/adder_tb/done': 'boolean',
+    }
+    if list(types.items()) != list(expected.items()):
+        raise ValueError(f"{path}: read the hierarchy as {types}")
+    # the port dut/x is made of the scalars of sum
+    if reader.signals['/adder_tb/dut/x'].ids != reader.signals['/adder_tb/sum'].ids:
+        raise ValueError(f"{path}: dut/x and sum do not share their scalars")
+    changes = [(time, path, value) for time, path, value in reader.changes()
+               if path in ('/tb_pkg/pkg_flag', '/adder_tb/sum', '/adder_tb/count', '/adder_tb/done')]
+    expected = [
+        (0, '/tb_pkg/pkg_flag', 'UNK'), (0, '/adder_tb/sum', 'UUUU'), (0, '/adder_tb/count', 0),
+        (0, '/adder_tb/done', 'FALSE'), (0, '/adder_tb/sum', '0000'),
+        (10**7, '/adder_tb/sum', '+0-+'), (10**7, '/adder_tb/count', 1),
+        (2 * 10**7, '/tb_pkg/pkg_flag', 'TRUE'),
+        (3 * 10**7, '/adder_tb/sum', '-0--'), (3 * 10**7, '/adder_tb/count', 300),
+        (3 * 10**7, '/adder_tb/done', 'TRUE'),
+    ]
+    if changes != expected:
+        raise ValueError(f"{path}: read the value changes as {changes}")
+    samples = list(reader.sample(['/adder_tb/g(*)/s', '/adder_tb/dut/carry'], [parseTime('15ns'), parseTime('25ns')]))
+    expected = [
+        (15 * 10**6, {'/adder_tb/dut/carry': '0', '/adder_tb/g(0)/s': '+', '/adder_tb/g(1)/s': '0'}),
+        (25 * 10**6, {'/adder_tb/dut/carry': '+', '/adder_tb/g(0)/s': '+', '/adder_tb/g(1)/s': '-'}),
+    ]
+    if samples != expected:
+        raise ValueError(f"{path}: sampled {samples}")
+
+def _format(value) -> str:
+    if isinstance(value, list):
+        return '(' + ', '.join(map(_format, value)) + ')'
+    if isinstance(value, dict):
+        return '(' + ', '.join(f"{k} => {_format(v)}" for k, v in value.items()) + ')'
+    return str(value)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the signals of a GHW waveform file.")
+    parser.add_argument("file", nargs="?", help=".ghw file written by ghdl -r --wave=")
+    parser.add_argument("-s", "--signals", nargs="+", metavar="PATH",
+                        help="signal paths or patterns such as '/tb/dut/*', all signals by default")
+    parser.add_argument("-l", "--list", action="store_true", help="list the signals and their types")
+    parser.add_argument("--at", nargs="+", type=parseTime, metavar="TIME",
+                        help="print the values at these times ('10ns', '2.5 us', femtoseconds)")
+    parser.add_argument("-i", "--integers", action="store_true",
+                        help="also print ternary vectors as integers")
+    parser.add_argument("--verify", action="store_true", help="run the self-check against the fixture instead")
+    args = parser.parse_args(argv)
+    if args.verify:
+        verifyGhwReader()
+        return
+    if args.file is None:
+        parser.error("the file is required")
+    try:
+        reader = GhwReader(args.file)
+        signals = reader.select(args.signals)
+        ternary = {s.path for s in signals if s.ternary} if args.integers else set()
+
+        def show(path, value):
+            text = _format(value)
+            if path in ternary and ternaryInteger(value) is not None:
+                text += f" ({ternaryInteger(value)})"
+            return text
+
+        if args.list:
+            for s in signals:
+                print(f"{s.path} : {s.typeName}")
+        elif args.at:
+            for time, values in reader.sample(args.signals, sorted(args.at)):
+                for path, value in values.items():
+                    print(f"{time} {path} {show(path, value)}")
+        else:
+            for time, path, value in reader.changes(args.signals):
+                print(f"{time} {path} {show(path, value)}")
+    except (ValueError, KeyError, OSError) as e:
+        parser.error(str(e))
+    except BrokenPipeError:
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""
+Writes golden vectors for the bal_numeric operators: tables of operands
+and expected results computed by the bal_numeric.py model, in a binary
+file per operator and width. The testbenches read them through the
+GOLDEN_VECTORS package emitted by writeReaderPackage(), which checks
+widths beyond the reach of the VHDL INTEGER type.
+
+File layout (*.tvlg):
+    4 bytes   magic 'TVLG'
+    8 bytes   operator name, ASCII, space padded
+    1 byte    number of columns C
+    C bytes   width of every column in trits
+    zeros     padding up to a multiple of 8 bytes
+    records   one per vector, the columns packed back to back like
+              BTritArray rows: 5 trits per byte, value + 121, most
+              significant byte first.
+Records are not counted; readers stop at the end of the file.
+"""
+
+import argparse
+from pathlib import Path
+
+import numpy as np
+
+import bal_numeric
+from radix_convert import BTritArray
+
+MAGIC = b'TVLG'
+NAME_BYTES = 8
+
+OPERATORS = {
+    'add': bal_numeric.add,
+    'sub': bal_numeric.sub,
+    'mul': bal_numeric.mul,
+    'div': bal_numeric.div,
+    'rem': bal_numeric.rem,
+    'mod': bal_numeric.mod,
+    'btediv': bal_numeric.btediv,
+    'btemod': bal_numeric.btemod,
+}
+DIVISIONS = {'div', 'rem', 'mod', 'btediv', 'btemod'}
+
+def _edgeTrits(width: int) -> np.ndarray:
+    # 0, +1, -1, the largest and the smallest value
+    edges = np.zeros((5, width), dtype=np.int8)
+    edges[1, -1], edges[2, -1] = 1, -1
+    edges[3], edges[4] = 1, -1
+    return edges
+
+def makeVectors(op: str, width: int, count: int, seed: int = 0) -> list[np.ndarray]:
+    """
+    Returns the trit matrices [L, R, result] for count random operand
+    pairs of the given width, after all pairs of edge values. Division
+    operators get no zero divisors, since the VHDL asserts on those.
+    """
+    rng = np.random.default_rng(seed)
+    edges = _edgeTrits(width)
+    L = np.concatenate([np.repeat(edges, len(edges), axis=0),
+                        rng.integers(-1, 2, (count, width), dtype=np.int8)])
+    R = np.concatenate([np.tile(edges, (len(edges), 1)),
+                        rng.integers(-1, 2, (count, width), dtype=np.int8)])
+    if op in DIVISIONS:
+        keep = np.any(R != 0, axis=1)
+        L, R = L[keep], R[keep]
+    return [L, R, OPERATORS[op](L, R)]
+
+def writeVectors(path, op: str, columns: list[np.ndarray]):
+    widths = [c.shape[1] for c in columns]
+    header = MAGIC + op.encode('ascii').ljust(NAME_BYTES) + bytes([len(columns)] + widths)
+    header += bytes(-len(header) % 8)
+    records = np.hstack([BTritArray.fromTrits(c).data for c in columns])
+    with open(path, 'wb') as f:
+        f.write(header)
+        records.tofile(f)
+
+def readVectors(path) -> tuple[str, list[BTritArray]]:
+    """
+    Memory-maps a file written by writeVectors() and returns the
+    operator name and one BTritArray view per column.
+    """
+    raw = np.memmap(path, dtype=np.uint8, mode='r')
+    if raw[:4].tobytes() != MAGIC:
+        raise ValueError(f"{path} is not a golden vector file")
+    op = raw[4:4 + NAME_BYTES].tobytes().decode('ascii').rstrip()
+    ncolumns = int(raw[4 + NAME_BYTES])
+    widths = [int(w) for w in raw[5 + NAME_BYTES:5 + NAME_BYTES + ncolumns]]
+    start = 5 + NAME_BYTES + ncolumns
+    start += -start % 8
+    sizes = [BTritArray.bytesPerRow(w) for w in widths]
+    records = raw[start:].reshape(-1, sum(sizes))
+    offsets = np.cumsum([0] + sizes)
+    return op, [BTritArray(records[:, a:b], w) for a, b, w in zip(offsets, offsets[1:], widths)]
+
+def fileName(op: str, width: int) -> str:
+    return f"{op}_{width}.tvlg"
+
+def writeAll(directory, ops=tuple(OPERATORS), widths=(20, 27, 40), count=1000, seed=0):
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for op in ops:
+        for width in widths:
+            writeVectors(directory / fileName(op, width), op, makeVectors(op, width, count, seed))
+
+#=====================================================================
+# VHDL reader package
+#=====================================================================
+
+READER_PACKAGE = """\
+-- --------------------------------------------------------------------
+-- Title   : Golden vector file reader
+-- Notes   : Generated by python/golden_vectors.py, edit it there.
+--           Reads the *.tvlg files written by golden_vectors.py,
+--           where every vector is packed 5 trits per byte. The
+--           file must be opened as a BYTE_FILE and the header read
+--           with READ_HEADER before the first READ_VECTOR.
+-- --------------------------------------------------------------------
+
+library TVL;
+use TVL.bal_logic.all;
+
+package golden_vectors is
+
+  type BYTE_FILE is file of CHARACTER;
+  type WIDTH_ARRAY is array (NATURAL range <>) of NATURAL;
+
+  -- Checks the magic number and returns the operator name and the
+  -- width of every column. WIDTHS must have one element per column.
+  procedure READ_HEADER (file F : BYTE_FILE;
+                         OP     : out STRING(1 to 8);
+                         WIDTHS : out WIDTH_ARRAY);
+
+  -- Reads the next column of the current record into V, which
+  -- must be as wide as the column.
+  procedure READ_VECTOR (file F : BYTE_FILE; V : out BTERN_ULOGIC_VECTOR);
+
+  -- The trits of V as a string, for check messages.
+  function IMAGE (V : BTERN_ULOGIC_VECTOR) return STRING;
+
+end package;
+
+package body golden_vectors is
+
+  constant BYTE_OFFSET : NATURAL := 121;
+  constant TRITS_PER_BYTE : NATURAL := 5;
+
+  type TRIT_TABLE is array (-1 to 1) of BTERN_ULOGIC;
+  constant TO_TRIT : TRIT_TABLE := ('-', '0', '+');
+
+  function READ_BYTE (file F : BYTE_FILE) return NATURAL is
+    variable C : CHARACTER;
+  begin
+    read(F, C);
+    return CHARACTER'pos(C);
+  end function;
+
+  procedure READ_HEADER (file F : BYTE_FILE;
+                         OP     : out STRING(1 to 8);
+                         WIDTHS : out WIDTH_ARRAY) is
+    constant MAGIC : STRING(1 to 4) := "TVLG";
+    variable C : CHARACTER;
+    variable COLUMNS, HEADER_LENGTH : NATURAL;
+  begin
+    for I in MAGIC'range loop
+      read(F, C);
+      assert C = MAGIC(I)
+        report "GOLDEN_VECTORS.READ_HEADER: not a golden vector file"
+        severity FAILURE;
+    end loop;
+    for I in OP'range loop
+      read(F, OP(I));
+    end loop;
+    COLUMNS := READ_BYTE(F);
+    assert COLUMNS = WIDTHS'length
+      report "GOLDEN_VECTORS.READ_HEADER: file has " & INTEGER'image(COLUMNS)
+             & " columns, expected " & INTEGER'image(WIDTHS'length)
+      severity FAILURE;
+    for I in WIDTHS'range loop
+      WIDTHS(I) := READ_BYTE(F);
+    end loop;
+    HEADER_LENGTH := 13 + COLUMNS;
+    while HEADER_LENGTH mod 8 /= 0 loop
+      read(F, C);
+      HEADER_LENGTH := HEADER_LENGTH + 1;
+    end loop;
+  end procedure;
+
+  procedure READ_VECTOR (file F : BYTE_FILE; V : out BTERN_ULOGIC_VECTOR) is
+    constant NBYTES : NATURAL := (V'length + TRITS_PER_BYTE - 1) / TRITS_PER_BYTE;
+    variable TRITS : BTERN_ULOGIC_VECTOR(NBYTES*TRITS_PER_BYTE-1 downto 0);
+    variable VALUE, TRIT : INTEGER;
+  begin
+    for I in NBYTES-1 downto 0 loop
+      VALUE := READ_BYTE(F) - BYTE_OFFSET;
+      for J in 0 to TRITS_PER_BYTE-1 loop
+        TRIT := (VALUE + 1) mod 3 - 1;
+        TRITS(I*TRITS_PER_BYTE + J) := TO_TRIT(TRIT);
+        VALUE := (VALUE - TRIT) / 3;
+      end loop;
+    end loop;
+    V := TRITS(V'length-1 downto 0);
+  end procedure;
+
+  function IMAGE (V : BTERN_ULOGIC_VECTOR) return STRING is
+    variable RESULT : STRING(1 to V'length);
+    variable I : POSITIVE := 1;
+  begin
+    for J in V'range loop
+      RESULT(I) := BTERN_ULOGIC'image(V(J))(2);
+      I := I + 1;
+    end loop;
+    return RESULT;
+  end function;
+
+end package body;
+"""
+
+def writeReaderPackage(path):
+    Path(path).write_text(READER_PACKAGE)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write golden vector files for the bal_numeric operators.")
+    parser.add_argument("directory", type=Path, help="where to write the *.tvlg files")
+    parser.add_argument("--ops", nargs="+", choices=OPERATORS, default=list(OPERATORS))
+    parser.add_argument("--widths", nargs="+", type=int, default=[20, 27, 40])
+    parser.add_argument("--count", type=int, default=1000, help="random vectors per file")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--vhdl", type=Path, help="also write the VHDL reader package here")
+    args = parser.parse_args()
+    writeAll(args.directory, args.ops, args.widths, args.count, args.seed)
+    if args.vhdl:
+        writeReaderPackage(args.vhdl)
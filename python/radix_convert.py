@@ -1,4 +1,45 @@
+import argparse
+import concurrent.futures
+import functools
+import itertools
+import os
+import sys
+import time
+import timeit
+
+import numpy as np
+
+# Above this many trits, toBaltern and toDec switch from chunk tables
+# to splitting the number in halves by cached powers 3**(2**k).
+# Chosen from the crossover printed by benchmarkBigConversion().
+DC_THRESHOLD_TRITS = 32
+
+# Chunk tables holding every balanced ternary value of 9 and 6 trits in
+# increasing order, so the value v is found at index v + (3**n - 1) / 2.
+# toBaltern and toDec convert 9 trits per step through the first two,
+# toBalternArray 6 trits per step through the last.
+_CHUNK9_STRINGS = [''.join(t) for t in itertools.product('-0+', repeat=9)]
+_CHUNK9_VALUES = {s: i - 9841 for i, s in enumerate(_CHUNK9_STRINGS)}
+_CHUNK6_TRITS = np.array(list(itertools.product((-1, 0, 1), repeat=6)), dtype=np.int8)
+
+# log(2) / log(3), the number of trits per bit
+_TRITS_PER_BIT = 0.6309297535714574
+
+@functools.cache
+def _pow3(k: int) -> int:
+    """
+    Returns 3**(2**k), squaring the cached previous power.
+    """
+    return 3 if k == 0 else _pow3(k - 1) ** 2
+
 def toBaltern(dividend: int) -> list[str]:
+    # estimated upper bound of the number of trits
+    if dividend.bit_length() * _TRITS_PER_BIT + 2 <= DC_THRESHOLD_TRITS:
+        return _toBalternTable(dividend)
+    k = int(dividend.bit_length() * _TRITS_PER_BIT + 2).bit_length()
+    return _toBalternSplit(dividend, k, DC_THRESHOLD_TRITS).lstrip('0') or '0'
+
+def _toBalternSerial(dividend: int) -> list[str]:
     digits = []
     if dividend == 0:
         digits.append('0')
@@ -17,13 +58,45 @@ def toBaltern(dividend: int) -> list[str]:
 
     return ''.join(digits[::-1])  # Most significant digit first
 
+def _toBalternTable(dividend: int) -> str:
+    chunks = []
+    while True:
+        dividend, index = divmod(dividend + 9841, 19683)
+        chunks.append(_CHUNK9_STRINGS[index])
+        if dividend == 0:
+            break
+    return ''.join(reversed(chunks)).lstrip('0') or '0'
+
+def _toBalternSplit(dividend: int, k: int, leaf: int) -> str:
+    """
+    Returns exactly 2**k trits, dividend must fit in that width.
+    Halves of at most leaf trits are converted by chunk tables.
+    """
+    if 2**k <= leaf:
+        return _toBalternTable(dividend).rjust(2**k, '0')
+    base = _pow3(k - 1)
+    high, low = divmod(dividend + base // 2, base)
+    low -= base // 2
+    return _toBalternSplit(high, k - 1, leaf) + _toBalternSplit(low, k - 1, leaf)
+
 def toDec(balTern: list[str]) -> int:
     """
     Converts a list of balanced ternary symbols (MSB first) into
     a decimal integer 
     """
+    return _toDecSplit(balTern, DC_THRESHOLD_TRITS)
+
+def _toDecSplit(balTern: list[str], leaf: int) -> int:
+    if len(balTern) <= leaf:
+        return _toDecTable(balTern)
+    # split off the largest power of two trits below the length
+    k = (len(balTern) - 1).bit_length() - 1
+    split = len(balTern) - 2**k
+    return (_toDecSplit(balTern[:split], leaf) * _pow3(k)
+            + _toDecSplit(balTern[split:], leaf))
+
+def _toDecSerial(balTern: list[str]) -> int:
     decNum = 0
-    maxIndex = len(balTern) - 1
     num = None
     for i in range(0, len(balTern)):
         match balTern[i]:
@@ -35,15 +108,303 @@ def toDec(balTern: list[str]) -> int:
                 num = 1
             case _:
                 raise ValueError
-        decNum += num * 3**(maxIndex-i)
+        decNum = decNum * 3 + num
+    return decNum
+
+def _toDecTable(balTern: list[str]) -> int:
+    balTern = ''.join(balTern)
+    balTern = '0' * (-len(balTern) % 9) + balTern
+    decNum = 0
+    try:
+        for i in range(0, len(balTern), 9):
+            decNum = decNum * 19683 + _CHUNK9_VALUES[balTern[i:i + 9]]
+    except KeyError:
+        raise ValueError(f"invalid balanced ternary symbols in {balTern!r}") from None
     return decNum
 
+# Widest trit vector whose full range fits in a signed 64-bit integer,
+# (3**40 - 1) / 2 < 2**63 - 1 < (3**41 - 1) / 2
+MAX_ARRAY_TRITS = 40
+
+def toBalternArray(values, width: int) -> np.ndarray:
+    """
+    Converts an array of integers into an (N, width) int8 matrix of
+    trits (-1, 0, +1), most significant trit first. Values too large
+    for the given width are truncated to their least significant
+    trits, like TO_BALTERN in bal_logic. Loops over 6-trit chunks,
+    never over elements.
+    """
+    if not 0 < width <= MAX_ARRAY_TRITS:
+        raise ValueError(f"width must be in 1..{MAX_ARRAY_TRITS}, got {width}")
+    dividend = np.array(values, dtype=np.int64).ravel()
+    index = np.empty_like(dividend)
+    trits = np.empty((dividend.size, width), dtype=np.int8)
+    for stop in range(width, 0, -6):
+        # the most significant chunk may hold fewer than 6 trits
+        ntrits = min(6, stop)
+        base = 3**ntrits
+        # remainder first, so that no value near the int64 limits
+        # overflows; a remainder above base // 2 stands for the
+        # negative digit remainder - base, which carries one
+        np.remainder(dividend, base, out=index)
+        dividend //= base
+        dividend += index > base // 2
+        index += base // 2
+        np.remainder(index, base, out=index)
+        if ntrits < 6:
+            index += (729 - base) // 2
+        trits[:, stop - ntrits:stop] = _CHUNK6_TRITS[index][:, 6 - ntrits:]
+    return trits
+
+def _toBalternArraySerial(values, width: int) -> np.ndarray:
+    dividend = np.array(values, dtype=np.int64).ravel()
+    remainder = np.empty_like(dividend)
+    trits = np.empty((dividend.size, width), dtype=np.int8)
+    for i in range(width - 1, -1, -1):
+        # the remainders 0, 1, 2 are the trits 0, +1, -1; a -1 carries
+        # one into the next trit
+        np.remainder(dividend, 3, out=remainder)
+        dividend //= 3
+        dividend += remainder == 2
+        remainder[remainder == 2] = -1
+        trits[:, i] = remainder
+    return trits
+
+def toDecArray(trits: np.ndarray) -> np.ndarray:
+    """
+    Converts an (N, width) matrix of trits (-1, 0, +1), most
+    significant trit first, into an int64 array of N integers.
+    """
+    trits = np.asarray(trits)
+    if trits.ndim == 1:
+        trits = trits.reshape(1, -1)
+    width = trits.shape[1]
+    if not 0 < width <= MAX_ARRAY_TRITS:
+        raise ValueError(f"width must be in 1..{MAX_ARRAY_TRITS}, got {width}")
+    if np.any((trits < -1) | (trits > 1)):
+        raise ValueError("trit matrix may only contain -1, 0 and +1")
+    decNums = np.zeros(trits.shape[0], dtype=np.int64)
+    for i in range(width):
+        decNums *= 3
+        decNums += trits[:, i]
+    return decNums
+
+class BTritArray:
+    """
+    Compact container of N balanced ternary numbers, all with the same
+    number of trits. Every number is packed 5 trits per byte
+    (3**5 = 243), so one row takes ceil(width / 5) bytes instead of a
+    Python string per number. Each byte holds the balanced value of
+    its 5 trits offset by 121, the least significant byte last.
+
+    The bytes live in a (N, bytesPerRow) uint8 NumPy array, which may
+    be a view into a bytes object, a np.memmap or another BTritArray.
+    Slicing returns a view without copying.
+    """
+
+    TRITS_PER_BYTE = 5
+    BYTE_OFFSET = 121  # (3**5 - 1) / 2, maps the balanced range onto 0..242
+
+    # Trits of all 243 byte values, most significant trit first
+    _BYTE_TRITS = toBalternArray(np.arange(243) - 121, 5)
+    _TRIT_WEIGHTS = np.array([81, 27, 9, 3, 1], dtype=np.int16)
+
+    def __init__(self, data: np.ndarray, width: int):
+        data = np.asarray(data, dtype=np.uint8)
+        if width < 1:
+            raise ValueError(f"width must be positive, got {width}")
+        nbytes = -(-width // self.TRITS_PER_BYTE)
+        if data.ndim != 2 or data.shape[1] != nbytes:
+            raise ValueError(f"expected a (N, {nbytes}) array for width {width}, got {data.shape}")
+        self.data = data
+        self.width = width
+
+    @staticmethod
+    def bytesPerRow(width: int) -> int:
+        return -(-width // BTritArray.TRITS_PER_BYTE)
+
+    @classmethod
+    def zeros(cls, length: int, width: int) -> 'BTritArray':
+        data = np.full((length, cls.bytesPerRow(width)), cls.BYTE_OFFSET, dtype=np.uint8)
+        return cls(data, width)
+
+    @classmethod
+    def fromInts(cls, values, width: int) -> 'BTritArray':
+        """
+        Packs integers directly, 5 trits per step, truncating values
+        too large for the width like toBalternArray does.
+        """
+        if not 0 < width <= MAX_ARRAY_TRITS:
+            raise ValueError(f"width must be in 1..{MAX_ARRAY_TRITS}, got {width}")
+        dividend = np.array(values, dtype=np.int64).ravel()
+        nbytes = cls.bytesPerRow(width)
+        data = np.empty((dividend.size, nbytes), dtype=np.uint8)
+        remainder = np.empty_like(dividend)
+        for i in range(nbytes - 1, -1, -1):
+            # the most significant byte may hold fewer than 5 trits
+            ntrits = width - (nbytes - 1) * cls.TRITS_PER_BYTE if i == 0 else cls.TRITS_PER_BYTE
+            base = 3**ntrits
+            np.add(dividend, base // 2, out=remainder)
+            np.remainder(remainder, base, out=remainder)
+            remainder -= base // 2
+            data[:, i] = remainder + cls.BYTE_OFFSET
+            dividend -= remainder
+            dividend //= base
+        return cls(data, width)
+
+    @classmethod
+    def fromTrits(cls, trits: np.ndarray) -> 'BTritArray':
+        """
+        Packs an (N, width) matrix of trits (-1, 0, +1), most
+        significant trit first, as returned by toBalternArray.
+        """
+        trits = np.asarray(trits, dtype=np.int8)
+        if trits.ndim == 1:
+            trits = trits.reshape(1, -1)
+        length, width = trits.shape
+        if np.any((trits < -1) | (trits > 1)):
+            raise ValueError("trit matrix may only contain -1, 0 and +1")
+        nbytes = cls.bytesPerRow(width)
+        padded = np.zeros((length, nbytes * cls.TRITS_PER_BYTE), dtype=np.int16)
+        padded[:, padded.shape[1] - width:] = trits
+        packed = padded.reshape(length, nbytes, cls.TRITS_PER_BYTE) @ cls._TRIT_WEIGHTS
+        return cls((packed + cls.BYTE_OFFSET).astype(np.uint8), width)
+
+    @classmethod
+    def fromStrings(cls, strings: list[str], width: int = None) -> 'BTritArray':
+        """
+        Packs balanced ternary strings such as those returned by
+        toBaltern. Shorter strings are padded with leading zeros,
+        and the width defaults to the longest string.
+        """
+        if width is None:
+            width = max((len(s) for s in strings), default=1)
+        if any(len(s) > width for s in strings):
+            raise ValueError(f"string longer than {width} trits")
+        raw = ''.join(s.rjust(width, '0') for s in strings).encode('ascii')
+        codes = np.frombuffer(raw, dtype=np.uint8).reshape(len(strings), width)
+        trits = _ASCII_TRITS[codes]
+        if np.any(trits == _BAD_TRIT):
+            raise ValueError("strings may only contain '-', '0' and '+'")
+        return cls.fromTrits(trits)
+
+    @classmethod
+    def fromBuffer(cls, buffer, width: int) -> 'BTritArray':
+        """
+        Wraps any object supporting the buffer protocol (bytes, mmap,
+        memoryview, ...) without copying.
+        """
+        data = np.frombuffer(buffer, dtype=np.uint8)
+        return cls(data.reshape(-1, cls.bytesPerRow(width)), width)
+
+    @classmethod
+    def load(cls, path, width: int, mode: str = 'r') -> 'BTritArray':
+        """
+        Memory-maps a file written by save(). Use mode 'r+' to modify
+        the file in place, or 'c' for copy-on-write.
+        """
+        data = np.memmap(path, dtype=np.uint8, mode=mode)
+        return cls(data.reshape(-1, cls.bytesPerRow(width)), width)
+
+    def save(self, path):
+        np.ascontiguousarray(self.data).tofile(path)
+
+    def memoryview(self) -> memoryview:
+        return memoryview(np.ascontiguousarray(self.data))
+
+    def toInts(self) -> np.ndarray:
+        if self.width > MAX_ARRAY_TRITS:
+            raise ValueError(f"width {self.width} does not fit in int64, use toStrings")
+        decNums = np.zeros(len(self), dtype=np.int64)
+        for i in range(self.data.shape[1]):
+            decNums *= 243
+            decNums += self.data[:, i]
+            decNums -= self.BYTE_OFFSET
+        return decNums
+
+    def toTrits(self) -> np.ndarray:
+        trits = self._BYTE_TRITS[self.data].reshape(len(self), -1)
+        return trits[:, trits.shape[1] - self.width:]
+
+    def toStrings(self) -> list[str]:
+        """
+        Returns the numbers as toBaltern strings, without leading zeros.
+        """
+        raw = _TRIT_ASCII[self.toTrits() + 1].tobytes().decode('ascii')
+        return [raw[i:i + self.width].lstrip('0') or '0'
+                for i in range(0, len(raw), self.width)]
+
+    def __len__(self) -> int:
+        return self.data.shape[0]
+
+    def __iter__(self):
+        return iter(self.toStrings())
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return BTritArray(self.data[key], self.width)
+        return BTritArray(self.data[key][np.newaxis], self.width).toStrings()[0]
+
+    def __setitem__(self, key, value):
+        if isinstance(value, str):
+            value = BTritArray.fromStrings([value], self.width)
+        elif not isinstance(value, BTritArray):
+            value = BTritArray.fromInts(np.atleast_1d(value), self.width)
+        elif value.width != self.width:
+            raise ValueError(f"width mismatch: {value.width} /= {self.width}")
+        self.data[key] = value.data[0] if not isinstance(key, slice) else value.data
+
+    def __repr__(self) -> str:
+        return f"BTritArray(length={len(self)}, width={self.width})"
+
+_BAD_TRIT = 2
+_ASCII_TRITS = np.full(256, _BAD_TRIT, dtype=np.int8)
+_ASCII_TRITS[[ord('-'), ord('0'), ord('+')]] = [-1, 0, 1]
+_TRIT_ASCII = np.frombuffer(b'-0+', dtype=np.uint8)
+
+# Next trit when counting up; '+' wraps to '-' and carries.
+_NEXT_TRIT = {ord('-'): ord('0'), ord('0'): ord('+')}
+
+def iterBalTern(start: int, stop: int, width: int = None):
+    """
+    Yields the balanced ternary integers from start to stop. Each value
+    is made by incrementing the trits of the previous one, which takes
+    amortized O(1) trit updates instead of a full conversion. Without a
+    width the values are stripped of leading zeros, like toBaltern.
+    """
+    bound = max(abs(start), abs(stop))
+    if width is None:
+        digits = bytearray(toBaltern(start).rjust(len(toBaltern(bound)), '0'), 'ascii')
+    elif bound > 3**width // 2:
+        raise ValueError(f"range {start}..{stop} does not fit in {width} trits")
+    else:
+        digits = bytearray(toBaltern(start).rjust(width, '0'), 'ascii')
+    plus, minus = ord('+'), ord('-')
+    for _ in range(start, stop + 1):
+        yield (digits.decode().lstrip('0') or '0') if width is None else digits.decode()
+        i = len(digits) - 1
+        while i >= 0 and digits[i] == plus:
+            digits[i] = minus
+            i -= 1
+        if i >= 0:
+            digits[i] = _NEXT_TRIT[digits[i]]
+
+def writeBalTern(start: int, stop: int, sink=None, width: int = None, linesPerWrite: int = 65536):
+    """
+    Writes the balanced ternary integers from start to stop to the text
+    stream sink (standard output by default), one per line. Lines are
+    joined and written linesPerWrite at a time.
+    """
+    sink = sink or sys.stdout
+    values = iterBalTern(start, stop, width)
+    while lines := list(itertools.islice(values, linesPerWrite)):
+        sink.write('\n'.join(lines) + '\n')
+
 def showBalTern(start:int, stop: int):
     """
     Prints a sequence of balanced ternary integers from start to stop.
     """
-    for i in range(start, stop + 1):
-        print(toBaltern(i))
+    writeBalTern(start, stop)
     print('DONE')
 
 def addBalTern(num1: list[str], num2: list[str]):
@@ -59,7 +420,276 @@ def verifyToBaltern ():
         if dnum != i:
             raise ValueError(f"Calculated Btern num: {bnum} was not equal to decimal: {i}")
 
+def verifyToBalternArray():
+    values = np.arange(-364, 365)
+    trits = toBalternArray(values, 6)
+    for i, row in zip(values, trits):
+        bnum = ''.join('-0+'[t + 1] for t in row).lstrip('0') or '0'
+        if bnum != toBaltern(int(i)):
+            raise ValueError(f"Calculated Btern row: {bnum} was not equal to toBaltern({i})")
+    if not np.array_equal(toDecArray(trits), values):
+        raise ValueError("toDecArray did not invert toBalternArray")
+
+def verifyBTritArray():
+    values = np.arange(-364, 365)
+    packed = BTritArray.fromInts(values, 6)
+    if not np.array_equal(packed.toInts(), values):
+        raise ValueError("BTritArray.toInts did not invert fromInts")
+    if packed.toStrings() != [toBaltern(int(i)) for i in values]:
+        raise ValueError("BTritArray.toStrings did not match toBaltern")
+    if BTritArray.fromStrings(packed.toStrings(), 6).data.tobytes() != packed.data.tobytes():
+        raise ValueError("BTritArray.fromStrings did not invert toStrings")
+
+def verifyBigConversion():
+    for width in (DC_THRESHOLD_TRITS - 1, DC_THRESHOLD_TRITS + 1, 1000, 4097):
+        for i in (3**width // 2, -(3**width // 2), 3**(width - 1) + 1, 0):
+            bnum = toBaltern(i)
+            if _toBalternSerial(i) != bnum or toDec(bnum) != i:
+                raise ValueError(f"Split conversion of {width}-trit value {i} failed")
+
+def _verifyShard(lo: int, hi: int, width: int, stride: int):
+    """
+    Checks the values lo..hi-1 at the given width and returns the first
+    one that converts wrongly, or None.
+    """
+    values = np.arange(lo, hi, dtype=np.int64)
+    trits = toBalternArray(values, width)
+    bad = ~np.all(trits == _toBalternArraySerial(values, width), axis=1)
+    bad |= toDecArray(trits) != values
+    bad |= BTritArray.fromTrits(trits).toInts() != values
+    if bad.any():
+        return int(values[bad.argmax()])
+    for i in range(0, hi - lo, stride):
+        bnum = ''.join('-0+'[t + 1] for t in trits[i]).lstrip('0') or '0'
+        if toBaltern(lo + i) != bnum or toDec(bnum) != lo + i:
+            return lo + i
+    return None
+
+def verifyToBalternParallel(width: int = 20, shardSize: int = 1 << 20, workers: int = None, stride: int = 997):
+    """
+    Exhaustively checks every value of the given width: toBalternArray
+    against the per-trit reference, toDecArray and BTritArray against
+    the values, and every stride-th value through toBaltern and toDec.
+    Shards of shardSize values run on a process pool while progress and
+    throughput are printed. Raises ValueError on the first mismatch.
+    """
+    bound = 3**width // 2
+    if width > MAX_ARRAY_TRITS:
+        raise ValueError(f"width must be in 1..{MAX_ARRAY_TRITS}, got {width}")
+    workers = workers or os.cpu_count()
+    shards = iter(range(-bound, bound + 1, shardSize))
+    total, done, begin = 2 * bound + 1, 0, time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        pending = {}
+        # keep only a few shards per worker in flight
+        for lo in itertools.islice(shards, 4 * workers):
+            pending[pool.submit(_verifyShard, lo, min(lo + shardSize, bound + 1), width, stride)] = lo
+        while pending:
+            finished, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                lo = pending.pop(future)
+                failed = future.result()
+                if failed is not None:
+                    for other in pending:
+                        other.cancel()
+                    raise ValueError(f"{width}-trit conversion of {failed} failed")
+                done += min(lo + shardSize, bound + 1) - lo
+                for lo in itertools.islice(shards, 1):
+                    pending[pool.submit(_verifyShard, lo, min(lo + shardSize, bound + 1), width, stride)] = lo
+            elapsed = time.perf_counter() - begin
+            print(f"\r{width} trits: {done}/{total} ({100 * done / total:.1f} %), {done / elapsed / 1e6:.1f} M values/s", end='', flush=True)
+    print()
+
+def verifyIterBalTern():
+    if list(iterBalTern(-400, 400)) != [toBaltern(i) for i in range(-400, 401)]:
+        raise ValueError("iterBalTern did not match toBaltern")
+    if list(iterBalTern(-364, 364, 6)) != [toBaltern(i).rjust(6, '0') for i in range(-364, 365)]:
+        raise ValueError("iterBalTern with a width did not match toBaltern")
+
+def verifyChunkConversion():
+    for i in range(-3**9, 3**9 + 1):
+        bnum = _toBalternSerial(i)
+        if _toBalternTable(i) != bnum or _toDecTable(bnum) != i:
+            raise ValueError(f"Chunk table conversion of {i} failed")
+    values = np.random.default_rng(0).integers(-(3**MAX_ARRAY_TRITS // 2), 3**MAX_ARRAY_TRITS // 2, 10000)
+    for width in range(1, MAX_ARRAY_TRITS + 1):
+        if not np.array_equal(toBalternArray(values, width), _toBalternArraySerial(values, width)):
+            raise ValueError(f"Chunk table toBalternArray failed at width {width}")
+
+def benchmarkChunkConversion(widths=(6, 9, 20, 27, 40), count=1000000):
+    """
+    Prints the time per value of the per-trit and the chunk table
+    algorithms, for single numbers and for arrays of count numbers.
+    """
+    rng = np.random.default_rng(0)
+    print(f"{'trits':>7} {'toBaltern trit':>15} {'table':>10} {'toDec trit':>11} {'table':>10} {'array trit':>11} {'table':>10}")
+    for width in widths:
+        values = rng.integers(-(3**width // 2), 3**width // 2 + 1, count)
+        nums = [int(i) for i in values[:1000]]
+        bnums = [_toBalternSerial(i) for i in nums]
+        times = [timeit.timeit(f, number=1) / len(nums) for f in (
+            lambda: [_toBalternSerial(i) for i in nums],
+            lambda: [_toBalternTable(i) for i in nums],
+            lambda: [_toDecSerial(b) for b in bnums],
+            lambda: [_toDecTable(b) for b in bnums])]
+        times += [timeit.timeit(f, number=1) / count for f in (
+            lambda: _toBalternArraySerial(values, width),
+            lambda: toBalternArray(values, width))]
+        print(f"{width:>7} " + " ".join(f"{t * 1e9:>{w}.0f}" for t, w in zip(times, (12, 10, 11, 10, 11, 10))) + "  ns")
+
+def benchmarkBigConversion(widths=(16, 32, 64, 128, 256, 512, 1024, 4096, 16384), leaf=None):
+    """
+    Prints the time per conversion of the serial and the split (with
+    chunk table leaves) algorithms, showing where DC_THRESHOLD_TRITS
+    should lie.
+    """
+    leaf = leaf or DC_THRESHOLD_TRITS
+    print(f"{'trits':>7} {'toBaltern serial':>17} {'split':>10} {'toDec serial':>13} {'split':>10}")
+    for width in widths:
+        num = 3**width // 3 + 12345
+        bnum = _toBalternSerial(num)
+        runs = max(1, 20000 // width)
+        times = [timeit.timeit(f, number=runs) / runs for f in (
+            lambda: _toBalternSerial(num),
+            lambda: _toBalternSplit(num, (width - 1).bit_length(), leaf),
+            lambda: _toDecSerial(bnum),
+            lambda: _toDecSplit(bnum, leaf))]
+        print(f"{width:>7} " + " ".join(f"{t * 1e6:>{w}.1f}" for t, w in zip(times, (14, 10, 10, 10))) + "  us")
+
+#=====================================================================
+# Stream conversion
+#=====================================================================
+# Formats: 'dec' and 'bt' are whitespace separated decimal and balanced
+# ternary numbers, written one per line. 'packed' is BTritArray rows
+# back to back, as written by BTritArray.save(). Every chunk is
+# converted through an (N, width) trit matrix.
+
+FORMATS = ('dec', 'bt', 'packed')
+
+def _readChunks(src, chunkBytes: int, rowBytes: int = None):
+    """
+    Yields chunks of about chunkBytes from the binary stream src. Text
+    chunks end on whitespace; binary chunks hold whole rows of rowBytes.
+    """
+    if rowBytes:
+        chunkBytes = max(chunkBytes - chunkBytes % rowBytes, rowBytes)
+    rest = b''
+    while chunk := src.read(chunkBytes):
+        chunk = rest + chunk
+        if rowBytes:
+            cut = len(chunk) - len(chunk) % rowBytes
+        else:
+            cut = max(chunk.rfind(b'\n'), chunk.rfind(b' '), chunk.rfind(b'\t')) + 1
+        rest = chunk[cut:]
+        yield chunk[:cut]
+    if rowBytes and rest:
+        raise ValueError(f"packed input ends with a partial row of {len(rest)} bytes")
+    if rest:
+        yield rest
+
+def _tokensToTrits(tokens: list[bytes], width: int) -> np.ndarray:
+    if any(len(t) > width for t in tokens):
+        raise ValueError(f"balanced ternary number longer than {width} trits")
+    raw = b''.join(t.rjust(width, b'0') for t in tokens)
+    trits = _ASCII_TRITS[np.frombuffer(raw, dtype=np.uint8)].reshape(len(tokens), width)
+    if np.any(trits == _BAD_TRIT):
+        raise ValueError("balanced ternary input may only contain '-', '0' and '+'")
+    return trits
+
+# largest value of MAX_ARRAY_TRITS trits, below 2**63
+_MAX_ARRAY_VALUE = (3**MAX_ARRAY_TRITS - 1) // 2
+
+def _decimal(token: bytes) -> int:
+    try:
+        return int(token)
+    except ValueError:
+        raise ValueError(f"not a decimal integer: {token.decode('ascii', 'replace')!r}") from None
+
+def _decodeChunk(chunk: bytes, fromFormat: str, width: int) -> np.ndarray:
+    if fromFormat == 'packed':
+        return BTritArray.fromBuffer(chunk, width).toTrits()
+    tokens = chunk.split()
+    if fromFormat == 'bt':
+        return _tokensToTrits(tokens, width or max((len(t) for t in tokens), default=1))
+    if (width or MAX_ARRAY_TRITS) <= MAX_ARRAY_TRITS:
+        try:
+            values = np.array(tokens).astype(np.int64)
+        except (ValueError, OverflowError):
+            values = None    # malformed or beyond int64, see below
+        if values is not None and np.all((values >= -_MAX_ARRAY_VALUE) & (values <= _MAX_ARRAY_VALUE)):
+            return toBalternArray(values, width or MAX_ARRAY_TRITS)
+    # values too wide for the array path go through the bignum one,
+    # truncated to a width of the array path like TO_BALTERN
+    strings = [toBaltern(_decimal(t)).encode('ascii') for t in tokens]
+    if width and width <= MAX_ARRAY_TRITS:
+        strings = [s[-width:] for s in strings]
+    return _tokensToTrits(strings, width or max((len(s) for s in strings), default=1))
+
+def _encodeChunk(trits: np.ndarray, toFormat: str, fixedWidth: bool) -> bytes:
+    if toFormat == 'packed':
+        return BTritArray.fromTrits(trits).data.tobytes()
+    if toFormat == 'bt' and fixedWidth:
+        lines = np.empty((trits.shape[0], trits.shape[1] + 1), dtype=np.uint8)
+        lines[:, :-1] = _TRIT_ASCII[trits + 1]
+        lines[:, -1] = ord('\n')
+        return lines.tobytes()
+    if toFormat == 'dec' and trits.shape[1] <= MAX_ARRAY_TRITS:
+        strings = map(str, toDecArray(trits).tolist())
+    else:
+        strings = BTritArray.fromTrits(trits).toStrings()
+        if toFormat == 'dec':
+            strings = map(str, map(toDec, strings))
+    return ''.join(s + '\n' for s in strings).encode('ascii')
+
+def convertStream(src, dst, fromFormat: str, toFormat: str, width: int = None, chunkBytes: int = 1 << 24):
+    """
+    Converts the binary stream src from one format to another and
+    writes the result to the binary stream dst, chunkBytes of input at
+    a time. The width is needed for packed data; with a width, 'bt'
+    output is padded to it, otherwise leading zeros are stripped.
+    """
+    if 'packed' in (fromFormat, toFormat) and not width:
+        raise ValueError("packed data needs a width")
+    rowBytes = BTritArray.bytesPerRow(width) if fromFormat == 'packed' else None
+    for chunk in _readChunks(src, chunkBytes, rowBytes):
+        trits = _decodeChunk(chunk, fromFormat, width)
+        if len(trits):
+            dst.write(_encodeChunk(trits, toFormat, width is not None))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Convert streams of numbers between decimal, balanced ternary and packed trits.")
+    parser.add_argument("files", nargs="*", type=argparse.FileType('rb'), default=[sys.stdin.buffer],
+                        help="input files, standard input by default")
+    parser.add_argument("-f", "--from", dest="fromFormat", choices=FORMATS, default='dec')
+    parser.add_argument("-t", "--to", dest="toFormat", choices=FORMATS, default='bt')
+    parser.add_argument("-w", "--width", type=int, help="number of trits, required for packed data")
+    parser.add_argument("-o", "--output", type=argparse.FileType('wb'), default=sys.stdout.buffer)
+    parser.add_argument("--chunk-bytes", type=int, default=1 << 24)
+    parser.add_argument("--verify", action="store_true", help="run the self-checks instead")
+    parser.add_argument("--verify-width", type=int, metavar="WIDTH",
+                        help="exhaustively check every value of WIDTH trits")
+    args = parser.parse_args(argv)
+    if args.width is not None and args.width < 1:
+        parser.error(f"--width must be at least 1, got {args.width}")
+    if args.verify or args.verify_width:
+        verifyToBaltern()
+        verifyToBalternArray()
+        verifyBTritArray()
+        verifyBigConversion()
+        verifyChunkConversion()
+        verifyIterBalTern()
+        if args.verify_width:
+            verifyToBalternParallel(args.verify_width)
+        return
+    try:
+        for src in args.files:
+            convertStream(src, args.output, args.fromFormat, args.toFormat, args.width, args.chunk_bytes)
+        args.output.flush()
+    except ValueError as e:
+        parser.error(str(e))
+
 
 if __name__ == "__main__":
-    
+    main()
 
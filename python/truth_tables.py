@@ -0,0 +1,121 @@
+"""
+Reference model of the logic operators in TVL.bal_logic and
+TVL.kleene_pkg. The lookup tables are parsed from the package bodies
+the first time they are needed, so the model follows any change to
+the VHDL. Values are held as uint8 arrays of enumeration positions,
+and an operator over N elements is one fancy-indexing step.
+"""
+
+import functools
+import re
+from pathlib import Path
+
+import numpy as np
+
+LIB = Path(__file__).resolve().parent.parent / "tvl_lib" / "lib"
+
+# Enumeration literals in positional order, and where to parse them from
+PACKAGES = {
+    'bal_logic': (('U', 'X', '-', '0', '+', 'Z', 'W', 'L', 'M', 'H', 'D'),
+                  "bal_logic-body.vhdl", r"'(.)'"),
+    'kleene_pkg': (('FALSE', 'UNK', 'TRUE'),
+                   "kleene_pkg-body.vhdl", r"\b(FALSE|UNK|TRUE)\b"),
+}
+
+_CONSTANT = re.compile(r"constant\s+(\w+)\s*:\s*\w+\s*:=\s*\((.*?)\)\s*;", re.DOTALL | re.IGNORECASE)
+
+@functools.cache
+def loadTables(package: str = 'bal_logic') -> dict[str, np.ndarray]:
+    """
+    Returns every lookup table constant of the package body, keyed by
+    its name without the '_table' suffix: 1-arity tables as arrays of
+    length n, 2-arity tables as (n, n) arrays, n being the number of
+    enumeration literals.
+    """
+    literals, fileName, literal = PACKAGES[package]
+    position = {l: i for i, l in enumerate(literals)}
+    source = re.sub(r"--.*", "", (LIB / fileName).read_text())
+    tables = {}
+    for name, body in _CONSTANT.findall(source):
+        values = re.findall(literal, body)
+        if len(values) not in (len(literals), len(literals)**2):
+            continue
+        table = np.array([position[v] for v in values], dtype=np.uint8)
+        if len(values) == len(literals)**2:
+            table = table.reshape(len(literals), len(literals))
+        tables[name.lower().removesuffix('_table')] = table
+    return tables
+
+def encode(values, package: str = 'bal_logic') -> np.ndarray:
+    """
+    Converts a string of BTERN_ULOGIC characters, or a sequence of
+    KLEENE names, into an array of enumeration positions.
+    """
+    literals = PACKAGES[package][0]
+    if package == 'bal_logic' and isinstance(values, str):
+        lookup = np.full(256, 255, dtype=np.uint8)
+        lookup[[ord(l) for l in literals]] = np.arange(len(literals))
+        codes = lookup[np.frombuffer(values.encode('ascii'), dtype=np.uint8)]
+        if np.any(codes == 255):
+            raise ValueError(f"invalid BTERN_ULOGIC characters in {values!r}")
+        return codes
+    position = {l: i for i, l in enumerate(literals)}
+    try:
+        return np.array([position[v] for v in values], dtype=np.uint8)
+    except KeyError as e:
+        raise ValueError(f"invalid {package} literal {e}") from None
+
+def decode(codes: np.ndarray, package: str = 'bal_logic'):
+    """
+    Inverse of encode(): a string for bal_logic, a list for kleene_pkg.
+    """
+    literals = PACKAGES[package][0]
+    if package == 'bal_logic':
+        return np.frombuffer(''.join(literals).encode('ascii'), dtype=np.uint8)[codes].tobytes().decode('ascii')
+    return [literals[c] for c in codes]
+
+def evaluate(name: str, L: np.ndarray, R: np.ndarray = None, package: str = 'bal_logic') -> np.ndarray:
+    """
+    Applies the operator of table name elementwise to the position
+    arrays L (and R for 2-arity operators), like the vector overloads
+    in VHDL. For example evaluate('sum', L, R) mirrors SUM(L, R).
+    """
+    table = loadTables(package)[name]
+    if table.ndim == 1:
+        return table[L]
+    n = table.shape[0]
+    # n*n <= 121 fits the uint8 index
+    return table.ravel()[np.asarray(L, dtype=np.uint8) * n + np.asarray(R, dtype=np.uint8)]
+
+def verifyTruthTables():
+    """
+    Checks the arithmetic tables against integer arithmetic on the
+    strong values, and that the kleene_pkg tables match the bal_logic
+    ones with FALSE, UNK and TRUE standing for -, 0 and +.
+    """
+    bal, kleene = loadTables('bal_logic'), loadTables('kleene_pkg')
+    strong = encode('-0+')
+    trits = np.array([-1, 0, 1])
+    L, R = (v.ravel() for v in np.meshgrid(strong, strong, indexing='ij'))
+    l, r = (v.ravel() for v in np.meshgrid(trits, trits, indexing='ij'))
+    checks = {
+        'sum': (l + r + 1) % 3 - 1,
+        'mul': l * r,
+        'min': np.minimum(l, r),
+        'max': np.maximum(l, r),
+        'con': np.where(l == r, l, 0),
+        'any': np.sign(l + r),
+    }
+    for name, expected in checks.items():
+        if not np.array_equal(evaluate(name, L, R), expected + 3):
+            raise ValueError(f"bal_logic {name}_table does not match integer arithmetic")
+    for name, table in kleene.items():
+        if name in bal:
+            if table.ndim == 1 and not np.array_equal(bal[name][strong], table + 2):
+                raise ValueError(f"kleene_pkg {name}_table differs from bal_logic")
+            if table.ndim == 2 and not np.array_equal(bal[name][np.ix_(strong, strong)], table + 2):
+                raise ValueError(f"kleene_pkg {name}_table differs from bal_logic")
+
+
+if __name__ == "__main__":
+    verifyTruthTables()
@@ -0,0 +1,276 @@
+"""
+Indexed waveform store for random access to long simulations.
+
+convert() streams a .ghw file through ghw_reader.GhwReader into a
+.tvlw store, where the changes of every signal are kept in chunks of
+their own, each zlib-compressed and listed in an index with its time
+span. WaveformStore finds the chunks covering a time by bisecting the
+index, O(log n) in the number of chunks, and decompresses only those
+chunks of only the signals asked for.
+
+Ternary vectors without metavalues are packed 5 trits per byte like
+BTritArray rows; those with metavalues are kept as their characters;
+any other values (integers, reals, records, other enumerations) as
+JSON. The conversion holds at most one unfinished chunk per signal.
+
+File layout (*.tvlw):
+    4 bytes   magic 'TVLW'
+    4 bytes   version, little endian
+    chunks    zlib streams, each holding the int64 time differences of
+              its changes (the first relative to the chunk's first
+              time), then their values
+    index     zlib-compressed JSON: per signal its type, width and
+              chunks as [first time, last time, offset, size, changes,
+              encoding]
+    16 bytes  offset of the index, little endian, then 'TVLW' and
+              4 zero bytes
+Times are femtoseconds, as in the .ghw file.
+
+    python python/waveform_store.py convert sim.ghw sim.tvlw
+    python python/waveform_store.py show sim.tvlw -s /top/sum --from 10us --to 12us
+"""
+
+import argparse
+import bisect
+import json
+import os
+import struct
+import sys
+import tempfile
+import zlib
+
+import numpy as np
+
+from ghw_reader import FIXTURE, GhwReader, parseTime
+from radix_convert import BTritArray
+
+MAGIC = b'TVLW'
+VERSION = 1
+
+_FOOTER = struct.Struct('<Q4s4x')
+
+_TRIT_CHARS = np.frombuffer(b'-0+', dtype=np.uint8)
+
+def _encodeValues(values: list, width: int, ternary: bool) -> tuple[str, bytes]:
+    if ternary and all(isinstance(v, str) and len(v) == width for v in values):
+        try:
+            return 'packed', BTritArray.fromStrings(values, width).data.tobytes()
+        except ValueError:
+            return 'chars', ''.join(values).encode('ascii')
+    return 'json', json.dumps(values).encode()
+
+def _decodeValues(data: bytes, count: int, width: int, encoding: str) -> list:
+    if encoding == 'packed':
+        trits = BTritArray.fromBuffer(data, width).toTrits()
+        raw = _TRIT_CHARS[trits + 1].tobytes().decode('ascii')
+    elif encoding == 'chars':
+        raw = data.decode('ascii')
+    else:
+        return json.loads(data)
+    return [raw[i:i + width] for i in range(0, count * width, width)]
+
+class _ChunkWriter:
+    """
+    The unfinished chunk of one signal during conversion.
+    """
+
+    def __init__(self, signal):
+        self.width = len(signal.ids)
+        self.ternary = signal.ternary
+        self.entry = {'type': signal.typeName, 'width': self.width,
+                      'ternary': self.ternary, 'chunks': []}
+        self.times = []
+        self.values = []
+
+    def flush(self, out):
+        if not self.times:
+            return
+        times = np.array(self.times, dtype=np.int64)
+        deltas = np.diff(times, prepend=times[0])
+        encoding, values = _encodeValues(self.values, self.width, self.ternary)
+        data = zlib.compress(deltas.tobytes() + values)
+        self.entry['chunks'].append([self.times[0], self.times[-1], out.tell(), len(data),
+                                     len(self.times), encoding])
+        out.write(data)
+        self.times.clear()
+        self.values.clear()
+
+def convert(ghwPath, storePath, names=None, chunkChanges: int = 4096) -> dict:
+    """
+    Converts the selected signals of a .ghw file, all by default, and
+    returns the index written. Chunks hold up to chunkChanges changes.
+    """
+    reader = GhwReader(ghwPath)
+    writers = {s.path: _ChunkWriter(s) for s in reader.select(names)}
+    with open(storePath, 'wb') as out:
+        out.write(MAGIC + struct.pack('<I', VERSION))
+        for time, path, value in reader.changes(names):
+            writer = writers[path]
+            writer.times.append(time)
+            writer.values.append(value)
+            if len(writer.times) >= chunkChanges:
+                writer.flush(out)
+        for writer in writers.values():
+            writer.flush(out)
+        index = {path: writer.entry for path, writer in writers.items()}
+        offset = out.tell()
+        out.write(zlib.compress(json.dumps(index).encode()))
+        out.write(_FOOTER.pack(offset, MAGIC))
+    return index
+
+class WaveformStore:
+    """
+    A .tvlw file opened for reading. Only the index is loaded; chunks
+    are read and decompressed when a query needs them, and the last
+    chunk read of every signal is kept.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.file = open(path, 'rb')
+        if self.file.read(8) != MAGIC + struct.pack('<I', VERSION):
+            raise ValueError(f"{path}: not a version {VERSION} TVLW file")
+        self.file.seek(-_FOOTER.size, 2)
+        end = self.file.tell()
+        offset, magic = _FOOTER.unpack(self.file.read(_FOOTER.size))
+        if magic != MAGIC:
+            raise ValueError(f"{path}: missing index")
+        self.file.seek(offset)
+        self.signals = json.loads(zlib.decompress(self.file.read(end - offset)))
+        # first and last times of the chunks, for bisecting
+        self._first = {p: [c[0] for c in s['chunks']] for p, s in self.signals.items()}
+        self._last = {p: [c[1] for c in s['chunks']] for p, s in self.signals.items()}
+        self._cache = {}
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def chunk(self, path: str, i: int) -> tuple[np.ndarray, list]:
+        """
+        The times and values of the i-th chunk of a signal.
+        """
+        cached = self._cache.get(path)
+        if cached is not None and cached[0] == i:
+            return cached[1]
+        signal = self.signals[path]
+        first, _, offset, size, count, encoding = signal['chunks'][i]
+        self.file.seek(offset)
+        data = zlib.decompress(self.file.read(size))
+        times = np.frombuffer(data[:8 * count], dtype=np.int64).cumsum() + first
+        values = _decodeValues(data[8 * count:], count, signal['width'], encoding)
+        self._cache[path] = (i, (times, values))
+        return times, values
+
+    def valueAt(self, path: str, time: int):
+        """
+        The value of a signal at a time: its last change at or before
+        it, or None if it has not been set yet.
+        """
+        i = bisect.bisect_right(self._first[path], time) - 1
+        if i < 0:
+            return None
+        times, values = self.chunk(path, i)
+        return values[int(np.searchsorted(times, time, side='right')) - 1]
+
+    def window(self, path: str, start: int, end: int, initial: bool = True):
+        """
+        Yields (time, value) for the changes of a signal from start up
+        to, not including, end. With initial, the value in force at
+        start comes first, as (start, value), unless it changes there.
+        """
+        changes = self._changes(path, start, end)
+        first = next(changes, None)
+        if initial and (first is None or first[0] != start):
+            before = self.valueAt(path, start - 1)
+            if before is not None:
+                yield start, before
+        if first is not None:
+            yield first
+            yield from changes
+
+    def _changes(self, path: str, start: int, end: int):
+        first = self._first[path]
+        i = bisect.bisect_left(self._last[path], start)
+        while i < len(first) and first[i] < end:
+            times, values = self.chunk(path, i)
+            lo = int(np.searchsorted(times, start, side='left'))
+            hi = int(np.searchsorted(times, end, side='left'))
+            for j in range(lo, hi):
+                yield int(times[j]), values[j]
+            i += 1
+
+def verifyWaveformStore(path: str = FIXTURE):
+    """
+    Converts the fixture of ghw_reader with one change per chunk, so
+    that vectors without metavalues are packed, and with all changes
+    in one chunk, and checks every change and the values between them
+    against the reader.
+    """
+    expected = {}
+    for time, signal, value in GhwReader(path).changes():
+        expected.setdefault(signal, []).append((time, value))
+    with tempfile.TemporaryDirectory() as tmp:
+        storePath = os.path.join(tmp, 'fixture.tvlw')
+        for chunkChanges in (1, 4096):
+            convert(path, storePath, chunkChanges=chunkChanges)
+            with WaveformStore(storePath) as store:
+                for signal, changes in expected.items():
+                    if list(store.window(signal, 0, sys.maxsize)) != changes:
+                        raise ValueError(f"{signal}: changes differ from the reader's, {chunkChanges} per chunk")
+                    # the value a time settles to, after its delta cycles
+                    settled = list(dict(changes).items())
+                    ends = [time - 1 for time, _ in settled[1:]] + [settled[-1][0] + 1]
+                    for (time, value), end in zip(settled, ends):
+                        if store.valueAt(signal, time) != value or store.valueAt(signal, end) != value:
+                            raise ValueError(f"{signal}: wrong value at {time} fs, {chunkChanges} changes per chunk")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Convert GHW waveforms to indexed .tvlw stores and query them.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    conv = commands.add_parser("convert", help="convert a .ghw file")
+    conv.add_argument("ghw")
+    conv.add_argument("store")
+    conv.add_argument("-s", "--signals", nargs="+", metavar="PATH", help="signal paths or patterns, all by default")
+    conv.add_argument("--chunk-changes", type=int, default=4096, help="changes per chunk (default 4096)")
+    show = commands.add_parser("show", help="print the changes of signals within a time window")
+    show.add_argument("store")
+    show.add_argument("-s", "--signals", nargs="+", metavar="PATH", required=True)
+    show.add_argument("--from", dest="start", type=parseTime, default=0, help="start time, e.g. '10us'")
+    show.add_argument("--to", dest="end", type=parseTime, help="end time, excluded")
+    listing = commands.add_parser("list", help="list the signals of a store")
+    listing.add_argument("store")
+    commands.add_parser("verify", help="check a conversion of the ghw_reader fixture")
+    args = parser.parse_args(argv)
+    try:
+        if args.command == "verify":
+            verifyWaveformStore()
+            return
+        if args.command == "convert":
+            index = convert(args.ghw, args.store, args.signals, args.chunk_changes)
+            chunks = sum(len(s['chunks']) for s in index.values())
+            print(f"{len(index)} signals, {chunks} chunks", file=sys.stderr)
+            return
+        with WaveformStore(args.store) as store:
+            if args.command == "list":
+                for path, s in store.signals.items():
+                    changes = sum(c[4] for c in s['chunks'])
+                    print(f"{path} : {s['type']}, {changes} changes in {len(s['chunks'])} chunks")
+                return
+            end = args.end if args.end is not None else sys.maxsize
+            for path in args.signals:
+                if path not in store.signals:
+                    raise KeyError(f"no signal {path!r}")
+                for time, value in store.window(path, args.start, end):
+                    print(f"{time} {path} {value}")
+    except (ValueError, KeyError, OSError) as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
-from vunit import VUnit
+from vunit import VUnit, VUnitCLI
 from pathlib import Path
 import os
+import sys
 
 # set VUnit environment variables
 os.environ['VUNIT_VHDL_STANDARD'] = '2008'
@@ -8,8 +9,14 @@ os.environ['VUNIT_SIMULATOR'] = 'ghdl'
 
 root = Path(__file__).parent
 
-# Create VUnit instance by parsing command line arguments
-vu = VUnit.from_argv()
+# Create VUnit instance by parsing command line arguments,
+# including the options of the timing history (see timing_history.py)
+sys.path.insert(0, str(root / ".." / "tvl_lib"))
+import timing_history
+cli = VUnitCLI()
+timing_history.add_arguments(cli.parser)
+args = cli.parse_args()
+vu = VUnit.from_args(args=args)
 
 # Add VUnit's builtin HDL utilities for checking, logging, communication...
 # See http://vunit.github.io/hdl_libraries.html.
@@ -18,11 +25,12 @@ vu.add_vhdl_builtins()
 # Add random support (integrates OSVVM)
 vu.add_random()
 
-tvl_lib = vu.add_library("TVL")
-tvl_lib.add_source_files(str(root / ".." / "tvl_lib/lib/*.vhdl"))
+# TVL comes prebuilt from the cache shared with tvl_lib/run.py
+from prebuilt import add_tvl_library
+add_tvl_library(vu)
 
 rtl_lib = vu.add_library("RTL")
 rtl_lib.add_source_files(str(root / "rtl/**/*.vhdl"))
 rtl_lib.add_source_files(str(root / "testbench/**/*.vhdl"))
 
-vu.main()
\ No newline at end of file
+vu.main(post_run=timing_history.post_run("rtl_designs", args.timing_threshold))
@@ -0,0 +1,148 @@
+"""
+Operator throughput of TVL.bal_numeric in simulation.
+
+Runs the numeric_benchmark_tb testbench through run.py for every
+requested width, reads the time VUnit measured for each test from its
+xunit report, subtracts the "baseline" test of the same width (the
+loop without an operator, plus elaboration) and reports operations per
+second per operator and width as CSV or JSON.
+
+Tests run one at a time so they do not compete for cores. Use enough
+iterations for the operators to take seconds, since VUnit reports
+times rounded to tenths of a second.
+
+With --against, the same tests also run on another git revision,
+checked out in a temporary worktree, and every row gets that
+revision's time and the speedup over it. The revision must have this
+benchmark too.
+
+    python tvl_lib/benchmark.py --widths 3 9 27 81 --iterations 20000
+    python tvl_lib/benchmark.py --widths 27 81 --operators mul div --against HEAD~1
+"""
+
+from pathlib import Path
+import argparse
+import csv
+import json
+import re
+import subprocess
+import sys
+import tempfile
+import xml.etree.ElementTree as ElementTree
+
+ROOT = Path(__file__).resolve().parent
+
+BASELINE = "baseline"
+
+
+def run_tests(pattern, run_args, with_output=False, root=ROOT):
+    """
+    Runs the VUnit tests matching pattern, or any of a list of
+    patterns, with extra run.py arguments and returns {(config, test):
+    seconds} from the xunit report, or {(config, test): (seconds,
+    output)} with the simulation output of each test when with_output
+    is set.
+    """
+    patterns = [pattern] if isinstance(pattern, str) else list(pattern)
+    with tempfile.TemporaryDirectory() as tmp:
+        xunit = Path(tmp) / "xunit.xml"
+        command = [sys.executable, str(root / "run.py"), *patterns, "-p", "1",
+                   "--xunit-xml", str(xunit), *run_args]
+        subprocess.run(command, check=True)
+        times = {}
+        for case in ElementTree.parse(xunit).iter("testcase"):
+            full = f"{case.get('classname')}.{case.get('name')}"
+            match = re.search(r"\.([^.]+)\.(\w+)$", full)
+            seconds = float(case.get("time"))
+            if with_output:
+                seconds = (seconds, case.findtext("system-out") or "")
+            times[(match.group(1), match.group(2))] = seconds
+        return times
+
+
+def throughput(times, iterations):
+    """
+    Turns {(config, test): seconds} into rows of operations per second,
+    the baseline test of each config subtracted.
+    """
+    rows = []
+    for (config, test), seconds in sorted(times.items()):
+        if test == BASELINE:
+            continue
+        net = seconds - times.get((config, BASELINE), 0.0)
+        rows.append({
+            "config": config,
+            "operator": test,
+            "iterations": iterations,
+            "seconds": round(net, 3),
+            "ops_per_second": round(iterations / net, 1) if net > 0 else None,
+        })
+    return rows
+
+
+def run_against(revision, pattern, run_args):
+    """
+    Runs the tests like run_tests() on another git revision, checked
+    out in a temporary worktree with an output path of its own.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        worktree = Path(tmp) / "tree"
+        subprocess.run(["git", "worktree", "add", "--detach", str(worktree), revision],
+                       cwd=ROOT, check=True)
+        try:
+            return run_tests(pattern, [*run_args, "-o", str(Path(tmp) / "vunit_out")],
+                             root=worktree / ROOT.name)
+        finally:
+            subprocess.run(["git", "worktree", "remove", "--force", str(worktree)], cwd=ROOT)
+
+
+def add_speedup(rows, other_rows, revision):
+    """
+    Adds the time of each row on the other revision and the speedup
+    over it.
+    """
+    other = {(row["config"], row["operator"]): row["seconds"] for row in other_rows}
+    for row in rows:
+        seconds = other.get((row["config"], row["operator"]))
+        row[f"seconds_{revision}"] = seconds
+        row["speedup"] = round(seconds / row["seconds"], 2) if seconds and row["seconds"] > 0 else None
+    return rows
+
+
+def write_report(rows, output, fmt):
+    if fmt == "json":
+        json.dump(rows, output, indent=2)
+        output.write("\n")
+    else:
+        writer = csv.DictWriter(output, fieldnames=list(rows[0]) if rows else ["config"])
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def add_report_arguments(parser):
+    parser.add_argument("--iterations", type=int, default=10000, help="operations per test")
+    parser.add_argument("--format", choices=("csv", "json"), default="csv")
+    parser.add_argument("-o", "--output", type=argparse.FileType("w"), default=sys.stdout)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure bal_numeric operator throughput in simulation.")
+    parser.add_argument("--widths", type=int, nargs="+", default=[3, 9, 27, 81],
+                        help="operand widths in trits, 3 to 81")
+    parser.add_argument("--operators", nargs="+", metavar="TEST",
+                        help="tests to run, e.g. mul div, all by default")
+    parser.add_argument("--against", metavar="REVISION",
+                        help="also run on this git revision and report the speedup over it")
+    add_report_arguments(parser)
+    args = parser.parse_args()
+    if args.operators:
+        pattern = [f"TVL_TB.numeric_benchmark_tb.*.{test}" for test in [BASELINE, *args.operators]]
+    else:
+        pattern = "TVL_TB.numeric_benchmark_tb.*"
+    run_args = ["--benchmark-iterations", str(args.iterations),
+                "--benchmark-widths", *map(str, args.widths)]
+    rows = throughput(run_tests(pattern, run_args), args.iterations)
+    if args.against:
+        add_speedup(rows, throughput(run_against(args.against, pattern, run_args), args.iterations),
+                    args.against)
+    write_report(rows, args.output, args.format)
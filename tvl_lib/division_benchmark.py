@@ -0,0 +1,74 @@
+"""
+Head-to-head comparison of the division algorithms of TVL.bal_numeric.
+
+Runs numeric_division_benchmark_tb through run.py, which calls DIVMOD
+(behind "/", "rem" and "mod"), JONES1, JONES2, BTE_DIVMOD (behind
+BTEDIV and BTEMOD) and DIV_TESTING on the same random and worst-case
+operands for every requested width. Prints, per width and operand set,
+the algorithms from fastest to slowest with their time relative to the
+fastest, and writes all measurements as CSV or JSON.
+
+All algorithms loop once per trit of the dividend; the nonzero
+quotient trits per call show how often the loops took the add or
+subtract step.
+
+    python tvl_lib/division_benchmark.py --widths 9 27 40 --iterations 2000 -o division.csv
+"""
+
+import argparse
+import re
+import sys
+
+import benchmark
+
+
+def _logged(output, name):
+    match = re.search(rf"\b{name}=(\d+)", output)
+    return int(match.group(1)) if match else None
+
+
+def compare(results, iterations):
+    """
+    Turns {(config, test): (seconds, output)} into one row per config
+    and algorithm, with the time relative to the fastest algorithm of
+    the config and the counts the testbench logged.
+    """
+    rows = benchmark.throughput({key: seconds for key, (seconds, _) in results.items()}, iterations)
+    fastest = {}
+    for row in rows:
+        if row["seconds"] > 0:
+            fastest[row["config"]] = min(fastest.get(row["config"], row["seconds"]), row["seconds"])
+    for row in rows:
+        output = results[(row["config"], row["operator"])][1]
+        nonzero, calls = _logged(output, "nonzero_quotient_trits"), _logged(output, "calls")
+        best = fastest.get(row["config"])
+        row["relative"] = round(row["seconds"] / best, 2) if best and row["seconds"] > 0 else None
+        row["nonzero_quotient_trits_per_call"] = round(nonzero / calls, 2) if calls else None
+    rows.sort(key=lambda row: (row["config"], row["relative"] is None, row["relative"] or 0))
+    return rows
+
+
+def print_summary(rows, output=sys.stderr):
+    config = None
+    for row in rows:
+        if row["config"] != config:
+            config = row["config"]
+            print(f"\n{config}", file=output)
+        relative = f"{row['relative']:.2f}x" if row["relative"] is not None else "-"
+        print(f"  {row['operator']:12} {row['seconds']:9.3f} s  {relative:>7}"
+              f"  {row['nonzero_quotient_trits_per_call']} nonzero quotient trits/call", file=output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the bal_numeric division algorithms in simulation.")
+    parser.add_argument("--widths", type=int, nargs="+", default=[9, 27, 40],
+                        help="operand widths in trits, 3 to 81")
+    benchmark.add_report_arguments(parser)
+    args = parser.parse_args()
+    results = benchmark.run_tests("TVL_TB.numeric_division_benchmark_tb.*",
+                                  ["--benchmark-iterations", str(args.iterations),
+                                   "--benchmark-widths", *map(str, args.widths)],
+                                  with_output=True)
+    rows = compare(results, args.iterations)
+    print_summary(rows)
+    benchmark.write_report(rows, args.output, args.format)
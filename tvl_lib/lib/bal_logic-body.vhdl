@@ -2063,14 +2063,102 @@ package body bal_logic is
 
   -------------------------------------------------------------------
 
+  -- TO_BALTERN converts CHUNK_TRITS trits per step by looking up
+  -- the balanced remainder of ARG modulo 3**CHUNK_TRITS, and
+  -- TO_INTEGER 3 trits per step by looking up their value, indexed
+  -- by the trits themselves. Metavalues have the value CHUNK_META,
+  -- outside that of any 3 trits.
+
+  constant CHUNK_TRITS : POSITIVE := 6;
+  constant CHUNK_SPAN  : POSITIVE := 3**CHUNK_TRITS;
+  constant CHUNK_META  : INTEGER  := INTEGER'low;
+
+  type int_to_chunk_table is array (-(CHUNK_SPAN/2) to CHUNK_SPAN/2)
+    of BTERN_ULOGIC_VECTOR(CHUNK_TRITS-1 downto 0);
+  type trits_to_int_table is array (BTERN_ULOGIC, BTERN_ULOGIC, BTERN_ULOGIC)
+    of INTEGER;
+
+  function INT_TO_CHUNK_INIT return int_to_chunk_table is
+    variable RESULT    : int_to_chunk_table;
+    variable I_VAL     : INTEGER;
+    variable REMAINDER : INTEGER;
+  begin
+    for V in RESULT'range loop
+      I_VAL := V;
+      for I in 0 to CHUNK_TRITS-1 loop
+        REMAINDER := I_VAL mod 3;
+        if REMAINDER = 0 then
+          RESULT(V)(I) := '0';
+        elsif REMAINDER = 1 then
+          RESULT(V)(I) := '+';
+          I_VAL := I_VAL - 1;
+        else
+          RESULT(V)(I) := '-';
+          I_VAL := I_VAL + 1;
+        end if;
+        I_VAL := I_VAL / 3;
+      end loop;
+    end loop;
+    return RESULT;
+  end function INT_TO_CHUNK_INIT;
+
+  function TRITS_TO_INT_INIT return trits_to_int_table is
+    variable RESULT : trits_to_int_table;
+    function VALUE (ARG : BTERN_ULOGIC) return INTEGER is
+    begin
+      case cvt_to_x2p(ARG) is
+        when '-'    => return -1;
+        when '0'    => return 0;
+        when '+'    => return 1;
+        when others => return CHUNK_META;
+      end case;
+    end function VALUE;
+  begin
+    for T2 in BTERN_ULOGIC loop
+      for T1 in BTERN_ULOGIC loop
+        for T0 in BTERN_ULOGIC loop
+          if VALUE(T2) = CHUNK_META or VALUE(T1) = CHUNK_META
+            or VALUE(T0) = CHUNK_META then
+            RESULT(T2, T1, T0) := CHUNK_META;
+          else
+            RESULT(T2, T1, T0) := 9*VALUE(T2) + 3*VALUE(T1) + VALUE(T0);
+          end if;
+        end loop;
+      end loop;
+    end loop;
+    return RESULT;
+  end function TRITS_TO_INT_INIT;
+
+  constant cvt_int_to_chunk : int_to_chunk_table := INT_TO_CHUNK_INIT;
+  constant cvt_trits_to_int : trits_to_int_table := TRITS_TO_INT_INIT;
+
+  -------------------------------------------------------------------
+
   function TO_BALTERN (ARG : INTEGER; SIZE : NATURAL) return BTERN_ULOGIC_VECTOR is
+    constant CHUNKS    : NATURAL := SIZE / CHUNK_TRITS;
     variable RESULT    : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
     variable I_VAL     : INTEGER := ARG;
     variable REMAINDER : INTEGER;
   begin
     if (SIZE < 1) then return NAC;
     end if;
-    for I in 0 to RESULT'length - 1 loop
+    -- whole chunks, the remainder taken with "rem" and balanced
+    -- afterwards so that I_VAL cannot overflow
+    for K in 0 to CHUNKS - 1 loop
+      REMAINDER := I_VAL rem CHUNK_SPAN;
+      I_VAL := I_VAL / CHUNK_SPAN;
+      if REMAINDER > CHUNK_SPAN/2 then
+        REMAINDER := REMAINDER - CHUNK_SPAN;
+        I_VAL := I_VAL + 1;
+      elsif REMAINDER < -(CHUNK_SPAN/2) then
+        REMAINDER := REMAINDER + CHUNK_SPAN;
+        I_VAL := I_VAL - 1;
+      end if;
+      RESULT((K+1)*CHUNK_TRITS-1 downto K*CHUNK_TRITS) :=
+        cvt_int_to_chunk(REMAINDER);
+    end loop;
+    -- the trits above the last whole chunk, one at a time
+    for I in CHUNKS*CHUNK_TRITS to RESULT'length - 1 loop
       REMAINDER := I_VAL mod 3;
       if REMAINDER = 0 then                
         RESULT(I) := '0';
@@ -2094,11 +2182,12 @@ package body bal_logic is
   -------------------------------------------------------------------
 
   function TO_INTEGER (ARG : BTERN_ULOGIC_VECTOR) return INTEGER is
-    variable RESULT : INTEGER := 0;
-    variable BASE   : INTEGER;
-    variable WEIGHT : INTEGER := 1;
-    alias XARG      : BTERN_ULOGIC_VECTOR(ARG'length - 1 downto 0) is ARG;
-    variable ARGM2P : BTERN_ULOGIC_VECTOR(ARG'length - 1 downto 0);
+    variable RESULT   : INTEGER := 0;
+    variable CHUNK    : INTEGER;
+    variable OVERFLOW : BOOLEAN := FALSE;
+    -- ARG with '0' trits added on the left, up to a multiple of 3
+    variable XARG     : BTERN_ULOGIC_VECTOR(3*((ARG'length+2)/3) - 1 downto 0) :=
+      (others => '0');
   begin
     if (ARG'length < 1) then
       assert NO_WARNING
@@ -2107,22 +2196,34 @@ package body bal_logic is
         severity warning;
         return 0;
     end if;
-    ARGM2P := TO_M2P(XARG, 'X');
-    if ARGM2P(ARGM2P'left) = 'X' then
-      assert NO_WARNING
+    XARG(ARG'length - 1 downto 0) := ARG;
+    -- from the leftmost 3 trits, so that leading zeros of a long
+    -- vector do not overflow. Past an overflow, the rest is only
+    -- searched for metavalues.
+    for K in XARG'length/3 - 1 downto 0 loop
+      CHUNK := cvt_trits_to_int(XARG(3*K+2), XARG(3*K+1), XARG(3*K));
+      if CHUNK = CHUNK_META then
+        assert NO_WARNING
+          report "TVL.BAL_LOGIC.TO_INTEGER: "
+          & "metavalue detected, returning 0"
+          severity warning;
+        return 0;
+      elsif OVERFLOW then
+        null;
+      elsif RESULT > (INTEGER'high - CHUNK) / 27
+        or RESULT < -((INTEGER'high + CHUNK) / 27) then
+        OVERFLOW := TRUE;
+      else
+        RESULT := RESULT*27 + CHUNK;
+      end if;
+    end loop;
+    if OVERFLOW then
+      assert FALSE
         report "TVL.BAL_LOGIC.TO_INTEGER: "
-        & "metavalue detected, returning 0"
-        severity warning;
+        & "value out of INTEGER range, returning 0"
+        severity failure;
       return 0;
     end if;
-    for I in ARGM2P'reverse_range loop
-      if    ARGM2P(I) = '-' then BASE := -1;
-      elsif ARGM2P(I) = '0' then BASE :=  0;
-      elsif ARGM2P(I) = '+' then BASE :=  1;
-      end if;
-      RESULT := RESULT + (BASE * WEIGHT);
-      WEIGHT := WEIGHT * 3;
-    end loop;
     return RESULT;
   end function TO_INTEGER;
 
@@ -320,8 +320,9 @@ package bal_logic is
   -- but has been kept here for convenience because the TO_BALTERN 
   -- function was forced here.
   -- Converts a BTERN_(U)LOGIC(_VECTOR) to an integer.
-  -- As it is the norm to not protect against overflows in 
-  -- the IEEE library, the same is true here.
+  -- A value out of the range of INTEGER stops the simulation with
+  -- severity FAILURE, unless the vector also holds a metavalue,
+  -- which returns 0 with a warning.
   function TO_INTEGER (ARG : BTERN_ULOGIC_VECTOR) return INTEGER;
   function TO_INTEGER (ARG : BTERN_ULOGIC) return INTEGER;
 
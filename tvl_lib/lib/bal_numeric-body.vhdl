@@ -31,6 +31,249 @@ package body bal_numeric is
   -- null range array constant and implementation controls
   constant NAC : BTERN_ULOGIC_VECTOR (0 downto 1) := (others => '0');
   constant NO_WARNING : BOOLEAN := FALSE;  -- default to emit warnings
+  -- "*" multiplies in chunks of MUL_CHUNK_TRITS trits with INTEGER
+  -- partial products when TRUE, by shift-and-add of vectors
+  -- (MUL_CARRY_SAVE) when FALSE or when both operands are longer than
+  -- MUL_MAX_CHUNKS chunks
+  constant MUL_CHUNKED     : BOOLEAN  := TRUE;
+  constant MUL_CHUNK_TRITS : POSITIVE := 6;
+  constant MUL_MAX_CHUNKS  : POSITIVE :=
+    INTEGER'high / (2 * (3**MUL_CHUNK_TRITS / 2)**2);
+  -- "+", "-", "*", "/", "rem" and "mod" compute with INTEGERs when
+  -- their operands have no metavalues and fit in FAST_TRITS trits
+  constant FAST_INTEGER : BOOLEAN  := TRUE;
+  constant FAST_TRITS   : POSITIVE := 19;
+
+  --=================================================================
+  -- Full adder tables
+  --=================================================================
+  -- Sum and carry of one trit position, indexed (C, L, R), as the
+  -- bal_logic gates compute them, metavalues included. A metavalue
+  -- in any input gives 'X', and L, M and H count as -, 0 and +.
+
+  type bternlogic_3d is array (BTERN_ULOGIC, BTERN_ULOGIC, BTERN_ULOGIC) of BTERN_ULOGIC;
+
+  -- Sum trit of C + L + R, SUM(C, SUM(L, R))
+  constant fa_sum_table : bternlogic_3d := (
+    (others => (others => 'X')),  -- C = U
+    (others => (others => 'X')),  -- C = X
+    -- C = -
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | - |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | 0 |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | L |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | M |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    -- C = 0
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | - |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | 0 |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | L |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | M |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    -- C = +
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | - |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | 0 |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | L |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | M |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    (others => (others => 'X')),  -- C = Z
+    (others => (others => 'X')),  -- C = W
+    -- C = L
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | - |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | 0 |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | L |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | M |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    -- C = M
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | - |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | 0 |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | L |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | M |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    -- C = H
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | - |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | 0 |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '-', '0', '+', 'X', 'X', '-', '0', '+', 'X'),  -- | L |
+        ('X', 'X', '0', '+', '-', 'X', 'X', '0', '+', '-', 'X'),  -- | M |
+        ('X', 'X', '+', '-', '0', 'X', 'X', '+', '-', '0', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    (others => (others => 'X'))   -- C = D
+    );
+
+  -- Carry trit of C + L + R, ANY(CON(C, SUM(L, R)), CON(L, R))
+  constant fa_carry_table : bternlogic_3d := (
+    (others => (others => 'X')),  -- C = U
+    (others => (others => 'X')),  -- C = X
+    -- C = -
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '-', '-', '0', 'X', 'X', '-', '-', '0', 'X'),  -- | - |
+        ('X', 'X', '-', '0', '0', 'X', 'X', '-', '0', '0', 'X'),  -- | 0 |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '-', '-', '0', 'X', 'X', '-', '-', '0', 'X'),  -- | L |
+        ('X', 'X', '-', '0', '0', 'X', 'X', '-', '0', '0', 'X'),  -- | M |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    -- C = 0
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '-', '0', '0', 'X', 'X', '-', '0', '0', 'X'),  -- | - |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | 0 |
+        ('X', 'X', '0', '0', '+', 'X', 'X', '0', '0', '+', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '-', '0', '0', 'X', 'X', '-', '0', '0', 'X'),  -- | L |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | M |
+        ('X', 'X', '0', '0', '+', 'X', 'X', '0', '0', '+', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    -- C = +
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | - |
+        ('X', 'X', '0', '0', '+', 'X', 'X', '0', '0', '+', 'X'),  -- | 0 |
+        ('X', 'X', '0', '+', '+', 'X', 'X', '0', '+', '+', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | L |
+        ('X', 'X', '0', '0', '+', 'X', 'X', '0', '0', '+', 'X'),  -- | M |
+        ('X', 'X', '0', '+', '+', 'X', 'X', '0', '+', '+', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    (others => (others => 'X')),  -- C = Z
+    (others => (others => 'X')),  -- C = W
+    -- C = L
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '-', '-', '0', 'X', 'X', '-', '-', '0', 'X'),  -- | - |
+        ('X', 'X', '-', '0', '0', 'X', 'X', '-', '0', '0', 'X'),  -- | 0 |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '-', '-', '0', 'X', 'X', '-', '-', '0', 'X'),  -- | L |
+        ('X', 'X', '-', '0', '0', 'X', 'X', '-', '0', '0', 'X'),  -- | M |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    -- C = M
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '-', '0', '0', 'X', 'X', '-', '0', '0', 'X'),  -- | - |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | 0 |
+        ('X', 'X', '0', '0', '+', 'X', 'X', '0', '0', '+', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '-', '0', '0', 'X', 'X', '-', '0', '0', 'X'),  -- | L |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | M |
+        ('X', 'X', '0', '0', '+', 'X', 'X', '0', '0', '+', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    -- C = H
+    -- ---------------------------------------------------------
+    -- |  U    X    -    0    +    Z    W    L    M    H    D   |
+    -- ---------------------------------------------------------
+    (
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | U |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | X |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | - |
+        ('X', 'X', '0', '0', '+', 'X', 'X', '0', '0', '+', 'X'),  -- | 0 |
+        ('X', 'X', '0', '+', '+', 'X', 'X', '0', '+', '+', 'X'),  -- | + |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | Z |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X'),  -- | W |
+        ('X', 'X', '0', '0', '0', 'X', 'X', '0', '0', '0', 'X'),  -- | L |
+        ('X', 'X', '0', '0', '+', 'X', 'X', '0', '0', '+', 'X'),  -- | M |
+        ('X', 'X', '0', '+', '+', 'X', 'X', '0', '+', '+', 'X'),  -- | H |
+        ('X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X', 'X')   -- | D |
+    ),
+    (others => (others => 'X'))   -- C = D
+    );
 
   --=================================================================
   -- Local subprograms
@@ -48,14 +291,178 @@ package body bal_numeric is
     variable CTRIT  : BTERN_ULOGIC := C;
   begin
     for I in 0 to L_LEFT loop
-      RESULT(I) := SUM(CTRIT, SUM(XL(I), XR(I)));
-      CTRIT     := ANY(CON(CTRIT, SUM(XL(I), XR(I))), CON(XL(I), XR(I)));
+      RESULT(I) := fa_sum_table(CTRIT, XL(I), XR(I));
+      CTRIT     := fa_carry_table(CTRIT, XL(I), XR(I));
     end loop;
     return RESULT;
   end function ADD_BTERN_VEC;
 
   -------------------------------------------------------------------
 
+  -- Computes the product of two BTERN_ULOGIC_VECTOR, which must not
+  -- contain metavalues, as L'length+R'length trits.
+  -- Both are split into chunks of MUL_CHUNK_TRITS trits, whose
+  -- values are multiplied as INTEGERs and summed per column of the
+  -- product, schoolbook style. Each balanced digit of a column is
+  -- written out and the rest carried to the next column.
+  -- With 6-trit chunks a partial product is at most 364*364, so a
+  -- column cannot overflow a 32-bit INTEGER below 16000 chunks of the
+  -- shorter operand; "*" calls it below MUL_MAX_CHUNKS, half that.
+  function MUL_BTERN_VEC (L, R : BTERN_ULOGIC_VECTOR)
+    return BTERN_ULOGIC_VECTOR
+  is
+    constant K        : POSITIVE := MUL_CHUNK_TRITS;
+    constant BASE     : POSITIVE := 3**K;
+    constant L_CHUNKS : POSITIVE := (L'length + K - 1) / K;
+    constant R_CHUNKS : POSITIVE := (R'length + K - 1) / K;
+    constant XL       : BTERN_ULOGIC_VECTOR(L_CHUNKS*K-1 downto 0) :=
+      RESIZE(L, L_CHUNKS*K);
+    constant XR       : BTERN_ULOGIC_VECTOR(R_CHUNKS*K-1 downto 0) :=
+      RESIZE(R, R_CHUNKS*K);
+    variable LD       : INTEGER_VECTOR(0 to L_CHUNKS-1);
+    variable RD       : INTEGER_VECTOR(0 to R_CHUNKS-1);
+    variable COLUMN   : INTEGER;
+    variable DIGIT    : INTEGER;
+    variable CARRY    : INTEGER := 0;
+    variable RESULT   : BTERN_ULOGIC_VECTOR((L_CHUNKS+R_CHUNKS)*K-1 downto 0);
+  begin
+    for I in LD'range loop
+      LD(I) := TO_INTEGER(XL(I*K+K-1 downto I*K));
+    end loop;
+    for I in RD'range loop
+      RD(I) := TO_INTEGER(XR(I*K+K-1 downto I*K));
+    end loop;
+    for C in 0 to L_CHUNKS+R_CHUNKS-1 loop
+      COLUMN := CARRY;
+      for I in MAXIMUM(0, C-R_CHUNKS+1) to MINIMUM(C, L_CHUNKS-1) loop
+        COLUMN := COLUMN + LD(I)*RD(C-I);
+      end loop;
+      DIGIT := COLUMN mod BASE;
+      if DIGIT > BASE/2 then
+        DIGIT := DIGIT - BASE;
+      end if;
+      CARRY := (COLUMN - DIGIT) / BASE;
+      RESULT(C*K+K-1 downto C*K) := TO_BALTERN(DIGIT, K);
+    end loop;
+    -- the product always fits, the trits above it are '0'
+    return RESULT(L'length+R'length-1 downto 0);
+  end function MUL_BTERN_VEC;
+
+  -------------------------------------------------------------------
+
+  -- Shift-and-add in carry-save form: RESULT holds the sum trits and
+  -- CARRY the carries into each position, so a partial product is
+  -- added trit by trit without a carry chain, and the carries ripple
+  -- once at the end. Carries out of the top trit are dropped, as in
+  -- "+", since the product always fits.
+  function MUL_CARRY_SAVE (L, R : BTERN_ULOGIC_VECTOR)
+    return BTERN_ULOGIC_VECTOR
+  is
+    constant L_LEFT : INTEGER := L'length-1;
+    constant R_LEFT : INTEGER := R'length-1;
+    variable LM2P   : BTERN_ULOGIC_VECTOR(L_LEFT downto 0);
+    variable RM2P   : BTERN_ULOGIC_VECTOR(R_LEFT downto 0);
+    variable RESULT : BTERN_ULOGIC_VECTOR(L'length+R'length-1 downto 0) :=
+      (others => '0');
+    variable CARRY  : BTERN_ULOGIC_VECTOR(L'length+R'length-1 downto 0) :=
+      (others => '0');
+    variable ADDEND : BTERN_ULOGIC;
+    variable SUM    : BTERN_ULOGIC;
+  begin
+    if ((L'length < 1) or (R'length < 1)) then return NAC;
+    end if;
+    LM2P := TO_M2P(L, 'X');
+    RM2P := TO_M2P(R, 'X');
+    if ((LM2P(LM2P'left) = 'X') or (RM2P(RM2P'left) = 'X')) then
+      RESULT := (others => 'X');
+      return RESULT;
+    end if;
+    for I in 0 to L_LEFT loop
+      if LM2P(I) /= '0' then
+        -- downwards, so that CARRY(J+1) is used before it is replaced
+        for J in RESULT'left downto I loop
+          if J - I > R_LEFT then
+            ADDEND := '0';
+          elsif LM2P(I) = '+' then
+            ADDEND := RM2P(J - I);
+          else
+            ADDEND := STI(RM2P(J - I));
+          end if;
+          SUM := fa_sum_table(CARRY(J), RESULT(J), ADDEND);
+          if J < RESULT'left then
+            CARRY(J+1) := fa_carry_table(CARRY(J), RESULT(J), ADDEND);
+          end if;
+          RESULT(J) := SUM;
+        end loop;
+        CARRY(I) := '0';
+      end if;
+    end loop;
+    return ADD_BTERN_VEC(RESULT, CARRY, '0');
+  end function MUL_CARRY_SAVE;
+
+  -------------------------------------------------------------------
+  -- Native integer fast path
+  -------------------------------------------------------------------
+  -- Operands of at most FAST_TRITS trits are converted to INTEGER,
+  -- computed with the predefined operators and converted back. 19
+  -- trits hold at most +-581130733, so sums, differences and the
+  -- quotients and remainders of such operands fit in an INTEGER, as
+  -- do products whose operands have at most 19 trits together.
+  -- Metavalues and division by zero are left to the trit-level path,
+  -- which returns and reports them as before.
+
+  type trit_integer_table is array (BTERN_ULOGIC) of INTEGER;
+
+  -- marks a vector holding a metavalue, outside the range of 19 trits
+  constant FAST_META : INTEGER := INTEGER'low;
+
+  -- value of each trit, L, M and H counting as -, 0 and +
+  constant trit_value_table : trit_integer_table := (
+    FAST_META,  -- U
+    FAST_META,  -- X
+    -1,         -- -
+    0,          -- 0
+    1,          -- +
+    FAST_META,  -- Z
+    FAST_META,  -- W
+    -1,         -- L
+    0,          -- M
+    1,          -- H
+    FAST_META   -- D
+    );
+
+  -- Value of ARG, at most FAST_TRITS trits long, in one pass from
+  -- its leftmost trit, or FAST_META if it contains a metavalue.
+  function FAST_VALUE (ARG : BTERN_ULOGIC_VECTOR) return INTEGER is
+    variable RESULT : INTEGER := 0;
+    variable TRIT   : INTEGER;
+  begin
+    for I in ARG'range loop
+      TRIT := trit_value_table(ARG(I));
+      if TRIT = FAST_META then
+        return FAST_META;
+      end if;
+      RESULT := RESULT*3 + TRIT;
+    end loop;
+    return RESULT;
+  end function FAST_VALUE;
+
+  -- ARG wrapped into the range of SIZE trits, like the carry-out
+  -- dropped by ADD_BTERN_VEC. ARG must be a sum or difference of two
+  -- SIZE-trit values.
+  function FAST_WRAP (ARG : INTEGER; SIZE : POSITIVE) return INTEGER is
+    constant SPAN : POSITIVE := 3**SIZE;
+  begin
+    if ARG > SPAN/2 then
+      return ARG - SPAN;
+    elsif ARG < -(SPAN/2) then
+      return ARG + SPAN;
+    end if;
+    return ARG;
+  end function FAST_WRAP;
+
+  -------------------------------------------------------------------
+
   -- Based on the first of the two balanced ternary division algorithms
   -- proposed by Jones.
   -- All arguments must be of the same length
@@ -95,11 +502,13 @@ package body bal_numeric is
       if CLOSEST_Z = abs(REMQUO) then
         null;
       elsif CLOSEST_Z = abs(HIGHQUO) then
+        -- the trit shifted in is '0', so the quotient trit is set
+        -- directly instead of adding -1 or +1 to the quotient
         REMQUO := HIGHQUO(DOUBLE-1 downto 0);
-        REMQUO(SINGLE-1 downto 0) := REMQUO(SINGLE-1 downto 0) - 1;
+        REMQUO(0) := '-';
       elsif CLOSEST_Z = abs(LOWQUO) then 
         REMQUO := LOWQUO(DOUBLE-1 downto 0);
-        REMQUO(SINGLE-1 downto 0) := REMQUO(SINGLE-1 downto 0) + 1;
+        REMQUO(0) := '+';
       end if;
     end loop;
 
@@ -182,10 +591,10 @@ package body bal_numeric is
 
       if CLOSEST_Z = abs(HIGHQUO) then
         REMQUO := HIGHQUO(DOUBLE-1 downto 0);
-        REMQUO(SINGLE-1 downto 0) := REMQUO(SINGLE-1 downto 0) - 1;
+        REMQUO(0) := '-';
       elsif CLOSEST_Z = abs(LOWQUO) then 
         REMQUO := LOWQUO(DOUBLE-1 downto 0);
-        REMQUO(SINGLE-1 downto 0) := REMQUO(SINGLE-1 downto 0) + 1;
+        REMQUO(0) := '+';
       end if;
     end loop;
 
@@ -251,10 +660,12 @@ package body bal_numeric is
       --       rem = low;
       --     }
       -- }
+      -- HERE: QUO(0) is the '0' shifted in, so quo + one and
+      -- quo - one only set that trit.
       if REMAINDER > 0 then
         LOW := REMAINDER - XDIVISOR;
         if (-LOW < REMAINDER) or ((-LOW = REMAINDER) and (QUO > 0)) then
-          QUO := QUO + ONE;
+          QUO(0) := ONE;
           REMAINDER := LOW;
         end if;
 
@@ -268,7 +679,7 @@ package body bal_numeric is
       elsif REMAINDER < 0 then
         HIGH := REMAINDER + XDIVISOR;
         if (-HIGH > REMAINDER) or ((-HIGH = REMAINDER) and (QUO < 0)) then
-          QUO := QUO - ONE;
+          QUO(0) := STI(ONE);
           REMAINDER := HIGH;
         end if;
       end if;
@@ -323,10 +734,10 @@ package body bal_numeric is
         null;
       elsif CLOSEST_Z = abs(HIGHQUO) then
         REMQUO := HIGHQUO(DOUBLE-1 downto 0);
-        REMQUO(SINGLE-1 downto 0) := REMQUO(SINGLE-1 downto 0) - 1;
+        REMQUO(0) := '-';
       elsif CLOSEST_Z = abs(LOWQUO) then 
         REMQUO := LOWQUO(DOUBLE-1 downto 0);
-        REMQUO(SINGLE-1 downto 0) := REMQUO(SINGLE-1 downto 0) + 1;
+        REMQUO(0) := '+';
       end if;
     end loop;
 
@@ -486,9 +897,17 @@ end procedure DIV_TESTING;
     constant SIZE : NATURAL := MAXIMUM(L'length, R'length);
     variable LM2P : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
     variable RM2P : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
+    variable LV, RV : INTEGER;
   begin
     if ((L'length < 1) or (R'length < 1)) then return NAC;
     end if;
+    if FAST_INTEGER and SIZE <= FAST_TRITS then
+      LV := FAST_VALUE(L);
+      RV := FAST_VALUE(R);
+      if LV /= FAST_META and RV /= FAST_META then
+        return TO_BALTERN(FAST_WRAP(LV + RV, SIZE), SIZE);
+      end if;
+    end if;
     LM2P := TO_M2P(RESIZE(L, SIZE), 'X');
     if (LM2P(LM2P'left) = 'X') then return LM2P;
     end if;
@@ -551,9 +970,17 @@ end procedure DIV_TESTING;
     constant SIZE : NATURAL := MAXIMUM(L'length, R'length);
     variable LM2P  : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
     variable RM2P  : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
+    variable LV, RV : INTEGER;
   begin
     if ((L'length < 1) or (R'length < 1)) then return NAC;
     end if;
+    if FAST_INTEGER and SIZE <= FAST_TRITS then
+      LV := FAST_VALUE(L);
+      RV := FAST_VALUE(R);
+      if LV /= FAST_META and RV /= FAST_META then
+        return TO_BALTERN(FAST_WRAP(LV - RV, SIZE), SIZE);
+      end if;
+    end if;
     LM2P := TO_M2P(RESIZE(L, SIZE), 'X');
     if (LM2P(LM2P'left) = 'X') then return LM2P;
     end if;
@@ -617,26 +1044,29 @@ end procedure DIV_TESTING;
     constant R_LEFT : INTEGER := R'length-1;
     variable LM2P   : BTERN_ULOGIC_VECTOR(L_LEFT downto 0);
     variable RM2P   : BTERN_ULOGIC_VECTOR(R_LEFT downto 0);
-    variable RESULT : BTERN_ULOGIC_VECTOR(L'length+R'length-1 downto 0) :=
-      (others => '0');
-    variable ADVAL  : BTERN_ULOGIC_VECTOR(L'length+R'length-1 downto 0);
+    variable RESULT : BTERN_ULOGIC_VECTOR(L'length+R'length-1 downto 0);
+    variable LV, RV : INTEGER;
   begin
     if ((L'length < 1) or (R'length < 1)) then return NAC;
     end if;
+    if FAST_INTEGER and RESULT'length <= FAST_TRITS then
+      LV := FAST_VALUE(L);
+      RV := FAST_VALUE(R);
+      if LV /= FAST_META and RV /= FAST_META then
+        return TO_BALTERN(LV * RV, RESULT'length);
+      end if;
+    end if;
     LM2P := TO_M2P(L, 'X');
     RM2P := TO_M2P(R, 'X');
     if ((LM2P(LM2P'left) = 'X') or (RM2P(RM2P'left) = 'X')) then
       RESULT := (others => 'X');
       return RESULT;
     end if;
-    ADVAL := RESIZE(RM2P, RESULT'length);
-    for I in 0 to L_LEFT loop
-      if LM2P(I)    = '+' then RESULT := RESULT + ADVAL;
-      elsif LM2P(I) = '-' then RESULT := RESULT - ADVAL;
-      end if;
-      ADVAL := ADVAL sll 1;
-    end loop;
-    return RESULT;
+    if MUL_CHUNKED and
+       MINIMUM(L'length, R'length) <= MUL_MAX_CHUNKS*MUL_CHUNK_TRITS then
+      return MUL_BTERN_VEC(LM2P, RM2P);
+    end if;
+    return MUL_CARRY_SAVE(LM2P, RM2P);
   end function "*";
 
   -------------------------------------------------------------------
@@ -799,9 +1229,17 @@ end procedure DIV_TESTING;
     variable FQUOT   : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
     variable FREMAIN : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
     variable QNEG    : BOOLEAN := false;
+    variable LV, RV  : INTEGER;
   begin
     if ((L'length < 1) or (R'length < 1)) then return NAC;
     end if;
+    if FAST_INTEGER and SIZE <= FAST_TRITS then
+      LV := FAST_VALUE(L);
+      RV := FAST_VALUE(R);
+      if LV /= FAST_META and RV /= FAST_META and RV /= 0 then
+        return TO_BALTERN(LV / RV, L'length);
+      end if;
+    end if;
     LM2P := RESIZE(TO_M2P(L, 'X'), SIZE);
     RM2P := RESIZE(TO_M2P(R, 'X'), SIZE);
     if ((LM2P(LM2P'right) = 'X') or (RM2P(RM2P'right) = 'X')) then
@@ -874,9 +1312,17 @@ end procedure DIV_TESTING;
     variable FQUOT   : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
     variable FREMAIN : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
     variable RNEG    : BOOLEAN := false;
+    variable LV, RV  : INTEGER;
   begin
     if ((L'length < 1) or (R'length < 1)) then return NAC;
     end if;
+    if FAST_INTEGER and SIZE <= FAST_TRITS then
+      LV := FAST_VALUE(L);
+      RV := FAST_VALUE(R);
+      if LV /= FAST_META and RV /= FAST_META and RV /= 0 then
+        return TO_BALTERN(LV rem RV, R'length);
+      end if;
+    end if;
     LM2P := RESIZE(TO_M2P(L, 'X'), SIZE);
     RM2P := RESIZE(TO_M2P(R, 'X'), SIZE);
     if ((LM2P(LM2P'right) = 'X') or (RM2P(RM2P'right) = 'X')) then
@@ -951,29 +1397,40 @@ end procedure DIV_TESTING;
     variable RM2P    : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
     variable FQUOT   : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
     variable FREMAIN : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
+    variable LNEG    : BOOLEAN := false;
     variable RNEG    : BOOLEAN := false;
+    variable LV, RV  : INTEGER;
   begin
     if ((L'length < 1) or (R'length < 1)) then return NAC;
     end if;
+    if FAST_INTEGER and SIZE <= FAST_TRITS then
+      LV := FAST_VALUE(L);
+      RV := FAST_VALUE(R);
+      if LV /= FAST_META and RV /= FAST_META and RV /= 0 then
+        return TO_BALTERN(LV mod RV, R'length);
+      end if;
+    end if;
     LM2P := RESIZE(TO_M2P(L, 'X'), SIZE);
     RM2P := RESIZE(TO_M2P(R, 'X'), SIZE);
     if ((LM2P(LM2P'right) = 'X') or (RM2P(RM2P'right) = 'X')) then
       FREMAIN := (others => 'X');
       return RESIZE(FREMAIN, R'length);
     end if;
+    -- the signs are taken after TO_M2P, so that weak trits count
     if LEFTMOST_NZ(LM2P) = '-' then
       LM2P := STI(LM2P);
+      LNEG := true;
     end if;
     if LEFTMOST_NZ(RM2P) = '-' then
       RM2P := STI(RM2P);
       RNEG := true;
     end if;
     DIVMOD(LM2P, RM2P, FQUOT, FREMAIN);
-    if RNEG and LEFTMOST_NZ(L) = '-' then
+    if RNEG and LNEG then
       FREMAIN := "0"-FREMAIN;
     elsif RNEG and FREMAIN /= "0" then
       FREMAIN := FREMAIN-RM2P;
-    elsif LEFTMOST_NZ(L) = '-' and FREMAIN /= "0" then
+    elsif LNEG and FREMAIN /= "0" then
       FREMAIN := RM2P-FREMAIN;
     end if;
     return RESIZE(FREMAIN, R'length);
@@ -79,6 +79,13 @@ package bal_numeric is
   function "*" (L : BTERN_ULOGIC_VECTOR; R : INTEGER) return BTERN_ULOGIC_VECTOR;
   function "*" (L : INTEGER; R : BTERN_ULOGIC_VECTOR) return BTERN_ULOGIC_VECTOR;
 
+  -- Multiplies by shift-and-add in carry-save form. "*" computes with
+  -- INTEGER chunks and uses it only for operands too long for them;
+  -- it is declared here so it can be tested against them. Returns
+  -- L'length + R'length trits.
+
+  function MUL_CARRY_SAVE (L, R : BTERN_ULOGIC_VECTOR) return BTERN_ULOGIC_VECTOR;
+
   -------------------------------------------------------------------
   -- Overloads of the "/" predefined operator
   -------------------------------------------------------------------
@@ -139,6 +146,16 @@ package bal_numeric is
   -- algorithms proposed by Jones.
   -------------------------------------------------------------------
 
+  -- DIVMOD is used by "/", "rem" and "mod", BTE_DIVMOD by BTEDIV
+  -- and BTEMOD. They are declared here so they can be benchmarked
+  -- against the others. All arguments must be of the same length.
+
+  procedure DIVMOD (DIVIDEND, DIVISOR : BTERN_ULOGIC_VECTOR;
+                    XQUO, XREM : out BTERN_ULOGIC_VECTOR);
+
+  procedure BTE_DIVMOD (DIVIDEND, DIVISOR : BTERN_ULOGIC_VECTOR;
+                        XQUO, XREM : out BTERN_ULOGIC_VECTOR);
+
   procedure JONES1 (DIVIDEND, DIVISOR : BTERN_ULOGIC_VECTOR;
                      XQUO, XREM : out BTERN_ULOGIC_VECTOR);
 
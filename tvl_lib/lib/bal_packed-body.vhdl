@@ -0,0 +1,787 @@
+-- -----------------------------------------------------------------
+--
+--   Title     :  Standard ternary logic package
+--             :  (BAL_PACKED package body)
+--             :
+--   Library   :  This package shall be compiled into a library
+--             :  symbolically named TVL.
+--             :
+--   Developers:  Anders Mørk Minde, University of South Eastern Norway
+--             :
+--   Purpose   :  This package defines a packed balanced ternary number
+--             :  type, BTERN_PACKED, with the arithmetic and relational
+--             :  operators of BAL_NUMERIC, for behavioral models and
+--             :  testbenches.
+--             :
+--   Note      :  All INTEGER arithmetic here stays within 32 bits,
+--             :  words being at most 581130733 in magnitude.
+--             :
+-- --------------------------------------------------------------------
+-- $Revision: 1 $
+-- $Date: 2026-10-18 (Sun, 18 Oct 2026) $
+-- --------------------------------------------------------------------
+
+package body bal_packed is
+
+  -- null range array constants and implementation controls
+  constant NAPC : BTERN_PACKED (0 downto 1) := (others => 0);
+  constant NAC  : BTERN_ULOGIC_VECTOR (0 downto 1) := (others => '0');
+  constant NO_WARNING : BOOLEAN := FALSE;  -- default to emit warnings
+
+  -- 3**19, and the largest word, (3**19-1)/2
+  constant WORD_SPAN : POSITIVE := 3**PACKED_TRITS;
+  constant WORD_MAX  : POSITIVE := (WORD_SPAN - 1) / 2;
+
+  --=================================================================
+  -- Local subprograms
+  --=================================================================
+
+  -- Splits S into a word and a carry, S = CARRY*3**19 + WORD.
+  procedure SPLIT (S : INTEGER; WORD, CARRY : out INTEGER) is
+    variable W : INTEGER := S;
+    variable C : INTEGER := 0;
+  begin
+    while W > WORD_MAX loop
+      W := W - WORD_SPAN;
+      C := C + 1;
+    end loop;
+    while W < -WORD_MAX loop
+      W := W + WORD_SPAN;
+      C := C - 1;
+    end loop;
+    WORD  := W;
+    CARRY := C;
+  end procedure SPLIT;
+
+  -- Splits S into S = HIGH*BASE + LOW, LOW balanced. BASE must be odd.
+  procedure SPLIT_AT (S : INTEGER; BASE : POSITIVE; HIGH, LOW : out INTEGER) is
+    variable XLOW : INTEGER := S mod BASE;
+  begin
+    if XLOW > BASE/2 then
+      XLOW := XLOW - BASE;
+    end if;
+    LOW  := XLOW;
+    HIGH := (S - XLOW) / BASE;
+  end procedure SPLIT_AT;
+
+  -------------------------------------------------------------------
+
+  -- Computes the sum of two BTERN_PACKED with input carry, dropping
+  -- the carry out of the top word.
+  -- Both arguments must be of the same length
+  function ADD_PACKED (L, R : BTERN_PACKED; C : INTEGER) return BTERN_PACKED is
+    constant L_LEFT : INTEGER := L'length-1;
+    alias XL        : BTERN_PACKED(L_LEFT downto 0) is L;
+    alias XR        : BTERN_PACKED(L_LEFT downto 0) is R;
+    variable RESULT : BTERN_PACKED(L_LEFT downto 0);
+    variable CARRY  : INTEGER := C;
+  begin
+    for I in 0 to L_LEFT loop
+      SPLIT(XL(I) + XR(I) + CARRY, RESULT(I), CARRY);
+    end loop;
+    return RESULT;
+  end function ADD_PACKED;
+
+  -- Negates every word
+  function NEG_PACKED (ARG : BTERN_PACKED) return BTERN_PACKED is
+    alias XARG      : BTERN_PACKED(ARG'length-1 downto 0) is ARG;
+    variable RESULT : BTERN_PACKED(ARG'length-1 downto 0);
+  begin
+    for I in RESULT'range loop
+      RESULT(I) := -XARG(I);
+    end loop;
+    return RESULT;
+  end function NEG_PACKED;
+
+  -- Returns 3*ARG + D, D from -1 to 2, dropping the carry out of the
+  -- top word.
+  function TIMES3_PLUS (ARG : BTERN_PACKED; D : INTEGER) return BTERN_PACKED is
+    alias XARG      : BTERN_PACKED(ARG'length-1 downto 0) is ARG;
+    variable RESULT : BTERN_PACKED(ARG'length-1 downto 0);
+    variable CARRY  : INTEGER := D;
+  begin
+    for I in 0 to RESULT'left loop
+      SPLIT(3*XARG(I) + CARRY, RESULT(I), CARRY);
+    end loop;
+    return RESULT;
+  end function TIMES3_PLUS;
+
+  -- Returns -1, 0 or 1 as the sign of ARG, i.e. of its leftmost
+  -- nonzero word
+  function SIGN (ARG : BTERN_PACKED) return INTEGER is
+    alias XARG : BTERN_PACKED(ARG'length-1 downto 0) is ARG;
+  begin
+    for I in XARG'range loop
+      if XARG(I) > 0 then
+        return 1;
+      elsif XARG(I) < 0 then
+        return -1;
+      end if;
+    end loop;
+    return 0;
+  end function SIGN;
+
+  -- Returns -1, 0 or 1 as L is less than, equal to or greater than R.
+  -- Balanced words compare like trits: the most significant word that
+  -- differs decides.
+  function COMPARE (L, R : BTERN_PACKED) return INTEGER is
+    constant SIZE : NATURAL := MAXIMUM(L'length, R'length);
+    constant XL   : BTERN_PACKED(SIZE-1 downto 0) := RESIZE(L, SIZE);
+    constant XR   : BTERN_PACKED(SIZE-1 downto 0) := RESIZE(R, SIZE);
+  begin
+    for I in SIZE-1 downto 0 loop
+      if XL(I) < XR(I) then
+        return -1;
+      elsif XL(I) > XR(I) then
+        return 1;
+      end if;
+    end loop;
+    return 0;
+  end function COMPARE;
+
+  -- Splits the product of two words into LOW + HIGH*3**19, both
+  -- words. Each word is split at 3**10 into halves whose products
+  -- fit in an INTEGER.
+  procedure MUL_WORDS (L, R : INTEGER; LOW, HIGH : out INTEGER) is
+    constant HALF_SPAN : POSITIVE := 3**10;
+    variable L1, L0, R1, R0 : INTEGER;
+    variable C1, C0         : INTEGER;
+    variable CARRY          : INTEGER;
+  begin
+    SPLIT_AT(L, HALF_SPAN, L1, L0);
+    SPLIT_AT(R, HALF_SPAN, R1, R0);
+    -- L*R = 3*L1*R1 * 3**19 + (L1*R0 + L0*R1) * 3**10 + L0*R0,
+    -- and the middle term is C1 * 3**19 + C0 * 3**10
+    SPLIT_AT(L1*R0 + L0*R1, 3**9, C1, C0);
+    SPLIT(L0*R0 + C0*HALF_SPAN, LOW, CARRY);
+    HIGH := 3*L1*R1 + C1 + CARRY;
+  end procedure MUL_WORDS;
+
+  -- Quotient and remainder of the magnitudes of L and R by long
+  -- division, a trit at a time: the remainder so far is multiplied by
+  -- 3, the next trit of L added, and the divisor subtracted up to
+  -- twice to bring it back into 0 to abs(R)-1.
+  -- QUO has L'length words, XREM R'length. R must not be zero.
+  procedure DIVIDE (L, R : BTERN_PACKED; QUO, XREM : out BTERN_PACKED) is
+    constant DIVIDEND : BTERN_PACKED(L'length-1 downto 0) := abs(L);
+    -- one word more than the divisor, to hold 3 times the remainder
+    constant DIVISOR  : BTERN_PACKED(R'length downto 0) :=
+      RESIZE(abs(R), R'length+1);
+    constant TWICE    : BTERN_PACKED(R'length downto 0) :=
+      ADD_PACKED(DIVISOR, DIVISOR, 0);
+    variable REMAINDER : BTERN_PACKED(R'length downto 0) := (others => 0);
+    variable QUOTIENT  : BTERN_PACKED(L'length-1 downto 0) := (others => 0);
+    variable TRITS     : INTEGER_VECTOR(0 to PACKED_TRITS-1);
+    variable WORD, Q   : INTEGER;
+  begin
+    for I in DIVIDEND'range loop
+      WORD := DIVIDEND(I);
+      for J in TRITS'range loop
+        SPLIT_AT(WORD, 3, WORD, TRITS(J));
+      end loop;
+      for J in TRITS'reverse_range loop
+        REMAINDER := TIMES3_PLUS(REMAINDER, TRITS(J));
+        if SIGN(REMAINDER) < 0 then
+          Q := -1;
+          REMAINDER := ADD_PACKED(REMAINDER, DIVISOR, 0);
+        elsif COMPARE(REMAINDER, DIVISOR) < 0 then
+          Q := 0;
+        elsif COMPARE(REMAINDER, TWICE) < 0 then
+          Q := 1;
+          REMAINDER := ADD_PACKED(REMAINDER, NEG_PACKED(DIVISOR), 0);
+        else
+          Q := 2;
+          REMAINDER := ADD_PACKED(REMAINDER, NEG_PACKED(TWICE), 0);
+        end if;
+        QUOTIENT := TIMES3_PLUS(QUOTIENT, Q);
+      end loop;
+    end loop;
+    QUO  := QUOTIENT;
+    XREM := RESIZE(REMAINDER, R'length);
+  end procedure DIVIDE;
+
+  -- Truncating division with the remainder of "rem", the quotient
+  -- L'length words wide and the remainder R'length words wide.
+  -- Division by zero gives 0 and L, as in BAL_NUMERIC.
+  procedure DIV_REM (L, R : BTERN_PACKED; QUO, XREM : out BTERN_PACKED) is
+    variable XQUO  : BTERN_PACKED(L'length-1 downto 0);
+    variable XXREM : BTERN_PACKED(R'length-1 downto 0);
+  begin
+    if SIGN(R) = 0 then
+      assert FALSE report "TVL.BAL_PACKED.DIV_REM: DIV, MOD, or REM by zero"
+        severity error;
+      QUO  := (XQUO'range => 0);
+      XREM := RESIZE(L, R'length);
+      return;
+    end if;
+    DIVIDE(L, R, XQUO, XXREM);
+    if SIGN(L) /= SIGN(R) then
+      XQUO := NEG_PACKED(XQUO);
+    end if;
+    if SIGN(L) < 0 then
+      XXREM := NEG_PACKED(XXREM);
+    end if;
+    QUO  := XQUO;
+    XREM := XXREM;
+  end procedure DIV_REM;
+
+  -- ARG resized to SIZE words, with a warning if that changes its
+  -- value
+  function TRUNCATE (ARG : BTERN_PACKED; SIZE : NATURAL; NAME : STRING)
+    return BTERN_PACKED is
+    constant RESULT : BTERN_PACKED(SIZE-1 downto 0) := RESIZE(ARG, SIZE);
+  begin
+    if COMPARE(RESULT, ARG) /= 0 then
+      assert NO_WARNING report "TVL.BAL_PACKED." & NAME & " Truncated"
+        severity warning;
+    end if;
+    return RESULT;
+  end function TRUNCATE;
+
+  --=================================================================
+  -- Packed balanced ternary type
+  --=================================================================
+
+  function PACKED_WORDS (TRITS : NATURAL) return NATURAL is
+  begin
+    return (TRITS + PACKED_TRITS - 1) / PACKED_TRITS;
+  end function PACKED_WORDS;
+
+  --=================================================================
+  -- Conversion functions
+  --=================================================================
+
+  function TO_PACKED (ARG : BTERN_ULOGIC_VECTOR) return BTERN_PACKED is
+    alias XARG      : BTERN_ULOGIC_VECTOR(ARG'length-1 downto 0) is ARG;
+    variable RESULT : BTERN_PACKED(PACKED_WORDS(ARG'length)-1 downto 0) :=
+      (others => 0);
+    variable W      : NATURAL;
+  begin
+    if ARG'length < 1 then return NAPC;
+    end if;
+    -- from the leftmost trit, so each word is built from its top trit
+    for I in XARG'range loop
+      W := I / PACKED_TRITS;
+      case XARG(I) is
+        when '-' | 'L' => RESULT(W) := 3*RESULT(W) - 1;
+        when '0' | 'M' => RESULT(W) := 3*RESULT(W);
+        when '+' | 'H' => RESULT(W) := 3*RESULT(W) + 1;
+        when others =>
+          assert NO_WARNING
+            report "TVL.BAL_PACKED.TO_PACKED: "
+            & "metavalue detected, returning 0"
+            severity warning;
+          return (RESULT'range => 0);
+      end case;
+    end loop;
+    return RESULT;
+  end function TO_PACKED;
+
+  -------------------------------------------------------------------
+
+  function TO_PACKED (ARG : INTEGER; SIZE : NATURAL) return BTERN_PACKED is
+    variable RESULT : BTERN_PACKED(SIZE-1 downto 0) := (others => 0);
+    variable CARRY  : INTEGER;
+  begin
+    if (SIZE < 1) then return NAPC;
+    end if;
+    -- an INTEGER has at most 20 trits, CARRY is from -2 to 2
+    SPLIT(ARG, RESULT(0), CARRY);
+    if SIZE > 1 then
+      RESULT(1) := CARRY;
+    elsif CARRY /= 0 then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED.TO_PACKED: vector truncated"
+        severity warning;
+    end if;
+    return RESULT;
+  end function TO_PACKED;
+
+  -------------------------------------------------------------------
+
+  function TO_BALTERN (ARG : BTERN_PACKED; SIZE : NATURAL)
+    return BTERN_ULOGIC_VECTOR
+  is
+    alias XARG         : BTERN_PACKED(ARG'length-1 downto 0) is ARG;
+    variable RESULT    : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0) := (others => '0');
+    variable WORD, T   : INTEGER;
+    variable K         : NATURAL;
+    variable TRUNCATED : BOOLEAN := FALSE;
+  begin
+    if (SIZE < 1) then return NAC;
+    end if;
+    for I in 0 to XARG'left loop
+      WORD := XARG(I);
+      for J in 0 to PACKED_TRITS-1 loop
+        SPLIT_AT(WORD, 3, WORD, T);
+        K := I*PACKED_TRITS + J;
+        if K < SIZE then
+          case T is
+            when -1     => RESULT(K) := '-';
+            when 1      => RESULT(K) := '+';
+            when others => RESULT(K) := '0';
+          end case;
+        elsif T /= 0 then
+          TRUNCATED := TRUE;
+        end if;
+      end loop;
+      -- nonzero for a word outside the range of 19 trits
+      if WORD /= 0 then
+        TRUNCATED := TRUE;
+      end if;
+    end loop;
+    if TRUNCATED then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED.TO_BALTERN: vector truncated"
+        severity warning;
+    end if;
+    return RESULT;
+  end function TO_BALTERN;
+
+  -------------------------------------------------------------------
+
+  function TO_INTEGER (ARG : BTERN_PACKED) return INTEGER is
+    constant XARG   : BTERN_PACKED(1 downto 0) := RESIZE(ARG, 2);
+    -- how far 2*3**19 is beyond INTEGER'high, to be made up by the
+    -- low word
+    constant MARGIN : NATURAL := WORD_SPAN - (INTEGER'high - WORD_SPAN);
+    variable RESULT : INTEGER := XARG(0);
+  begin
+    if (ARG'length < 1) then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED.TO_INTEGER: "
+        & "null argument detected, returning 0"
+        severity warning;
+      return 0;
+    end if;
+    if COMPARE(ARG, XARG) /= 0 or abs(XARG(1)) > 2
+      or (XARG(1) = 2 and XARG(0) > -MARGIN)
+      or (XARG(1) = -2 and XARG(0) < MARGIN)
+    then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED.TO_INTEGER: "
+        & "value out of INTEGER range, returning 0"
+        severity warning;
+      return 0;
+    end if;
+    for I in 1 to abs(XARG(1)) loop
+      if XARG(1) > 0 then
+        RESULT := RESULT + WORD_SPAN;
+      else
+        RESULT := RESULT - WORD_SPAN;
+      end if;
+    end loop;
+    return RESULT;
+  end function TO_INTEGER;
+
+  -------------------------------------------------------------------
+
+  function RESIZE (ARG : BTERN_PACKED; NEW_SIZE : NATURAL) return BTERN_PACKED is
+    alias XARG      : BTERN_PACKED(ARG'length-1 downto 0) is ARG;
+    variable RESULT : BTERN_PACKED(NEW_SIZE-1 downto 0) := (others => 0);
+  begin
+    if (NEW_SIZE < 1) then return NAPC;
+    end if;
+    for I in 0 to MINIMUM(NEW_SIZE, ARG'length)-1 loop
+      RESULT(I) := XARG(I);
+    end loop;
+    return RESULT;
+  end function RESIZE;
+
+  --=================================================================
+  -- Arithmetic operators
+  --=================================================================
+
+  function "abs" (L : BTERN_PACKED) return BTERN_PACKED is
+  begin
+    if L'length < 1 then return NAPC;
+    end if;
+    if SIGN(L) < 0 then
+      return NEG_PACKED(L);
+    end if;
+    return RESIZE(L, L'length);
+  end function "abs";
+
+  -------------------------------------------------------------------
+
+  function "-" (L : BTERN_PACKED) return BTERN_PACKED is
+  begin
+    if L'length < 1 then return NAPC;
+    end if;
+    return NEG_PACKED(L);
+  end function "-";
+
+  --=================================================================
+  -- "+" and "-"
+  --=================================================================
+
+  function "+" (L, R : BTERN_PACKED) return BTERN_PACKED is
+    constant SIZE : NATURAL := MAXIMUM(L'length, R'length);
+  begin
+    if ((L'length < 1) or (R'length < 1)) then return NAPC;
+    end if;
+    return ADD_PACKED(RESIZE(L, SIZE), RESIZE(R, SIZE), 0);
+  end function "+";
+
+  -------------------------------------------------------------------
+
+  function "+" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED is
+  begin
+    if L'length < 1 then return NAPC;
+    end if;
+    return L + TO_PACKED(R, L'length);
+  end function "+";
+
+  -------------------------------------------------------------------
+
+  function "+" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED is
+  begin
+    if R'length < 1 then return NAPC;
+    end if;
+    return TO_PACKED(L, R'length) + R;
+  end function "+";
+
+  -------------------------------------------------------------------
+
+  function "-" (L, R : BTERN_PACKED) return BTERN_PACKED is
+    constant SIZE : NATURAL := MAXIMUM(L'length, R'length);
+  begin
+    if ((L'length < 1) or (R'length < 1)) then return NAPC;
+    end if;
+    return ADD_PACKED(RESIZE(L, SIZE), NEG_PACKED(RESIZE(R, SIZE)), 0);
+  end function "-";
+
+  -------------------------------------------------------------------
+
+  function "-" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED is
+  begin
+    if L'length < 1 then return NAPC;
+    end if;
+    return L - TO_PACKED(R, L'length);
+  end function "-";
+
+  -------------------------------------------------------------------
+
+  function "-" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED is
+  begin
+    if R'length < 1 then return NAPC;
+    end if;
+    return TO_PACKED(L, R'length) - R;
+  end function "-";
+
+  --=================================================================
+  -- "*"
+  --=================================================================
+
+  -- Schoolbook multiplication a word at a time. The high word of a
+  -- word product is below 3**18, so the carry into the next word
+  -- stays a word and the product is exact.
+  function "*" (L, R : BTERN_PACKED) return BTERN_PACKED is
+    constant L_LEFT : INTEGER := L'length-1;
+    constant R_LEFT : INTEGER := R'length-1;
+    alias XL        : BTERN_PACKED(L_LEFT downto 0) is L;
+    alias XR        : BTERN_PACKED(R_LEFT downto 0) is R;
+    variable RESULT : BTERN_PACKED(L'length+R'length-1 downto 0) :=
+      (others => 0);
+    variable LOW, HIGH, CARRY, C : INTEGER;
+  begin
+    if ((L'length < 1) or (R'length < 1)) then return NAPC;
+    end if;
+    for I in 0 to L_LEFT loop
+      CARRY := 0;
+      if XL(I) /= 0 then
+        for J in 0 to R_LEFT loop
+          MUL_WORDS(XL(I), XR(J), LOW, HIGH);
+          SPLIT(RESULT(I+J) + LOW + CARRY, RESULT(I+J), C);
+          CARRY := HIGH + C;
+        end loop;
+      end if;
+      RESULT(I+R'length) := CARRY;
+    end loop;
+    return RESULT;
+  end function "*";
+
+  -------------------------------------------------------------------
+
+  function "*" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED is
+  begin
+    if L'length < 1 then return NAPC;
+    end if;
+    return L * TO_PACKED(R, L'length);
+  end function "*";
+
+  -------------------------------------------------------------------
+
+  function "*" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED is
+  begin
+    if R'length < 1 then return NAPC;
+    end if;
+    return TO_PACKED(L, R'length) * R;
+  end function "*";
+
+  --=================================================================
+  -- "/", "rem" and "mod"
+  --=================================================================
+  -- An INTEGER operand is converted to two words, which hold any
+  -- INTEGER, so only the result may be truncated.
+
+  function "/" (L, R : BTERN_PACKED) return BTERN_PACKED is
+    variable QUO  : BTERN_PACKED(L'length-1 downto 0);
+    variable XREM : BTERN_PACKED(R'length-1 downto 0);
+  begin
+    if ((L'length < 1) or (R'length < 1)) then return NAPC;
+    end if;
+    DIV_REM(L, R, QUO, XREM);
+    return QUO;
+  end function "/";
+
+  -------------------------------------------------------------------
+
+  function "/" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED is
+  begin
+    if L'length < 1 then return NAPC;
+    end if;
+    return L / TO_PACKED(R, 2);
+  end function "/";
+
+  -------------------------------------------------------------------
+
+  function "/" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED is
+  begin
+    if R'length < 1 then return NAPC;
+    end if;
+    return TRUNCATE(TO_PACKED(L, 2) / R, R'length, """/"": Quotient");
+  end function "/";
+
+  -------------------------------------------------------------------
+
+  function "rem" (L, R : BTERN_PACKED) return BTERN_PACKED is
+    variable QUO  : BTERN_PACKED(L'length-1 downto 0);
+    variable XREM : BTERN_PACKED(R'length-1 downto 0);
+  begin
+    if ((L'length < 1) or (R'length < 1)) then return NAPC;
+    end if;
+    DIV_REM(L, R, QUO, XREM);
+    return XREM;
+  end function "rem";
+
+  -------------------------------------------------------------------
+
+  function "rem" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED is
+  begin
+    if L'length < 1 then return NAPC;
+    end if;
+    return TRUNCATE(L rem TO_PACKED(R, 2), L'length, """rem"": Remainder");
+  end function "rem";
+
+  -------------------------------------------------------------------
+
+  function "rem" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED is
+  begin
+    if R'length < 1 then return NAPC;
+    end if;
+    return TO_PACKED(L, 2) rem R;
+  end function "rem";
+
+  -------------------------------------------------------------------
+
+  function "mod" (L, R : BTERN_PACKED) return BTERN_PACKED is
+    variable QUO  : BTERN_PACKED(L'length-1 downto 0);
+    variable XREM : BTERN_PACKED(R'length-1 downto 0);
+  begin
+    if ((L'length < 1) or (R'length < 1)) then return NAPC;
+    end if;
+    DIV_REM(L, R, QUO, XREM);
+    if SIGN(XREM) /= 0 and SIGN(XREM) /= SIGN(R) and SIGN(R) /= 0 then
+      XREM := ADD_PACKED(XREM, RESIZE(R, R'length), 0);
+    end if;
+    return XREM;
+  end function "mod";
+
+  -------------------------------------------------------------------
+
+  function "mod" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED is
+  begin
+    if L'length < 1 then return NAPC;
+    end if;
+    return TRUNCATE(L mod TO_PACKED(R, 2), L'length, """mod"": Modulus");
+  end function "mod";
+
+  -------------------------------------------------------------------
+
+  function "mod" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED is
+  begin
+    if R'length < 1 then return NAPC;
+    end if;
+    return TO_PACKED(L, 2) mod R;
+  end function "mod";
+
+  --=================================================================
+  -- Relational operators
+  --=================================================================
+
+  function "=" (L, R : BTERN_PACKED) return BOOLEAN is
+  begin
+    if ((L'length < 1) or (R'length < 1)) then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED.""="": null argument detected, returning FALSE"
+        severity warning;
+      return false;
+    end if;
+    return COMPARE(L, R) = 0;
+  end function "=";
+
+  function "=" (L : BTERN_PACKED; R : INTEGER) return BOOLEAN is
+  begin
+    return L = TO_PACKED(R, 2);
+  end function "=";
+
+  function "=" (L : INTEGER; R : BTERN_PACKED) return BOOLEAN is
+  begin
+    return TO_PACKED(L, 2) = R;
+  end function "=";
+
+  -------------------------------------------------------------------
+
+  function "/=" (L, R : BTERN_PACKED) return BOOLEAN is
+  begin
+    if ((L'length < 1) or (R'length < 1)) then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED.""/="": null argument detected, returning TRUE"
+        severity warning;
+      return true;
+    end if;
+    return COMPARE(L, R) /= 0;
+  end function "/=";
+
+  function "/=" (L : BTERN_PACKED; R : INTEGER) return BOOLEAN is
+  begin
+    return L /= TO_PACKED(R, 2);
+  end function "/=";
+
+  function "/=" (L : INTEGER; R : BTERN_PACKED) return BOOLEAN is
+  begin
+    return TO_PACKED(L, 2) /= R;
+  end function "/=";
+
+  -------------------------------------------------------------------
+
+  function "<" (L, R : BTERN_PACKED) return BOOLEAN is
+  begin
+    if ((L'length < 1) or (R'length < 1)) then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED.""<"": null argument detected, returning FALSE"
+        severity warning;
+      return false;
+    end if;
+    return COMPARE(L, R) < 0;
+  end function "<";
+
+  function "<" (L : BTERN_PACKED; R : INTEGER) return BOOLEAN is
+  begin
+    return L < TO_PACKED(R, 2);
+  end function "<";
+
+  function "<" (L : INTEGER; R : BTERN_PACKED) return BOOLEAN is
+  begin
+    return TO_PACKED(L, 2) < R;
+  end function "<";
+
+  -------------------------------------------------------------------
+
+  function "<=" (L, R : BTERN_PACKED) return BOOLEAN is
+  begin
+    if ((L'length < 1) or (R'length < 1)) then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED.""<="": null argument detected, returning FALSE"
+        severity warning;
+      return false;
+    end if;
+    return COMPARE(L, R) <= 0;
+  end function "<=";
+
+  function "<=" (L : BTERN_PACKED; R : INTEGER) return BOOLEAN is
+  begin
+    return L <= TO_PACKED(R, 2);
+  end function "<=";
+
+  function "<=" (L : INTEGER; R : BTERN_PACKED) return BOOLEAN is
+  begin
+    return TO_PACKED(L, 2) <= R;
+  end function "<=";
+
+  -------------------------------------------------------------------
+
+  function ">" (L, R : BTERN_PACKED) return BOOLEAN is
+  begin
+    if ((L'length < 1) or (R'length < 1)) then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED."">"": null argument detected, returning FALSE"
+        severity warning;
+      return false;
+    end if;
+    return COMPARE(L, R) > 0;
+  end function ">";
+
+  function ">" (L : BTERN_PACKED; R : INTEGER) return BOOLEAN is
+  begin
+    return L > TO_PACKED(R, 2);
+  end function ">";
+
+  function ">" (L : INTEGER; R : BTERN_PACKED) return BOOLEAN is
+  begin
+    return TO_PACKED(L, 2) > R;
+  end function ">";
+
+  -------------------------------------------------------------------
+
+  function ">=" (L, R : BTERN_PACKED) return BOOLEAN is
+  begin
+    if ((L'length < 1) or (R'length < 1)) then
+      assert NO_WARNING
+        report "TVL.BAL_PACKED."">="": null argument detected, returning FALSE"
+        severity warning;
+      return false;
+    end if;
+    return COMPARE(L, R) >= 0;
+  end function ">=";
+
+  function ">=" (L : BTERN_PACKED; R : INTEGER) return BOOLEAN is
+  begin
+    return L >= TO_PACKED(R, 2);
+  end function ">=";
+
+  function ">=" (L : INTEGER; R : BTERN_PACKED) return BOOLEAN is
+  begin
+    return TO_PACKED(L, 2) >= R;
+  end function ">=";
+
+  --=================================================================
+  -- MINIMUM and MAXIMUM functions
+  --=================================================================
+
+  function MINIMUM (L, R : BTERN_PACKED) return BTERN_PACKED is
+    constant SIZE : NATURAL := MAXIMUM(L'length, R'length);
+  begin
+    if ((L'length < 1) or (R'length < 1)) then return NAPC;
+    end if;
+    if COMPARE(L, R) < 0 then
+      return RESIZE(L, SIZE);
+    end if;
+    return RESIZE(R, SIZE);
+  end function MINIMUM;
+
+  -------------------------------------------------------------------
+
+  function MAXIMUM (L, R : BTERN_PACKED) return BTERN_PACKED is
+    constant SIZE : NATURAL := MAXIMUM(L'length, R'length);
+  begin
+    if ((L'length < 1) or (R'length < 1)) then return NAPC;
+    end if;
+    if COMPARE(L, R) > 0 then
+      return RESIZE(L, SIZE);
+    end if;
+    return RESIZE(R, SIZE);
+  end function MAXIMUM;
+
+end package body bal_packed;
@@ -0,0 +1,154 @@
+-- -----------------------------------------------------------------
+--
+--   Title     :  Standard ternary logic package
+--             :  (BAL_PACKED package declaration)
+--             :
+--   Library   :  This package shall be compiled into a library
+--             :  symbolically named TVL.
+--             :
+--   Developers:  Anders Mørk Minde, University of South Eastern Norway
+--             :
+--   Purpose   :  This package defines a packed balanced ternary number
+--             :  type, BTERN_PACKED, with the arithmetic and relational
+--             :  operators of BAL_NUMERIC, for behavioral models and
+--             :  testbenches. It holds 19 trits per INTEGER word, so its
+--             :  operators work a word rather than a trit at a time.
+--             :  Values are converted to and from BTERN_ULOGIC_VECTOR
+--             :  at the boundaries of the RTL.
+--             :
+--             :  If any argument to a function is a null array, a null array
+--             :  is returned (exceptions, if any, are noted individually).
+--             :
+--   Note      :  BTERN_PACKED cannot hold metavalues.
+--             :
+-- --------------------------------------------------------------------
+-- $Revision: 1 $
+-- $Date: 2026-10-18 (Sun, 18 Oct 2026) $
+-- --------------------------------------------------------------------
+
+library TVL;
+use TVL.bal_logic.all;
+
+package bal_packed is
+
+  -------------------------------------------------------------------
+  -- Packed balanced ternary type
+  -------------------------------------------------------------------
+  -- Each word holds PACKED_TRITS trits as an INTEGER from
+  -- -(3**19-1)/2 to (3**19-1)/2. The word at index 0 is the least
+  -- significant, so a value of N words is the number a
+  -- BTERN_ULOGIC_VECTOR of 19*N trits holds. The operators expect
+  -- every word to be within this range, as the conversions and
+  -- operators of this package leave them.
+  -- Sizes are counted in words, e.g. BTERN_PACKED(PACKED_WORDS(27)-1
+  -- downto 0) for 27 trits.
+
+  constant PACKED_TRITS : POSITIVE := 19;
+
+  type BTERN_PACKED is array (NATURAL range <>) of INTEGER;
+
+  -- Returns the number of words needed for TRITS trits.
+  function PACKED_WORDS (TRITS : NATURAL) return NATURAL;
+
+  -------------------------------------------------------------------
+  -- Conversion functions
+  -------------------------------------------------------------------
+  -- TO_PACKED of a vector returns PACKED_WORDS(ARG'length) words, or
+  -- 0 with a warning if ARG contains a metavalue. L, M and H count
+  -- as -, 0 and +. TO_BALTERN and TO_PACKED of an INTEGER warn if
+  -- the value is truncated, TO_INTEGER if it does not fit in an
+  -- INTEGER, returning 0.
+
+  function TO_PACKED (ARG : BTERN_ULOGIC_VECTOR) return BTERN_PACKED;
+  function TO_PACKED (ARG : INTEGER; SIZE : NATURAL) return BTERN_PACKED;
+  function TO_BALTERN (ARG : BTERN_PACKED; SIZE : NATURAL) return BTERN_ULOGIC_VECTOR;
+  function TO_INTEGER (ARG : BTERN_PACKED) return INTEGER;
+
+  -- Keeps the NEW_SIZE least significant words, or extends with zero
+  -- words.
+  function RESIZE (ARG : BTERN_PACKED; NEW_SIZE : NATURAL) return BTERN_PACKED;
+
+  -------------------------------------------------------------------
+  -- Arithmetic operators
+  -------------------------------------------------------------------
+  -- As in BAL_NUMERIC, "+" and "-" return as many words as the larger
+  -- operand, "*" as many as both operands together, "/" as many as
+  -- the dividend and "rem" and "mod" as many as the divisor. With an
+  -- INTEGER operand, the result has the length of the packed operand,
+  -- twice that for "*".
+  -- "+" and "-" wrap around at 19 trits per word instead of the
+  -- width of a vector; converted back with TO_BALTERN and RESIZE to
+  -- that width, their results are the trits BAL_NUMERIC gives.
+  -- "/" truncates, "rem" has the sign of the dividend and "mod" that
+  -- of the divisor. Division by zero is reported with severity ERROR
+  -- and returns 0 as quotient and the dividend as remainder.
+
+  function "abs" (L : BTERN_PACKED) return BTERN_PACKED;
+  function "-" (L : BTERN_PACKED) return BTERN_PACKED;
+
+  function "+" (L, R : BTERN_PACKED) return BTERN_PACKED;
+  function "+" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED;
+  function "+" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED;
+
+  function "-" (L, R : BTERN_PACKED) return BTERN_PACKED;
+  function "-" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED;
+  function "-" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED;
+
+  function "*" (L, R : BTERN_PACKED) return BTERN_PACKED;
+  function "*" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED;
+  function "*" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED;
+
+  function "/" (L, R : BTERN_PACKED) return BTERN_PACKED;
+  function "/" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED;
+  function "/" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED;
+
+  function "rem" (L, R : BTERN_PACKED) return BTERN_PACKED;
+  function "rem" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED;
+  function "rem" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED;
+
+  function "mod" (L, R : BTERN_PACKED) return BTERN_PACKED;
+  function "mod" (L : BTERN_PACKED; R : INTEGER) return BTERN_PACKED;
+  function "mod" (L : INTEGER; R : BTERN_PACKED) return BTERN_PACKED;
+
+  -------------------------------------------------------------------
+  -- Relational operators
+  -------------------------------------------------------------------
+  -- Compare the numbers, of any lengths. They replace the predefined
+  -- operators of the array type, which compare words from the left.
+  -- A null argument gives a warning, and TRUE for "/=", FALSE for
+  -- the others.
+
+  function "="  (L, R : BTERN_PACKED) return BOOLEAN;
+  function "="  (L : BTERN_PACKED; R : INTEGER) return BOOLEAN;
+  function "="  (L : INTEGER; R : BTERN_PACKED) return BOOLEAN;
+
+  function "/=" (L, R : BTERN_PACKED) return BOOLEAN;
+  function "/=" (L : BTERN_PACKED; R : INTEGER) return BOOLEAN;
+  function "/=" (L : INTEGER; R : BTERN_PACKED) return BOOLEAN;
+
+  function "<"  (L, R : BTERN_PACKED) return BOOLEAN;
+  function "<"  (L : BTERN_PACKED; R : INTEGER) return BOOLEAN;
+  function "<"  (L : INTEGER; R : BTERN_PACKED) return BOOLEAN;
+
+  function "<=" (L, R : BTERN_PACKED) return BOOLEAN;
+  function "<=" (L : BTERN_PACKED; R : INTEGER) return BOOLEAN;
+  function "<=" (L : INTEGER; R : BTERN_PACKED) return BOOLEAN;
+
+  function ">"  (L, R : BTERN_PACKED) return BOOLEAN;
+  function ">"  (L : BTERN_PACKED; R : INTEGER) return BOOLEAN;
+  function ">"  (L : INTEGER; R : BTERN_PACKED) return BOOLEAN;
+
+  function ">=" (L, R : BTERN_PACKED) return BOOLEAN;
+  function ">=" (L : BTERN_PACKED; R : INTEGER) return BOOLEAN;
+  function ">=" (L : INTEGER; R : BTERN_PACKED) return BOOLEAN;
+
+  -------------------------------------------------------------------
+  -- MINIMUM and MAXIMUM functions
+  -------------------------------------------------------------------
+  -- Return the smaller or larger number, with as many words as the
+  -- larger operand.
+
+  function MINIMUM (L, R : BTERN_PACKED) return BTERN_PACKED;
+  function MAXIMUM (L, R : BTERN_PACKED) return BTERN_PACKED;
+
+end package bal_packed;
@@ -0,0 +1,111 @@
+"""
+Shared, prebuilt copy of the TVL library for GHDL.
+
+The TVL sources are analyzed once into a cache directory named after a
+hash of their contents, the GHDL version and the VHDL standard. Every
+run script, and any project linking against TVL, then adds that
+directory as an external library instead of analyzing the package
+bodies again in its own VUnit output tree. A change to any source file
+gives a new key and so a fresh build.
+
+The cache lives in $TVL_CACHE_DIR, or ~/.cache/tvl_lib by default.
+Run this file to build the library and print its directory.
+"""
+
+from pathlib import Path
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+
+LIB = Path(__file__).resolve().parent / "lib"
+
+# Analysis order, packages before the packages that use them
+SOURCES = (
+    "kleene_pkg.vhdl",
+    "kleene_pkg-body.vhdl",
+    "bal_logic.vhdl",
+    "bal_logic-body.vhdl",
+    "bal_numeric.vhdl",
+    "bal_numeric-body.vhdl",
+    "bal_packed.vhdl",
+    "bal_packed-body.vhdl",
+)
+
+# VUnit names the standards like this, GHDL wants the last two digits
+STANDARD = os.environ.get('VUNIT_VHDL_STANDARD', '2008')
+
+
+def cache_root():
+    return Path(os.environ.get('TVL_CACHE_DIR', Path.home() / ".cache" / "tvl_lib"))
+
+
+def find_ghdl():
+    """
+    Returns the GHDL executable VUnit would use, or None.
+    """
+    if 'VUNIT_GHDL_PATH' in os.environ:
+        return shutil.which("ghdl", path=os.environ['VUNIT_GHDL_PATH'])
+    return shutil.which("ghdl")
+
+
+def cache_key(ghdl):
+    """
+    Hash of the source files, the GHDL version and the VHDL standard.
+    """
+    version = subprocess.run([ghdl, "--version"], capture_output=True, text=True, check=True)
+    digest = hashlib.sha256()
+    digest.update(version.stdout.splitlines()[0].encode())
+    digest.update(STANDARD.encode())
+    for name in SOURCES:
+        digest.update(name.encode())
+        digest.update((LIB / name).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def build(ghdl=None):
+    """
+    Returns the directory holding the analyzed TVL library, analyzing
+    it first when no build with the same key exists. Builds happen in
+    a temporary directory that is renamed into place, so concurrent
+    runs never see a half-built library.
+    """
+    ghdl = ghdl or find_ghdl()
+    if ghdl is None:
+        raise FileNotFoundError("GHDL not found, set VUNIT_GHDL_PATH or add it to PATH")
+    target = cache_root() / cache_key(ghdl)
+    if target.exists():
+        return target
+    target.parent.mkdir(parents=True, exist_ok=True)
+    workdir = Path(tempfile.mkdtemp(prefix=".build-", dir=target.parent))
+    try:
+        subprocess.run([ghdl, "-a", f"--std={STANDARD[-2:]}", "--work=tvl", f"--workdir={workdir}"]
+                       + [str(LIB / name) for name in SOURCES], check=True)
+        try:
+            workdir.rename(target)
+        except OSError:
+            # another run finished the same build first
+            if not target.exists():
+                raise
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return target
+
+
+def add_tvl_library(vu):
+    """
+    Adds TVL to the VUnit project: the prebuilt library when the
+    simulator is GHDL, the source files otherwise. Set
+    TVL_NO_PREBUILT=1 to always analyze the sources in the project.
+    """
+    ghdl = find_ghdl()
+    if ghdl and os.environ.get('VUNIT_SIMULATOR', 'ghdl') == 'ghdl' and not os.environ.get('TVL_NO_PREBUILT'):
+        return vu.add_external_library("TVL", str(build(ghdl)))
+    tvl_lib = vu.add_library("TVL")
+    tvl_lib.add_source_files([str(LIB / name) for name in SOURCES])
+    return tvl_lib
+
+
+if __name__ == "__main__":
+    print(build())
@@ -1,6 +1,7 @@
-from vunit import VUnit
+from vunit import VUnit, VUnitCLI
 from pathlib import Path
 import os
+import sys
 
 # set VUnit environment variables
 os.environ['VUNIT_VHDL_STANDARD'] = '2008'
@@ -8,8 +9,27 @@ os.environ['VUNIT_SIMULATOR'] = 'ghdl'
 
 root = Path(__file__).parent
 
-# Create VUnit instance by parsing command line arguments
-vu = VUnit.from_argv()
+# Create VUnit instance by parsing command line arguments,
+# including the options of the timing history (see timing_history.py)
+sys.path.insert(0, str(root))
+import timing_history
+cli = VUnitCLI()
+timing_history.add_arguments(cli.parser)
+cli.parser.add_argument(
+    "--benchmark-iterations",
+    type=int,
+    default=1,
+    help="Number of operations per benchmark test (see benchmark.py)",
+)
+cli.parser.add_argument(
+    "--benchmark-widths",
+    type=int,
+    nargs="+",
+    default=[27],
+    help="Operand widths in trits to benchmark, 3 to 81",
+)
+args = cli.parse_args()
+vu = VUnit.from_args(args=args)
 
 # Add VUnit's builtin HDL utilities for checking, logging, communication...
 # See http://vunit.github.io/hdl_libraries.html.
@@ -18,12 +38,61 @@ vu.add_vhdl_builtins()
 # Add random support (integrates OSVVM)
 vu.add_random()
 
-tvl_lib = vu.add_library("TVL")
-tvl_lib.add_source_files(str(root / "lib/*.vhdl"))
-tvl_lib.add_source_files(str(root / "testbench/**/*.vhdl"))
+# TVL itself comes prebuilt from the shared cache (see prebuilt.py),
+# so the testbenches get a library of their own.
+from prebuilt import add_tvl_library
+add_tvl_library(vu)
+
+tb_lib = vu.add_library("TVL_TB")
+tb_lib.add_source_files(str(root / "testbench/**/*.vhdl"))
+
+# The golden vector testbench reads operand/result tables written by
+# python/golden_vectors.py into the output path of each configuration.
+def write_golden_vectors(width):
+    def pre_config(output_path):
+        sys.path.insert(0, str(root.parent / "python"))
+        import golden_vectors
+        golden_vectors.writeAll(output_path, widths=[width])
+        return True
+    return pre_config
+
+golden_tb = tb_lib.test_bench("numeric_golden_vectors_tb")
+for width in (20, 27, 40):
+    golden_tb.add_config(name=f"width={width}",
+                         generics=dict(WIDTH=width),
+                         pre_config=write_golden_vectors(width))
+
+# Integer fast path against the trit-level path, over every operand
+# pair of these widths
+fast_path_tb = tb_lib.test_bench("numeric_fast_path_tb")
+for l_width, r_width in ((5, 5), (7, 3), (3, 7), (1, 9)):
+    fast_path_tb.add_config(name=f"width={l_width}x{r_width}",
+                            generics=dict(L_WIDTH=l_width, R_WIDTH=r_width))
+
+# Packed operators against the vector operators, at one word, a few
+# words with a partial top word, and beyond an INTEGER
+packed_tb = tb_lib.test_bench("packed_arithmetic_tb")
+for width in (19, 27, 40, 81):
+    packed_tb.add_config(name=f"width={width}", generics=dict(WIDTH=width))
+
+# Operator benchmarks, one configuration per width. With the default
+# of one iteration they only check that the benchmarks still run.
+benchmark_tb = tb_lib.test_bench("numeric_benchmark_tb")
+for width in args.benchmark_widths:
+    benchmark_tb.add_config(name=f"width={width}",
+                            generics=dict(WIDTH=width, ITERATIONS=args.benchmark_iterations))
+
+# Division algorithms head to head, on random and worst-case operands
+# (see division_benchmark.py)
+division_tb = tb_lib.test_bench("numeric_division_benchmark_tb")
+for width in args.benchmark_widths:
+    for operands in ("random", "worst"):
+        division_tb.add_config(name=f"width={width},operands={operands}",
+                               generics=dict(WIDTH=width, ITERATIONS=args.benchmark_iterations,
+                                             OPERANDS=operands))
 
 # Option --assert-level=none prevents any assertion violation from stopping simulation. -GHDL docs
 vu.set_sim_option("ghdl.sim_flags", ["--assert-level=none"])
 vu.set_sim_option("vhdl_assert_stop_level", "failure")
 
-vu.main()
\ No newline at end of file
+vu.main(post_run=timing_history.post_run("tvl_lib", args.timing_threshold))
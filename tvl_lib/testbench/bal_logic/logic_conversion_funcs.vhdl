@@ -75,6 +75,32 @@ begin
         -- Should fail elsewhere because of assertion in TVL. 
         -- Does not fail here because of --assert-level=none in run.py
         check(TO_INTEGER("-++-D+Z") = 0);
+        -- out of INTEGER range: overflows in the 8th of 8 chunks
+        check(TO_INTEGER("++++++++++++++++++++++") = 0);
+        check(TO_INTEGER("----------------------") = 0);
+        -- a metavalue past an overflow: the 7th of 10 chunks overflows,
+        -- the 8th and 9th are skipped and the 10th holds the X
+        check(TO_INTEGER("+++++++++++++++++++++++++++0+X") = 0);
+
+        -- weak values, and leading zeros beyond the range of INTEGER
+        check(TO_INTEGER("HML-0+") = TO_INTEGER("+0--0+"));
+        check(TO_INTEGER("0000000000000000000000000000+-0--0-000--+++-+-+0+") = 2147483647);
+
+    elsif run("TO_BALTERN and TO_INTEGER round trip") then
+
+        -- across the 6-trit chunks of TO_BALTERN and the 3-trit
+        -- steps of TO_INTEGER
+        for SIZE in 5 to 8 loop
+          for I in -(3**SIZE - 1)/2 to (3**SIZE - 1)/2 loop
+            check(TO_INTEGER(TO_BALTERN(I, SIZE)) = I);
+          end loop;
+        end loop;
+        for I in -(3**12 - 1)/2 / 101 to (3**12 - 1)/2 / 101 loop
+          check(TO_INTEGER(TO_BALTERN(101*I + 1, 12)) = 101*I + 1);
+          check(TO_INTEGER(TO_BALTERN(303*I, 13)) = 303*I);
+        end loop;
+        check(TO_INTEGER(TO_BALTERN(2147483647, 40)) = 2147483647);
+        check(TO_INTEGER(TO_BALTERN(-2147483647, 40)) = -2147483647);
 
 
     elsif run("To_Btern(U)LogicVector") then
@@ -0,0 +1,106 @@
+-- --------------------------------------------------------------------
+-- Title   : Golden vector file reader
+-- Notes   : Generated by python/golden_vectors.py, edit it there.
+--           Reads the *.tvlg files written by golden_vectors.py,
+--           where every vector is packed 5 trits per byte. The
+--           file must be opened as a BYTE_FILE and the header read
+--           with READ_HEADER before the first READ_VECTOR.
+-- --------------------------------------------------------------------
+
+library TVL;
+use TVL.bal_logic.all;
+
+package golden_vectors is
+
+  type BYTE_FILE is file of CHARACTER;
+  type WIDTH_ARRAY is array (NATURAL range <>) of NATURAL;
+
+  -- Checks the magic number and returns the operator name and the
+  -- width of every column. WIDTHS must have one element per column.
+  procedure READ_HEADER (file F : BYTE_FILE;
+                         OP     : out STRING(1 to 8);
+                         WIDTHS : out WIDTH_ARRAY);
+
+  -- Reads the next column of the current record into V, which
+  -- must be as wide as the column.
+  procedure READ_VECTOR (file F : BYTE_FILE; V : out BTERN_ULOGIC_VECTOR);
+
+  -- The trits of V as a string, for check messages.
+  function IMAGE (V : BTERN_ULOGIC_VECTOR) return STRING;
+
+end package;
+
+package body golden_vectors is
+
+  constant BYTE_OFFSET : NATURAL := 121;
+  constant TRITS_PER_BYTE : NATURAL := 5;
+
+  type TRIT_TABLE is array (-1 to 1) of BTERN_ULOGIC;
+  constant TO_TRIT : TRIT_TABLE := ('-', '0', '+');
+
+  function READ_BYTE (file F : BYTE_FILE) return NATURAL is
+    variable C : CHARACTER;
+  begin
+    read(F, C);
+    return CHARACTER'pos(C);
+  end function;
+
+  procedure READ_HEADER (file F : BYTE_FILE;
+                         OP     : out STRING(1 to 8);
+                         WIDTHS : out WIDTH_ARRAY) is
+    constant MAGIC : STRING(1 to 4) := "TVLG";
+    variable C : CHARACTER;
+    variable COLUMNS, HEADER_LENGTH : NATURAL;
+  begin
+    for I in MAGIC'range loop
+      read(F, C);
+      assert C = MAGIC(I)
+        report "GOLDEN_VECTORS.READ_HEADER: not a golden vector file"
+        severity FAILURE;
+    end loop;
+    for I in OP'range loop
+      read(F, OP(I));
+    end loop;
+    COLUMNS := READ_BYTE(F);
+    assert COLUMNS = WIDTHS'length
+      report "GOLDEN_VECTORS.READ_HEADER: file has " & INTEGER'image(COLUMNS)
+             & " columns, expected " & INTEGER'image(WIDTHS'length)
+      severity FAILURE;
+    for I in WIDTHS'range loop
+      WIDTHS(I) := READ_BYTE(F);
+    end loop;
+    HEADER_LENGTH := 13 + COLUMNS;
+    while HEADER_LENGTH mod 8 /= 0 loop
+      read(F, C);
+      HEADER_LENGTH := HEADER_LENGTH + 1;
+    end loop;
+  end procedure;
+
+  procedure READ_VECTOR (file F : BYTE_FILE; V : out BTERN_ULOGIC_VECTOR) is
+    constant NBYTES : NATURAL := (V'length + TRITS_PER_BYTE - 1) / TRITS_PER_BYTE;
+    variable TRITS : BTERN_ULOGIC_VECTOR(NBYTES*TRITS_PER_BYTE-1 downto 0);
+    variable VALUE, TRIT : INTEGER;
+  begin
+    for I in NBYTES-1 downto 0 loop
+      VALUE := READ_BYTE(F) - BYTE_OFFSET;
+      for J in 0 to TRITS_PER_BYTE-1 loop
+        TRIT := (VALUE + 1) mod 3 - 1;
+        TRITS(I*TRITS_PER_BYTE + J) := TO_TRIT(TRIT);
+        VALUE := (VALUE - TRIT) / 3;
+      end loop;
+    end loop;
+    V := TRITS(V'length-1 downto 0);
+  end procedure;
+
+  function IMAGE (V : BTERN_ULOGIC_VECTOR) return STRING is
+    variable RESULT : STRING(1 to V'length);
+    variable I : POSITIVE := 1;
+  begin
+    for J in V'range loop
+      RESULT(I) := BTERN_ULOGIC'image(V(J))(2);
+      I := I + 1;
+    end loop;
+    return RESULT;
+  end function;
+
+end package body;
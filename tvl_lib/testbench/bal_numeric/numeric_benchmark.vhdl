@@ -0,0 +1,239 @@
+-- --------------------------------------------------------------------
+-- Title   : BAL_NUMERIC Operator Throughput Benchmark
+-- Notes   : Applies one operator ITERATIONS times to WIDTH-trit
+--           operands drawn from a pool of random vectors made before
+--           the timed loop. The simulator's wall-clock time per test
+--           is the measurement: tvl_lib/benchmark.py subtracts the
+--           "baseline" test, which runs the same loop without an
+--           operator, and reports operations per second.
+--           Divisors are made odd, so never zero. TO_BALTERN and
+--           TO_INTEGER use values within both INTEGER and WIDTH, the
+--           latter on vectors of at most 19 trits. The "_per_trit"
+--           tests run the trit-at-a-time conversions bal_logic had
+--           before its chunk tables, for comparison.
+--           The "packed_" tests run the operators of BAL_PACKED on
+--           the same operands, converted before the timed loop.
+-- --------------------------------------------------------------------
+
+library vunit_lib;
+context vunit_lib.vunit_context;
+
+library osvvm;
+use osvvm.RandomPkg.all;
+
+library TVL;
+use TVL.bal_logic.all;
+use TVL.bal_numeric.all;
+use TVL.bal_packed.all;
+
+entity numeric_benchmark_tb is
+  generic (runner_cfg : string;
+           WIDTH      : POSITIVE := 27;
+           ITERATIONS : POSITIVE := 1);
+end entity;
+
+architecture test of numeric_benchmark_tb is
+
+  constant POOL_SIZE : POSITIVE := 64;
+
+  subtype VEC is BTERN_ULOGIC_VECTOR(WIDTH-1 downto 0);
+  type VEC_POOL is array (0 to POOL_SIZE-1) of VEC;
+
+  subtype INT_VEC is BTERN_ULOGIC_VECTOR(MINIMUM(WIDTH, 19)-1 downto 0);
+  type INT_VEC_POOL is array (0 to POOL_SIZE-1) of INT_VEC;
+
+  subtype PACKED is BTERN_PACKED(PACKED_WORDS(WIDTH)-1 downto 0);
+  type PACKED_POOL is array (0 to POOL_SIZE-1) of PACKED;
+
+  -- largest value of min(WIDTH, 19) trits, 19 trits being the
+  -- most that always fit in an INTEGER
+  function max_int return INTEGER is
+    variable RESULT : INTEGER := 0;
+  begin
+    for I in 1 to MINIMUM(WIDTH, 19) loop
+      RESULT := 3*RESULT + 1;
+    end loop;
+    return RESULT;
+  end function;
+
+  -- TO_BALTERN, a trit at a time
+  function per_trit_to_baltern (ARG : INTEGER; SIZE : NATURAL)
+    return BTERN_ULOGIC_VECTOR is
+    variable RESULT    : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
+    variable I_VAL     : INTEGER := ARG;
+    variable REMAINDER : INTEGER;
+  begin
+    for I in 0 to RESULT'length - 1 loop
+      REMAINDER := I_VAL mod 3;
+      if REMAINDER = 0 then
+        RESULT(I) := '0';
+      elsif REMAINDER = 1 then
+        RESULT(I) := '+';
+        I_VAL := I_VAL - 1;
+      elsif REMAINDER = 2 then
+        RESULT(I) := '-';
+        I_VAL := I_VAL + 1;
+      end if;
+      I_VAL := I_VAL / 3;
+    end loop;
+    assert I_VAL = 0 report "vector truncated" severity warning;
+    return RESULT;
+  end function;
+
+  -- TO_INTEGER, with a pass of TO_M2P and then a trit at a time
+  function per_trit_to_integer (ARG : BTERN_ULOGIC_VECTOR) return INTEGER is
+    variable RESULT : INTEGER := 0;
+    variable BASE   : INTEGER;
+    variable WEIGHT : INTEGER := 1;
+    alias XARG      : BTERN_ULOGIC_VECTOR(ARG'length - 1 downto 0) is ARG;
+    variable ARGM2P : BTERN_ULOGIC_VECTOR(ARG'length - 1 downto 0);
+  begin
+    ARGM2P := TO_M2P(XARG, 'X');
+    if ARGM2P(ARGM2P'left) = 'X' then
+      report "metavalue detected" severity warning;
+      return 0;
+    end if;
+    for I in ARGM2P'reverse_range loop
+      if    ARGM2P(I) = '-' then BASE := -1;
+      elsif ARGM2P(I) = '0' then BASE :=  0;
+      elsif ARGM2P(I) = '+' then BASE :=  1;
+      end if;
+      RESULT := RESULT + (BASE * WEIGHT);
+      WEIGHT := WEIGHT * 3;
+    end loop;
+    return RESULT;
+  end function;
+
+begin
+
+  main : process
+    variable RV : RandomPType;  -- OSVVM random variable
+
+    variable L_POOL, R_POOL : VEC_POOL;
+    variable I_POOL : INT_VEC_POOL;
+    variable INT_POOL : INTEGER_VECTOR(0 to POOL_SIZE-1);
+    variable L_PACKED, R_PACKED : PACKED_POOL;
+
+    variable RESULT         : VEC;
+    variable PRODUCT        : BTERN_ULOGIC_VECTOR(2*WIDTH-1 downto 0);
+    variable INT_RESULT     : INTEGER;
+    variable PACKED_RESULT  : PACKED;
+    variable PACKED_PRODUCT : BTERN_PACKED(2*PACKED'length-1 downto 0);
+
+    impure function random_vector return VEC is
+      variable RESULT : VEC;
+      type btern_values is array (0 to 2) of BTERN_ULOGIC;
+      constant valid_values : btern_values := ('-', '0', '+');
+    begin
+      for I in RESULT'range loop
+        RESULT(I) := valid_values(RV.RandInt(0, 2));
+      end loop;
+      return RESULT;
+    end function;
+
+  begin
+    test_runner_setup(runner, runner_cfg);
+
+    -- Initialize random seed
+    RV.InitSeed(RV'instance_name);
+
+    for I in 0 to POOL_SIZE-1 loop
+      L_POOL(I) := random_vector;
+      R_POOL(I) := random_vector;
+      R_POOL(I)(0) := '+';
+      INT_POOL(I) := RV.RandInt(-max_int, max_int);
+      I_POOL(I) := TO_BALTERN(INT_POOL(I), INT_VEC'length);
+      L_PACKED(I) := TO_PACKED(L_POOL(I));
+      R_PACKED(I) := TO_PACKED(R_POOL(I));
+    end loop;
+
+    if run("baseline") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := L_POOL(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("add") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := L_POOL(I mod POOL_SIZE) + R_POOL(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("sub") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := L_POOL(I mod POOL_SIZE) - R_POOL(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("mul") then
+      for I in 0 to ITERATIONS-1 loop
+        PRODUCT := L_POOL(I mod POOL_SIZE) * R_POOL(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("div") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := L_POOL(I mod POOL_SIZE) / R_POOL(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("rem") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := L_POOL(I mod POOL_SIZE) rem R_POOL(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("mod") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := L_POOL(I mod POOL_SIZE) mod R_POOL(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("btediv") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := BTEDIV(L_POOL(I mod POOL_SIZE), R_POOL(I mod POOL_SIZE));
+      end loop;
+
+    elsif run("btemod") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := BTEMOD(L_POOL(I mod POOL_SIZE), R_POOL(I mod POOL_SIZE));
+      end loop;
+
+    elsif run("to_baltern") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := TO_BALTERN(INT_POOL(I mod POOL_SIZE), WIDTH);
+      end loop;
+
+    elsif run("to_integer") then
+      for I in 0 to ITERATIONS-1 loop
+        INT_RESULT := TO_INTEGER(I_POOL(I mod POOL_SIZE));
+      end loop;
+
+    elsif run("to_baltern_per_trit") then
+      for I in 0 to ITERATIONS-1 loop
+        RESULT := per_trit_to_baltern(INT_POOL(I mod POOL_SIZE), WIDTH);
+      end loop;
+
+    elsif run("to_integer_per_trit") then
+      for I in 0 to ITERATIONS-1 loop
+        INT_RESULT := per_trit_to_integer(I_POOL(I mod POOL_SIZE));
+      end loop;
+
+    elsif run("packed_add") then
+      for I in 0 to ITERATIONS-1 loop
+        PACKED_RESULT := L_PACKED(I mod POOL_SIZE) + R_PACKED(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("packed_sub") then
+      for I in 0 to ITERATIONS-1 loop
+        PACKED_RESULT := L_PACKED(I mod POOL_SIZE) - R_PACKED(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("packed_mul") then
+      for I in 0 to ITERATIONS-1 loop
+        PACKED_PRODUCT := L_PACKED(I mod POOL_SIZE) * R_PACKED(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("packed_div") then
+      for I in 0 to ITERATIONS-1 loop
+        PACKED_RESULT := L_PACKED(I mod POOL_SIZE) / R_PACKED(I mod POOL_SIZE);
+      end loop;
+
+    end if;
+
+    test_runner_cleanup(runner);
+  end process;
+end architecture;
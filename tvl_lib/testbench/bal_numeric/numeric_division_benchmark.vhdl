@@ -0,0 +1,151 @@
+-- --------------------------------------------------------------------
+-- Title   : BAL_NUMERIC Division Algorithm Benchmark
+-- Notes   : Calls each of the division procedures ITERATIONS times on
+--           the same pool of WIDTH-trit operands, so that their
+--           simulation times can be compared head to head (see
+--           tvl_lib/division_benchmark.py). The "baseline" test runs
+--           the loop without a division.
+--           OPERANDS selects the pool: "random" vectors with odd, so
+--           nonzero, divisors, or the "worst" cases: dividends of all
+--           '+', all '-' or alternating trits over divisors of +-1,
+--           whose quotients have no zero trit, and the largest
+--           dividend over the largest divisor.
+--           The algorithms loop once per trit of the dividend. As a
+--           measure of the work done in the loops, each test logs the
+--           nonzero quotient trits of its last POOL_SIZE calls, for
+--           division_benchmark.py to pick up.
+-- --------------------------------------------------------------------
+
+library vunit_lib;
+context vunit_lib.vunit_context;
+
+library osvvm;
+use osvvm.RandomPkg.all;
+
+library TVL;
+use TVL.bal_logic.all;
+use TVL.bal_numeric.all;
+
+entity numeric_division_benchmark_tb is
+  generic (runner_cfg : string;
+           WIDTH      : POSITIVE := 27;
+           ITERATIONS : POSITIVE := 1;
+           OPERANDS   : STRING   := "random");
+end entity;
+
+architecture test of numeric_division_benchmark_tb is
+
+  constant POOL_SIZE : POSITIVE := 64;
+
+  subtype VEC is BTERN_ULOGIC_VECTOR(WIDTH-1 downto 0);
+  type VEC_POOL is array (0 to POOL_SIZE-1) of VEC;
+
+  function alternating return VEC is
+    variable RESULT : VEC;
+  begin
+    for I in RESULT'range loop
+      if I mod 2 = 0 then
+        RESULT(I) := '+';
+      else
+        RESULT(I) := '-';
+      end if;
+    end loop;
+    return RESULT;
+  end function;
+
+begin
+
+  main : process
+    variable RV : RandomPType;  -- OSVVM random variable
+
+    variable L_POOL, R_POOL, Q_POOL : VEC_POOL;
+    variable QUO, REMAINDER         : VEC;
+    variable NONZERO                : NATURAL := 0;
+
+    impure function random_vector return VEC is
+      variable RESULT : VEC;
+      type btern_values is array (0 to 2) of BTERN_ULOGIC;
+      constant valid_values : btern_values := ('-', '0', '+');
+    begin
+      for I in RESULT'range loop
+        RESULT(I) := valid_values(RV.RandInt(0, 2));
+      end loop;
+      return RESULT;
+    end function;
+
+  begin
+    test_runner_setup(runner, runner_cfg);
+
+    -- Initialize random seed
+    RV.InitSeed(RV'instance_name);
+
+    for I in 0 to POOL_SIZE-1 loop
+      if OPERANDS = "worst" then
+        case I mod 4 is
+          when 0      => L_POOL(I) := (others => '+');
+                         R_POOL(I) := TO_BALTERN(1, WIDTH);
+          when 1      => L_POOL(I) := (others => '-');
+                         R_POOL(I) := TO_BALTERN(1, WIDTH);
+          when 2      => L_POOL(I) := alternating;
+                         R_POOL(I) := TO_BALTERN(-1, WIDTH);
+          when others => L_POOL(I) := (others => '+');
+                         R_POOL(I) := (others => '+');
+        end case;
+      else
+        L_POOL(I) := random_vector;
+        R_POOL(I) := random_vector;
+        R_POOL(I)(0) := '+';
+      end if;
+    end loop;
+
+    if run("baseline") then
+      for I in 0 to ITERATIONS-1 loop
+        Q_POOL(I mod POOL_SIZE) := L_POOL(I mod POOL_SIZE);
+      end loop;
+
+    elsif run("divmod") then
+      for I in 0 to ITERATIONS-1 loop
+        DIVMOD(L_POOL(I mod POOL_SIZE), R_POOL(I mod POOL_SIZE), QUO, REMAINDER);
+        Q_POOL(I mod POOL_SIZE) := QUO;
+      end loop;
+
+    elsif run("jones1") then
+      for I in 0 to ITERATIONS-1 loop
+        JONES1(L_POOL(I mod POOL_SIZE), R_POOL(I mod POOL_SIZE), QUO, REMAINDER);
+        Q_POOL(I mod POOL_SIZE) := QUO;
+      end loop;
+
+    elsif run("jones2") then
+      for I in 0 to ITERATIONS-1 loop
+        JONES2(L_POOL(I mod POOL_SIZE), R_POOL(I mod POOL_SIZE), QUO, REMAINDER);
+        Q_POOL(I mod POOL_SIZE) := QUO;
+      end loop;
+
+    elsif run("bte_divmod") then
+      for I in 0 to ITERATIONS-1 loop
+        BTE_DIVMOD(L_POOL(I mod POOL_SIZE), R_POOL(I mod POOL_SIZE), QUO, REMAINDER);
+        Q_POOL(I mod POOL_SIZE) := QUO;
+      end loop;
+
+    elsif run("div_testing") then
+      for I in 0 to ITERATIONS-1 loop
+        DIV_TESTING(L_POOL(I mod POOL_SIZE), R_POOL(I mod POOL_SIZE), QUO, REMAINDER);
+        Q_POOL(I mod POOL_SIZE) := QUO;
+      end loop;
+
+    end if;
+
+    -- Count after the timed loop, over the quotients it stored
+    for I in 0 to MINIMUM(ITERATIONS, POOL_SIZE)-1 loop
+      for J in VEC'range loop
+        if Q_POOL(I)(J) /= '0' then
+          NONZERO := NONZERO + 1;
+        end if;
+      end loop;
+    end loop;
+    info("nonzero_quotient_trits=" & to_string(NONZERO) &
+         " calls=" & to_string(MINIMUM(ITERATIONS, POOL_SIZE)));
+
+    test_runner_cleanup(runner);
+  end process;
+end architecture;
@@ -0,0 +1,177 @@
+-- --------------------------------------------------------------------
+-- Title   : BAL_NUMERIC Integer Fast Path Equivalence
+-- Notes   : "+", "-", "*", "/", "rem" and "mod" compute with INTEGERs
+--           when their operands have no metavalues and fit in 19
+--           trits. Each test checks the results of the fast path
+--           against those of the trit-level path, reached by
+--           widening the operands to REF_WIDTH trits first.
+--           The "Exhaustive" tests go through every pair of
+--           L_WIDTH-trit and R_WIDTH-trit operands, the "Random"
+--           tests through 19-trit operands, with weak values, at the
+--           limit of the fast path.
+-- --------------------------------------------------------------------
+
+library vunit_lib;
+context vunit_lib.vunit_context;
+
+library osvvm;
+use osvvm.RandomPkg.all;
+
+library TVL;
+use TVL.bal_logic.all;
+use TVL.bal_numeric.all;
+
+entity numeric_fast_path_tb is
+  generic (runner_cfg : string;
+           L_WIDTH    : POSITIVE := 5;
+           R_WIDTH    : POSITIVE := 5);
+end entity;
+
+architecture test of numeric_fast_path_tb is
+
+  -- one trit wider than the fast path, so that the operators
+  -- take the trit-level path
+  constant REF_WIDTH        : POSITIVE := 20;
+  constant NUM_RANDOM_TESTS : INTEGER  := 1000;
+
+  constant L_MAX : NATURAL := (3**L_WIDTH - 1) / 2;
+  constant R_MAX : NATURAL := (3**R_WIDTH - 1) / 2;
+
+  -- Trit-level result of L op R, REF_WIDTH trits wide
+  -- ("*" twice that).
+  function reference (OP : STRING; L, R : BTERN_ULOGIC_VECTOR)
+    return BTERN_ULOGIC_VECTOR is
+    constant XL : BTERN_ULOGIC_VECTOR(REF_WIDTH-1 downto 0) := RESIZE(L, REF_WIDTH);
+    constant XR : BTERN_ULOGIC_VECTOR(REF_WIDTH-1 downto 0) := RESIZE(R, REF_WIDTH);
+  begin
+    if    OP = "+"   then return XL + XR;
+    elsif OP = "-"   then return XL - XR;
+    elsif OP = "*"   then return XL * XR;
+    elsif OP = "/"   then return XL / XR;
+    elsif OP = "rem" then return XL rem XR;
+    else                  return XL mod XR;
+    end if;
+  end function;
+
+  -- Fast path result of L op R
+  function fast (OP : STRING; L, R : BTERN_ULOGIC_VECTOR)
+    return BTERN_ULOGIC_VECTOR is
+  begin
+    if    OP = "+"   then return L + R;
+    elsif OP = "-"   then return L - R;
+    elsif OP = "*"   then return L * R;
+    elsif OP = "/"   then return L / R;
+    elsif OP = "rem" then return L rem R;
+    else                  return L mod R;
+    end if;
+  end function;
+
+  function all_x (ARG : BTERN_ULOGIC_VECTOR) return BOOLEAN is
+  begin
+    for I in ARG'range loop
+      if ARG(I) /= 'X' then
+        return FALSE;
+      end if;
+    end loop;
+    return TRUE;
+  end function;
+
+  -- The sum and difference wrap around at the width of the wider
+  -- operand, and so does the reference when resized to it.
+  procedure check_op (OP : STRING; L, R : BTERN_ULOGIC_VECTOR) is
+    constant RES : BTERN_ULOGIC_VECTOR := fast(OP, L, R);
+    constant REF : BTERN_ULOGIC_VECTOR := reference(OP, L, R);
+  begin
+    check_equal(TO_INTEGER(RES), TO_INTEGER(RESIZE(REF, RES'length)),
+                "L=" & to_string(TO_INTEGER(L)) & " " & OP &
+                " R=" & to_string(TO_INTEGER(R)));
+  end procedure;
+
+begin
+
+  main : process
+    variable RV : RandomPType;  -- OSVVM random variable
+
+    -- Random vector of SIZE trits, strong or weak
+    impure function random_vector (SIZE : POSITIVE) return BTERN_ULOGIC_VECTOR is
+      variable RESULT : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
+      type btern_values is array (0 to 5) of BTERN_ULOGIC;
+      constant valid_values : btern_values := ('-', '0', '+', 'L', 'M', 'H');
+    begin
+      for I in RESULT'range loop
+        RESULT(I) := valid_values(RV.RandInt(0, 5));
+      end loop;
+      return RESULT;
+    end function;
+
+    procedure exhaustive (OP : STRING) is
+    begin
+      for X in -L_MAX to L_MAX loop
+        for Y in -R_MAX to R_MAX loop
+          if Y /= 0 or OP = "+" or OP = "-" or OP = "*" then
+            check_op(OP, TO_BALTERN(X, L_WIDTH), TO_BALTERN(Y, R_WIDTH));
+          end if;
+        end loop;
+      end loop;
+    end procedure;
+
+    procedure random_pairs (OP : STRING; L_SIZE, R_SIZE : POSITIVE) is
+      variable R : BTERN_ULOGIC_VECTOR(R_SIZE-1 downto 0);
+    begin
+      for I in 1 to NUM_RANDOM_TESTS loop
+        R := random_vector(R_SIZE);
+        if TO_INTEGER(R) /= 0 or OP = "+" or OP = "-" or OP = "*" then
+          check_op(OP, random_vector(L_SIZE), R);
+        end if;
+      end loop;
+    end procedure;
+
+  begin
+    test_runner_setup(runner, runner_cfg);
+
+    -- Initialize random seed
+    RV.InitSeed(RV'instance_name);
+
+    if run("Exhaustive +") then
+      exhaustive("+");
+    elsif run("Exhaustive -") then
+      exhaustive("-");
+    elsif run("Exhaustive *") then
+      exhaustive("*");
+    elsif run("Exhaustive /") then
+      exhaustive("/");
+    elsif run("Exhaustive rem") then
+      exhaustive("rem");
+    elsif run("Exhaustive mod") then
+      exhaustive("mod");
+
+    elsif run("Random 19-trit + and -") then
+      random_pairs("+", 19, 19);
+      random_pairs("-", 19, 19);
+      random_pairs("+", 19, 7);
+      random_pairs("-", 7, 19);
+    elsif run("Random 19-trit product") then
+      random_pairs("*", 10, 9);
+      random_pairs("*", 1, 18);
+    elsif run("Random 19-trit division") then
+      random_pairs("/", 19, 19);
+      random_pairs("/", 19, 4);
+      random_pairs("rem", 19, 4);
+      random_pairs("rem", 4, 19);
+      random_pairs("mod", 19, 4);
+      random_pairs("mod", 4, 19);
+      -- the sign of a dividend with a leading weak trit
+      check_op("mod", "L++", "+0");   -- -5 mod 3
+      check_op("mod", "ML+", "H0");   -- -2 mod 3
+      check_op("mod", "L++", "L0");   -- -5 mod -3
+
+    elsif run("Metavalues bypass the fast path") then
+      check(all_x(fast("+", "+-X0", "00+-")), "+ with X");
+      check(all_x(fast("-", "00+-", "+-0W")), "- with W");
+      check(all_x(fast("*", "U+", "+-")), "* with U");
+      check(all_x(fast("/", "+-", "0Z")), "/ with Z");
+    end if;
+
+    test_runner_cleanup(runner);
+  end process;
+end architecture;
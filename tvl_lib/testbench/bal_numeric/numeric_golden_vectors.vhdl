@@ -0,0 +1,102 @@
+-- --------------------------------------------------------------------
+-- Title   : BAL_NUMERIC Golden Vector Tests
+-- Notes   : Checks the arithmetic operators against operand/result
+--           tables written by python/golden_vectors.py, so widths
+--           beyond the reach of the INTEGER type can be tested.
+--           run.py writes the files into the output path of each
+--           configuration before the simulation starts, one per
+--           operator for the width given by the WIDTH generic.
+-- --------------------------------------------------------------------
+
+library vunit_lib;
+context vunit_lib.vunit_context;
+
+library TVL;
+use TVL.bal_logic.all;
+use TVL.bal_numeric.all;
+use work.golden_vectors.all;
+
+entity numeric_golden_vectors_tb is
+  generic (runner_cfg : string;
+           WIDTH      : POSITIVE := 20);
+end entity;
+
+architecture test of numeric_golden_vectors_tb is
+begin
+
+  main : process
+
+    -- Reads every record of the file for operator OP, applies the
+    -- operator to the operands and compares the result with the
+    -- expected column, which is RES_WIDTH trits wide.
+    procedure test_golden(constant OP : STRING; constant RES_WIDTH : POSITIVE) is
+      file F : BYTE_FILE;
+      variable NAME : STRING(1 to 8);
+      variable WIDTHS : WIDTH_ARRAY(0 to 2);
+      variable L, R : BTERN_ULOGIC_VECTOR(WIDTH-1 downto 0);
+      variable EXPECTED, RESULT : BTERN_ULOGIC_VECTOR(RES_WIDTH-1 downto 0);
+      variable COUNT : NATURAL := 0;
+    begin
+      file_open(F, output_path(runner_cfg) & OP & "_" & INTEGER'image(WIDTH) & ".tvlg", READ_MODE);
+      READ_HEADER(F, NAME, WIDTHS);
+      check_equal(WIDTHS(0), WIDTH, "left operand width");
+      check_equal(WIDTHS(2), RES_WIDTH, "result width");
+
+      while not endfile(F) loop
+        READ_VECTOR(F, L);
+        READ_VECTOR(F, R);
+        READ_VECTOR(F, EXPECTED);
+
+        if    OP = "add"    then RESULT := L + R;
+        elsif OP = "sub"    then RESULT := L - R;
+        elsif OP = "mul"    then RESULT := L * R;
+        elsif OP = "div"    then RESULT := L / R;
+        elsif OP = "rem"    then RESULT := L rem R;
+        elsif OP = "mod"    then RESULT := L mod R;
+        elsif OP = "btediv" then RESULT := BTEDIV(L, R);
+        elsif OP = "btemod" then RESULT := BTEMOD(L, R);
+        end if;
+
+        check(STD_MATCH(RESULT, EXPECTED),
+              OP & "(" & IMAGE(L) & ", " & IMAGE(R) & ") = " & IMAGE(RESULT)
+              & ", expected " & IMAGE(EXPECTED));
+        COUNT := COUNT + 1;
+      end loop;
+
+      file_close(F);
+      check(COUNT > 0, "no vectors in the file for " & OP);
+    end procedure;
+
+  begin
+    test_runner_setup(runner, runner_cfg);
+
+    if run("add") then
+      test_golden("add", WIDTH);
+
+    elsif run("sub") then
+      test_golden("sub", WIDTH);
+
+    elsif run("mul") then
+      -- the product is the combined length of the operands
+      test_golden("mul", 2*WIDTH);
+
+    elsif run("div") then
+      test_golden("div", WIDTH);
+
+    elsif run("rem") then
+      test_golden("rem", WIDTH);
+
+    elsif run("mod") then
+      test_golden("mod", WIDTH);
+
+    elsif run("btediv") then
+      test_golden("btediv", WIDTH);
+
+    elsif run("btemod") then
+      test_golden("btemod", WIDTH);
+
+    end if;
+
+    test_runner_cleanup(runner);
+  end process;
+end architecture;
@@ -8,6 +8,9 @@
 --           Properties such as commutativity, associativity and 
 --           distributivity are implicitly tested by proving that the
 --           results are the same as for the integer type.
+--           MUL_CARRY_SAVE, which "*" leaves operands too long for
+--           its INTEGER chunks to, is checked against "*" on random
+--           vectors wider than an INTEGER.
 -- --------------------------------------------------------------------
 
 library vunit_lib;
@@ -119,6 +122,15 @@ begin
       
     end procedure;
 
+    -- MUL_CARRY_SAVE against "*", which multiplies
+    -- the same operands in INTEGER chunks
+    procedure test_carry_save(
+      constant L, R : BTERN_LOGIC_VECTOR) is
+    begin
+      check_equal(TO_STRING(MUL_CARRY_SAVE(L, R)), TO_STRING(L * R),
+                  "MUL_CARRY_SAVE(" & TO_STRING(L) & ", " & TO_STRING(R) & ")");
+    end procedure;
+
     -- generates a random balanced ternary vector
     -- of a certain size. Impure so that it can 
     -- access the OSVVM random variable.
@@ -250,6 +262,24 @@ begin
                     " (expected " & INTEGER'image(exp_rand_i) & ")");
       end loop;
 
+    elsif run("Carry-save against chunked") then
+
+      -- ===============================================
+      -- Products of 20 to 80 trits, beyond the INTEGER
+      -- fast path, of equal and different widths.
+      -- ===============================================
+
+      for i in 1 to NUM_RANDOM_TESTS loop
+        test_carry_save(random_btern_vector(10), random_btern_vector(10));
+        test_carry_save(random_btern_vector(40), random_btern_vector(40));
+        test_carry_save(random_btern_vector(40), random_btern_vector(7));
+        test_carry_save(random_btern_vector(1), random_btern_vector(25));
+      end loop;
+
+      -- weak values and metalogical values
+      test_carry_save(BTERN_LOGIC_VECTOR'("HLL"), BTERN_LOGIC_VECTOR'("+L"));
+      test_carry_save(BTERN_LOGIC_VECTOR'("-0+D"), BTERN_LOGIC_VECTOR'("-0+-0+"));
+
     elsif run("Empty vectors all overloads") then
       
       -- Empty vectors VectorVector
@@ -0,0 +1,225 @@
+-- --------------------------------------------------------------------
+-- Title   : BAL_PACKED Operators against BAL_NUMERIC
+-- Notes   : Uses an OSVVM random variable to create randomized
+--           WIDTH-trit balanced ternary vectors, strong and weak, and
+--           checks every operator of BAL_PACKED on the packed
+--           operands against the BAL_NUMERIC operator on the vectors.
+--           Results are converted back with TO_BALTERN and compared
+--           trit by trit, so widths beyond an INTEGER are covered.
+--           "+" and "-" wrap around at 19 trits per word; resized to
+--           WIDTH, their results must be those of BAL_NUMERIC.
+--           "mod" relies on BAL_NUMERIC taking the sign of a weak
+--           dividend after TO_M2P, as its INTEGER fast path does.
+-- --------------------------------------------------------------------
+
+library vunit_lib;
+context vunit_lib.vunit_context;
+
+library osvvm;
+use osvvm.RandomPkg.all;
+
+library TVL;
+use TVL.bal_logic.all;
+use TVL.bal_numeric.all;
+use TVL.bal_packed.all;
+
+entity packed_arithmetic_tb is
+  generic (runner_cfg : string;
+           WIDTH      : POSITIVE := 40);
+end entity;
+
+architecture test of packed_arithmetic_tb is
+
+  -- test configuration
+  constant NUM_RANDOM_TESTS : INTEGER := 500;
+
+  constant WORDS : POSITIVE := PACKED_WORDS(WIDTH);
+
+  -- a shorter divisor, for quotients of more words than the divisor
+  constant SHORT_WIDTH : POSITIVE := MAXIMUM(WIDTH/3, 1);
+
+  -- largest value of min(WIDTH, 19) trits, for the INTEGER operands
+  function max_int return INTEGER is
+    variable RESULT : INTEGER := 0;
+  begin
+    for I in 1 to MINIMUM(WIDTH, 19) loop
+      RESULT := 3*RESULT + 1;
+    end loop;
+    return RESULT;
+  end function;
+
+  function is_zero (ARG : BTERN_ULOGIC_VECTOR) return BOOLEAN is
+  begin
+    for I in ARG'range loop
+      if TO_M2P(ARG(I)) /= '0' then
+        return FALSE;
+      end if;
+    end loop;
+    return TRUE;
+  end function;
+
+  -- Checks that the packed result, as REF'length trits, has the trits of
+  -- the BAL_NUMERIC result
+  procedure check_trits (RES : BTERN_PACKED; REF : BTERN_ULOGIC_VECTOR;
+                         MSG : STRING) is
+  begin
+    check_equal(to_string(TO_BALTERN(RES, REF'length)), to_string(REF), MSG);
+  end procedure;
+
+begin
+
+  main : process
+    variable RV : RandomPType;  -- OSVVM random variable
+
+    -- Random vector of SIZE trits, strong or weak
+    impure function random_vector (SIZE : POSITIVE) return BTERN_ULOGIC_VECTOR is
+      variable RESULT : BTERN_ULOGIC_VECTOR(SIZE-1 downto 0);
+      type btern_values is array (0 to 5) of BTERN_ULOGIC;
+      constant valid_values : btern_values := ('-', '0', '+', 'L', 'M', 'H');
+    begin
+      for I in RESULT'range loop
+        RESULT(I) := valid_values(RV.RandInt(0, 5));
+      end loop;
+      return RESULT;
+    end function;
+
+    -- "+" and "-", kept to all the trits of their words
+    procedure test_add_sub (L, R : BTERN_ULOGIC_VECTOR) is
+      constant PL : BTERN_PACKED := TO_PACKED(L);
+      constant PR : BTERN_PACKED := TO_PACKED(R);
+      constant TRITS : POSITIVE := PACKED_TRITS * MAXIMUM(PL'length, PR'length);
+    begin
+      check_trits(RESIZE(TO_BALTERN(PL + PR, TRITS), L'length), L + R, "+");
+      check_trits(RESIZE(TO_BALTERN(PL - PR, TRITS), L'length), L - R, "-");
+    end procedure;
+
+    procedure test_mul (L, R : BTERN_ULOGIC_VECTOR) is
+    begin
+      check_trits(TO_PACKED(L) * TO_PACKED(R), L * R, "*");
+    end procedure;
+
+    procedure test_division (L, R : BTERN_ULOGIC_VECTOR) is
+      constant PL : BTERN_PACKED := TO_PACKED(L);
+      constant PR : BTERN_PACKED := TO_PACKED(R);
+    begin
+      check_trits(PL / PR, L / R, "/");
+      check_trits(PL rem PR, L rem R, "rem");
+      check_trits(PL mod PR, L mod R, "mod");
+    end procedure;
+
+    procedure test_relational (L, R : BTERN_ULOGIC_VECTOR) is
+      constant PL : BTERN_PACKED := TO_PACKED(L);
+      constant PR : BTERN_PACKED := TO_PACKED(R);
+    begin
+      check_equal(PL = PR, L = R, "=");
+      check_equal(PL /= PR, L /= R, "/=");
+      check_equal(PL < PR, L < R, "<");
+      check_equal(PL <= PR, L <= R, "<=");
+      check_equal(PL > PR, L > R, ">");
+      check_equal(PL >= PR, L >= R, ">=");
+      check_trits(MINIMUM(PL, PR), RESIZE(MINIMUM(L, R), PACKED_TRITS*MAXIMUM(PL'length, PR'length)), "MINIMUM");
+      check_trits(MAXIMUM(PL, PR), RESIZE(MAXIMUM(L, R), PACKED_TRITS*MAXIMUM(PL'length, PR'length)), "MAXIMUM");
+    end procedure;
+
+    -- INTEGER operands, against the vector operator with the INTEGER
+    -- converted to WIDTH trits
+    procedure test_integer (L : BTERN_ULOGIC_VECTOR; R : INTEGER) is
+      constant PL : BTERN_PACKED := TO_PACKED(L);
+      constant XR : BTERN_ULOGIC_VECTOR := TO_BALTERN(R, L'length);
+      constant TRITS : POSITIVE := PACKED_TRITS * PL'length;
+    begin
+      check_trits(RESIZE(TO_BALTERN(PL + R, TRITS), L'length), L + XR, "+ INTEGER");
+      check_trits(RESIZE(TO_BALTERN(R - PL, TRITS), L'length), XR - L, "INTEGER -");
+      check_trits(PL * R, L * XR, "* INTEGER");
+      check_equal(PL < R, L < XR, "< INTEGER");
+      check_equal(R >= PL, XR >= L, "INTEGER >=");
+      if R /= 0 then
+        check_trits(PL / R, L / XR, "/ INTEGER");
+        check_trits(PL rem R, L rem XR, "rem INTEGER");
+      end if;
+      if not is_zero(L) then
+        check_trits(R / PL, XR / L, "INTEGER /");
+        check_trits(R mod PL, XR mod L, "INTEGER mod");
+      end if;
+    end procedure;
+
+    variable L, R : BTERN_ULOGIC_VECTOR(WIDTH-1 downto 0);
+    variable S    : BTERN_ULOGIC_VECTOR(SHORT_WIDTH-1 downto 0);
+    variable INT  : INTEGER;
+    variable P    : BTERN_PACKED(WORDS-1 downto 0);
+
+  begin
+    test_runner_setup(runner, runner_cfg);
+
+    -- Initialize random seed
+    RV.InitSeed(RV'instance_name);
+
+    if run("Conversion round trip") then
+      for I in 1 to NUM_RANDOM_TESTS loop
+        L := random_vector(WIDTH);
+        check_equal(to_string(TO_BALTERN(TO_PACKED(L), WIDTH)),
+                    to_string(TO_M2P(L)), "TO_BALTERN(TO_PACKED)");
+        -- fails on a length other than PACKED_WORDS(WIDTH)
+        P := TO_PACKED(L);
+        INT := RV.RandInt(INTEGER'low + 1, INTEGER'high);
+        check_equal(TO_INTEGER(TO_PACKED(INT, 2)), INT, "TO_INTEGER(TO_PACKED)");
+      end loop;
+      for I in -2 to 2 loop
+        check_equal(TO_INTEGER(TO_PACKED(INTEGER'high - I*I, 2)), INTEGER'high - I*I);
+        check_equal(TO_INTEGER(TO_PACKED(-INTEGER'high + I*I, 2)), -INTEGER'high + I*I);
+      end loop;
+      -- metavalues convert to 0
+      check(TO_PACKED(BTERN_ULOGIC_VECTOR'("+X0")) = 0, "TO_PACKED with X");
+
+    elsif run("Addition and subtraction") then
+      for I in 1 to NUM_RANDOM_TESTS loop
+        test_add_sub(random_vector(WIDTH), random_vector(WIDTH));
+      end loop;
+      -- overflow of WIDTH trits
+      L := (others => '+');
+      test_add_sub(L, L);
+      test_add_sub(L, -L);
+
+    elsif run("Multiplication") then
+      for I in 1 to NUM_RANDOM_TESTS loop
+        test_mul(random_vector(WIDTH), random_vector(WIDTH));
+        test_mul(random_vector(WIDTH), random_vector(SHORT_WIDTH));
+      end loop;
+      L := (others => '+');
+      test_mul(L, L);
+      test_mul(L, -L);
+
+    elsif run("Division") then
+      for I in 1 to NUM_RANDOM_TESTS loop
+        R := random_vector(WIDTH);
+        S := random_vector(SHORT_WIDTH);
+        if not is_zero(R) then
+          test_division(random_vector(WIDTH), R);
+          test_division(S, R);
+        end if;
+        if not is_zero(S) then
+          test_division(random_vector(WIDTH), S);
+        end if;
+      end loop;
+      -- dividends whose leading nonzero trit is weak
+      test_division(RESIZE(BTERN_ULOGIC_VECTOR'("L++"), WIDTH), RESIZE(BTERN_ULOGIC_VECTOR'("+0"), WIDTH));
+      test_division(RESIZE(BTERN_ULOGIC_VECTOR'("ML+"), WIDTH), RESIZE(BTERN_ULOGIC_VECTOR'("H0"), WIDTH));
+      test_division(RESIZE(BTERN_ULOGIC_VECTOR'("L++"), WIDTH), RESIZE(BTERN_ULOGIC_VECTOR'("L0"), WIDTH));
+
+    elsif run("Relational operators") then
+      for I in 1 to NUM_RANDOM_TESTS loop
+        L := random_vector(WIDTH);
+        test_relational(L, random_vector(WIDTH));
+        test_relational(L, L);
+        test_relational(L, random_vector(SHORT_WIDTH));
+      end loop;
+
+    elsif run("Integer operands") then
+      for I in 1 to NUM_RANDOM_TESTS loop
+        test_integer(random_vector(WIDTH), RV.RandInt(-max_int, max_int));
+      end loop;
+    end if;
+
+    test_runner_cleanup(runner);
+  end process;
+end architecture;
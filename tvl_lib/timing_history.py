@@ -0,0 +1,154 @@
+"""
+Per-test timing history for the VUnit runs.
+
+After every run, the wall-clock time of each test is stored in a SQLite
+database together with the git revision, the simulator and the
+project. Tests that passed but took more than (1 + threshold) times
+their median over the previous runs on the same simulator are reported
+as regressions.
+
+VUnit's GHDL interface elaborates and simulates in one --elab-run
+call, so the time recorded per test covers both.
+
+The database is $TVL_TIMING_DB, or ~/.cache/tvl_lib/timing.sqlite by
+default. Run this file to print the history of tests matching a
+pattern.
+"""
+
+from pathlib import Path
+import argparse
+import fnmatch
+import os
+import sqlite3
+import statistics
+import subprocess
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Runs that a test's baseline is the median of
+HISTORY_RUNS = 5
+
+# Differences below this many seconds are never regressions
+MIN_SECONDS = 0.5
+
+SCHEMA = """
+create table if not exists runs (
+    id        integer primary key,
+    project   text not null,
+    revision  text not null,
+    simulator text not null,
+    started   real not null
+);
+create table if not exists tests (
+    run     integer not null references runs(id),
+    name    text not null,
+    status  text not null,
+    seconds real not null
+);
+create index if not exists tests_name on tests(name);
+"""
+
+
+def database_path():
+    return Path(os.environ.get('TVL_TIMING_DB', Path.home() / ".cache" / "tvl_lib" / "timing.sqlite"))
+
+
+def connect(path=None):
+    path = path or database_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.executescript(SCHEMA)
+    return db
+
+
+def git_revision():
+    """
+    HEAD, with '-dirty' appended when the tree has uncommitted changes.
+    """
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    revision = git("rev-parse", "--short", "HEAD") or "unknown"
+    return revision + ("-dirty" if git("status", "--porcelain", "--untracked-files=no") else "")
+
+
+def simulator():
+    name = os.environ.get('VUNIT_SIMULATOR', 'unknown')
+    try:
+        version = subprocess.run([name, "--version"], capture_output=True, text=True).stdout
+    except OSError:
+        return name
+    return version.splitlines()[0] if version else name
+
+
+def baselines(db, names, sim, before_run):
+    """
+    Median time of each test over its last HISTORY_RUNS passing runs
+    on the same simulator, older than before_run.
+    """
+    medians = {}
+    for name in names:
+        rows = db.execute("""
+            select tests.seconds from tests join runs on tests.run = runs.id
+            where tests.name = ? and tests.status = 'passed'
+              and runs.simulator = ? and runs.id < ?
+            order by runs.id desc limit ?""", (name, sim, before_run, HISTORY_RUNS)).fetchall()
+        if rows:
+            medians[name] = statistics.median(r[0] for r in rows)
+    return medians
+
+
+def record(project, times, threshold, db=None):
+    """
+    Stores times, a dict of test name to (status, seconds), and returns
+    the regressions as (name, seconds, baseline) tuples.
+    """
+    db = db or connect()
+    sim = simulator()
+    with db:
+        run = db.execute("insert into runs (project, revision, simulator, started) values (?, ?, ?, ?)",
+                         (project, git_revision(), sim, time.time())).lastrowid
+        db.executemany("insert into tests (run, name, status, seconds) values (?, ?, ?, ?)",
+                       [(run, name, status, seconds) for name, (status, seconds) in times.items()])
+    medians = baselines(db, times, sim, run)
+    return [(name, seconds, medians[name]) for name, (status, seconds) in sorted(times.items())
+            if status == 'passed' and name in medians
+            and seconds > medians[name] * (1 + threshold) and seconds - medians[name] > MIN_SECONDS]
+
+
+def post_run(project, threshold):
+    """
+    Returns a post_run hook for VUnit.main() recording the results of
+    the run and printing the tests whose time regressed.
+    """
+    def hook(results):
+        report = results.get_report()
+        times = {name: (getattr(result.status, 'name', str(result.status)), result.time)
+                 for name, result in report.tests.items()}
+        regressions = record(project, times, threshold)
+        for name, seconds, baseline in regressions:
+            print(f"TIMING REGRESSION {name}: {seconds:.2f} s, median of previous runs {baseline:.2f} s")
+        if times:
+            print(f"Recorded {len(times)} test times in {database_path()}, "
+                  f"{len(regressions)} regressed more than {threshold:.0%}")
+    return hook
+
+
+def add_arguments(parser):
+    parser.add_argument("--timing-threshold", type=float,
+                        default=float(os.environ.get('TVL_TIMING_THRESHOLD', 0.5)),
+                        help="flag tests more than this fraction slower than their history (default 0.5)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Print the timing history of VUnit tests.")
+    parser.add_argument("pattern", nargs="?", default="*", help="test name pattern, e.g. '*numeric*'")
+    args = parser.parse_args()
+    db = connect()
+    rows = db.execute("""
+        select runs.revision, runs.simulator, datetime(runs.started, 'unixepoch', 'localtime'),
+               tests.name, tests.status, tests.seconds
+        from tests join runs on tests.run = runs.id order by tests.name, runs.id""").fetchall()
+    for revision, sim, started, name, status, seconds in rows:
+        if fnmatch.fnmatch(name, args.pattern):
+            print(f"{name:60} {started} {revision:14} {status:8} {seconds:8.2f} s  {sim}")